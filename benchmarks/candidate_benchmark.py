@@ -0,0 +1,69 @@
+"""
+Compare per-token candidate generation latency of the recursive, symspell and
+beam engines of EditDistanceSpellChecker on words one and two edits away from
+a lexicon word.
+
+Usage: python candidate_benchmark.py -e <edit counts file> [-l <lexicon file>]
+    [-b <beam width>]
+"""
+import argparse
+import random
+import time
+from spellcheck.dummy_lang_model import DummyLanguageModel
+from spellcheck.edit_dist_spellchecker import EditDistanceSpellChecker
+from spellcheck.edit_error_model import EditErrorModel
+from spellcheck.lexicon import TrieLexicon, build_default_lexicon
+from spellcheck.parse_util import parse_counts
+from synthetic import misspell
+from pylm.util import mle_pdist
+parser = argparse.ArgumentParser(description='Benchmark candidate engines.')
+parser.add_argument('-e', '--edit-counts', help='Path to edit counts file.',
+        default='../edit_counts.txt')
+parser.add_argument('-l', '--lexicon', help='Path to a compiled lexicon file.')
+parser.add_argument('-n', '--num-words', help='Number of misspellings to time.',
+        type=int, default=200)
+parser.add_argument('-b', '--beam-width', help='Number of candidates the '
+    'beam engine keeps.', type=int, default=10)
+parser.add_argument('-s', '--seed', type=int, default=0)
+
+
+def per_token_latency(spellchecker, words, max_edits):
+    start = time.perf_counter()
+    for word in words:
+        spellchecker.get_candidates(word, max_edits)
+    return (time.perf_counter() - start) / len(words)
+
+
+if __name__ == '__main__':
+    args = parser.parse_args()
+    rand = random.Random(args.seed)
+    error_model = EditErrorModel(mle_pdist(parse_counts(
+        file_name=args.edit_counts, encoding='ISO-8859-1')), 0.05)
+    if args.lexicon:
+        lexicon = TrieLexicon.load(args.lexicon)
+    else:
+        lexicon = build_default_lexicon()
+    recursive = EditDistanceSpellChecker(error_model, DummyLanguageModel(),
+        lexicon)
+    start = time.perf_counter()
+    symspell = EditDistanceSpellChecker(error_model, DummyLanguageModel(),
+        lexicon, engine='symspell')
+    index_secs = time.perf_counter() - start
+    beam = EditDistanceSpellChecker(error_model, DummyLanguageModel(),
+        lexicon, engine='beam', beam_width=args.beam_width)
+    alphabet = recursive.alphabet[:-1]
+    words = [w for w in lexicon.words() if len(w) > 3 and w.isalpha()
+        and w.islower()]
+    sample = rand.sample(words, args.num_words)
+    print('Built symspell index with %d keys in %.1fs' % (
+        len(symspell.candidate_index), index_secs))
+    print('%-10s %18s %18s %18s' % ('Max edits', 'Recursive (ms)',
+        'Symspell (ms)', 'Beam %d (ms)' % args.beam_width))
+    for max_edits in (1, 2):
+        misspellings = sample
+        for _ in range(max_edits):
+            misspellings = [misspell(w, rand, alphabet) for w in misspellings]
+        print('%-10d %18.3f %18.3f %18.3f' % (max_edits,
+            1e3 * per_token_latency(recursive, misspellings, max_edits),
+            1e3 * per_token_latency(symspell, misspellings, max_edits),
+            1e3 * per_token_latency(beam, misspellings, max_edits)))
@@ -0,0 +1,46 @@
+"""
+Compare the per-call cost of EditErrorModel.prob() against the compiled model.
+
+Usage: python error_model_benchmark.py [-e <edit counts file>]
+"""
+import argparse
+import random
+import time
+from spellcheck.edit_error_model import EditErrorModel
+from spellcheck.parse_util import parse_counts
+parser = argparse.ArgumentParser(description='Benchmark edit error models.')
+parser.add_argument('-e', '--edit-counts', help='Path to edit counts file.',
+        default='../edit_counts.txt')
+parser.add_argument('-n', '--num-calls', type=int, default=200000)
+parser.add_argument('-s', '--seed', type=int, default=0)
+
+
+def time_calls(prob, edits):
+    start = time.perf_counter()
+    for edit in edits:
+        prob(edit)
+    return (time.perf_counter() - start) / len(edits)
+
+
+if __name__ == '__main__':
+    args = parser.parse_args()
+    rand = random.Random(args.seed)
+    counts = parse_counts(file_name=args.edit_counts, encoding='ISO-8859-1')
+    total = sum(counts.values())
+    error_model = EditErrorModel(
+        dict((e, c / total) for e, c in counts.items()), 0.05)
+    compiled = error_model.compile()
+    single_edits = list(counts)
+    # Draw from a limited pool of composite edits, as edits() revisits the
+    # same edit strings many times.
+    pool = ['+'.join(rand.sample(single_edits, rand.randint(1, 2)))
+        for _ in range(2000)]
+    edits = [rand.choice(pool) for _ in range(args.num_calls)]
+    edit_ids = [compiled.ids(e) for e in edits]
+    print('%-30s %14s' % ('Model', 'ns per call'))
+    for name, prob, calls in [
+            ('EditErrorModel.prob(str)', error_model.prob, edits),
+            ('Compiled prob(str)', compiled.prob, edits),
+            ('Compiled prob(ids)', compiled.prob, edit_ids),
+            ('Compiled log_prob(ids)', compiled.log_prob, edit_ids)]:
+        print('%-30s %14.1f' % (name, 1e9 * time_calls(prob, calls)))
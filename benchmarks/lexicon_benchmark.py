@@ -0,0 +1,71 @@
+"""
+Compare the memory and startup cost of the TrieLexicon against the prefix set
+EditDistanceSpellChecker used to build.
+
+Usage: python lexicon_benchmark.py [-w <word list file>]
+"""
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+from spellcheck.lexicon import TrieLexicon
+parser = argparse.ArgumentParser(description='Benchmark lexicon structures.')
+parser.add_argument('-w', '--words-file', help='Path to a newline separated '
+    'word list.  Defaults to the nltk words corpus plus contractions.')
+
+
+def load_words(words_file=None):
+    if words_file:
+        with open(words_file) as f:
+            return set(f.read().split())
+    import nltk
+    from spellcheck.constants import contractions
+    return set(nltk.corpus.words.words()).union(contractions)
+
+
+def measure(build):
+    """Return (result, seconds, bytes allocated) for calling build()."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - start
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, size
+
+
+def time_lookups(contains, prefixes):
+    start = time.perf_counter()
+    for prefix in prefixes:
+        contains(prefix)
+    return (time.perf_counter() - start) / len(prefixes)
+
+
+if __name__ == '__main__':
+    args = parser.parse_args()
+    words = load_words(args.words_file)
+    prefix_set, set_secs, set_bytes = measure(
+        lambda: set(w[:i] for w in words for i in range(len(w) + 1)))
+    lexicon, trie_secs, trie_bytes = measure(
+        lambda: TrieLexicon.from_words(words))
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, 'words.lex')
+        lexicon.save(path)
+        file_bytes = os.path.getsize(path)
+        mapped, load_secs, load_bytes = measure(lambda: TrieLexicon.load(path))
+        probes = list(prefix_set)[:100000]
+        set_lookup = time_lookups(prefix_set.__contains__, probes)
+        trie_lookup = time_lookups(mapped.__contains__, probes)
+        del mapped
+    print('%d words, %d prefixes, %d trie nodes' % (
+        len(words), len(prefix_set), lexicon.num_nodes))
+    print('%-22s %12s %14s %16s' % ('Structure', 'Startup (s)', 'Memory (MB)',
+        'Lookup (us)'))
+    print('%-22s %12.3f %14.1f %16.2f' % ('prefix set', set_secs,
+        set_bytes / 2**20, set_lookup * 1e6))
+    print('%-22s %12.3f %14.1f %16s' % ('trie (build)', trie_secs,
+        trie_bytes / 2**20, '-'))
+    print('%-22s %12.4f %14.1f %16.2f' % ('trie (mmap load)', load_secs,
+        load_bytes / 2**20, trie_lookup * 1e6))
+    print('Lexicon file size: %.1f MB' % (file_bytes / 2**20))
@@ -0,0 +1,94 @@
+"""
+Send synthetic essays to a running spellcheck server and report its
+throughput and latency.
+
+Each connection keeps up to --pipeline requests in flight, so the server sees
+enough concurrent requests to fill its micro-batches.
+
+Usage: python load_generator.py [--port 8765 | --unix <socket>]
+    [-c <connections>] [-n <requests>]
+"""
+import argparse
+import asyncio
+import json
+import time
+import numpy as np
+from synthetic import synthetic_essays
+parser = argparse.ArgumentParser(description='Load test a spellcheck server.')
+parser.add_argument('--host', help='Host of the server.', default='127.0.0.1')
+parser.add_argument('--port', help='Port of the server.', type=int,
+    default=8765)
+parser.add_argument('-u', '--unix', help='Path of the Unix socket of the '
+    'server instead of a TCP port.')
+parser.add_argument('-c', '--connections', help='Number of concurrent '
+    'connections.', type=int, default=8)
+parser.add_argument('-p', '--pipeline', help='Most requests in flight per '
+    'connection.', type=int, default=4)
+parser.add_argument('-n', '--num-requests', help='Total number of requests.',
+    type=int, default=2000)
+parser.add_argument('-w', '--word-counts', help='Path to word counts file to '
+    'draw essay words from.', default='../word_counts.txt')
+parser.add_argument('-s', '--seed', type=int, default=0)
+
+
+async def connect(args):
+    if args.unix:
+        return await asyncio.open_unix_connection(args.unix)
+    return await asyncio.open_connection(args.host, args.port)
+
+
+async def run_connection(args, texts, latencies):
+    """Send texts over one connection, recording each request's latency."""
+    reader, writer = await connect(args)
+    sent = {}
+    in_flight = asyncio.Semaphore(args.pipeline)
+
+    async def receive():
+        for _ in range(len(texts)):
+            response = json.loads(await reader.readline())
+            latencies.append(time.perf_counter() - sent.pop(response['id']))
+            if 'error' in response:
+                print('Error: %s' % response['error'])
+            in_flight.release()
+
+    receiver = asyncio.ensure_future(receive())
+    for request_id, text in enumerate(texts):
+        await in_flight.acquire()
+        sent[request_id] = time.perf_counter()
+        writer.write(json.dumps({'id': request_id, 'text': text}).encode(
+            'utf-8') + b'\n')
+        await writer.drain()
+    await receiver
+    writer.close()
+
+
+async def server_stats(args):
+    reader, writer = await connect(args)
+    writer.write(b'{"id": 0, "stats": true}\n')
+    response = json.loads(await reader.readline())
+    writer.close()
+    return response['stats']
+
+
+async def main(args, texts):
+    latencies = []
+    start = time.perf_counter()
+    await asyncio.gather(*[run_connection(args, texts[i::args.connections],
+        latencies) for i in range(args.connections)])
+    elapsed = time.perf_counter() - start
+    latencies = 1e3 * np.array(latencies)
+    print('%d requests over %d connections in %.2f s: %.1f requests/s' % (
+        len(latencies), args.connections, elapsed, len(latencies) / elapsed))
+    print('Client latency (ms): p50 %.2f  p90 %.2f  p99 %.2f  max %.2f' % (
+        tuple(np.percentile(latencies, [50, 90, 99])) + (latencies.max(),)))
+    print('Server stats:')
+    print(json.dumps(await server_stats(args), indent=2))
+
+
+if __name__ == '__main__':
+    args = parser.parse_args()
+    with open(args.word_counts) as f:
+        vocab = [line.split('\t')[0] for line in f]
+    texts = synthetic_essays(vocab[:20000], args.num_requests, seed=args.seed,
+        essay_lengths=(1, 5))
+    asyncio.run(main(args, texts))
@@ -0,0 +1,73 @@
+"""
+Measure DigitizationParser throughput and memory on a digitization file.
+
+Usage: python parser_benchmark.py [-d <digitization file>] [-s <MB>]
+
+Without -d, a synthetic digitization file of the given size is generated.
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+from spellcheck.parse_util import DigitizationParser
+parser = argparse.ArgumentParser(description='Benchmark DigitizationParser.')
+parser.add_argument('-d', '--dataset', help='Path to digitization file.')
+parser.add_argument('-s', '--size', help='Size in MB of the synthetic file.',
+        type=float, default=50)
+
+
+def write_synthetic_digitization(file_name, size_mb, end_of_essay,
+        seed=0):
+    rand = random.Random(seed)
+    vocab = ['the', 'cat', 'walked', 'along', 'a', '<beech>', 'was',
+        'beautiful', 'becuase', 'it', 'teh', 'sun', 'shone']
+    essay_num = 0
+    with open(file_name, 'w') as f:
+        while f.tell() < size_mb * 2**20:
+            words = [rand.choice(vocab) for _ in range(rand.randint(50, 400))]
+            print(essay_num, file=f)
+            print(' '.join(words), file=f)
+            for i, word in enumerate(words):
+                if word == 'teh':
+                    print('%d,teh,the' % i, file=f)
+            print(end_of_essay, file=f)
+            essay_num += 1
+
+
+def measure(parse):
+    # Time and trace separately since tracemalloc slows parsing down.
+    start = time.perf_counter()
+    num_essays = parse()
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    parse()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return num_essays, elapsed, peak
+
+
+if __name__ == '__main__':
+    args = parser.parse_args()
+    digitization_parser = DigitizationParser()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_name = args.dataset
+        if not file_name:
+            file_name = os.path.join(tmp_dir, 'digitization.txt')
+            write_synthetic_digitization(file_name, args.size,
+                digitization_parser.end_of_essay)
+        size_mb = os.path.getsize(file_name) / 2**20
+        runs = [
+            ('parse_digitization', lambda: len(
+                digitization_parser.parse_digitization(file_name)[0])),
+            ('iter_digitization', lambda: sum(
+                1 for _ in digitization_parser.iter_digitization(file_name))),
+        ]
+        print('%.1f MB digitization file' % size_mb)
+        print('%-20s %8s %10s %16s' % ('Parser', 'Essays', 'MB/s',
+            'Peak memory (MB)'))
+        for name, parse in runs:
+            num_essays, elapsed, peak = measure(parse)
+            print('%-20s %8d %10.1f %16.1f' % (name, num_essays,
+                size_mb / elapsed, peak / 2**20))
@@ -0,0 +1,60 @@
+"""
+Measure how fast ClusterSpellChecker rules are applied, comparing the
+RuleTable's single str.split() pass against tokenizing each essay into
+sentences and words first.
+
+Usage: python rule_benchmark.py [-d <dataset file>] [-n <synthetic essays>]
+"""
+import argparse
+import time
+from spellcheck.document import Document
+from spellcheck.parse_util import DigitizationParser
+from spellcheck.rule_table import RuleTable
+from synthetic import misspell, synthetic_essays
+import random
+parser = argparse.ArgumentParser(description='Benchmark rule application.')
+parser.add_argument('-d', '--dataset', help='Path to a sample dataset file.')
+parser.add_argument('-n', '--synthetic-essays', help='Number of synthetic '
+    'essays to generate if no dataset is given.', type=int, default=2000)
+parser.add_argument('-w', '--word-counts', help='Path to word counts file to '
+    'draw synthetic essay words from.', default='../word_counts.txt')
+parser.add_argument('-r', '--num-rules', help='Number of synthetic rules.',
+    type=int, default=5000)
+parser.add_argument('-s', '--seed', type=int, default=0)
+
+
+def tokenized_rules(rules, texts):
+    """Apply rules the way ClusterSpellChecker used to, for comparison."""
+    return [[(i, w) for i, w in enumerate(Document(text).words) if w in rules]
+        for text in texts]
+
+
+def throughput(apply, texts):
+    """Return MB/s of text apply(texts) processes."""
+    num_bytes = sum(len(text.encode('utf-8')) for text in texts)
+    start = time.perf_counter()
+    apply(texts)
+    return num_bytes / 2**20 / (time.perf_counter() - start)
+
+
+if __name__ == '__main__':
+    args = parser.parse_args()
+    rand = random.Random(args.seed)
+    with open(args.word_counts) as f:
+        vocab = [line.split('\t')[0] for line in f][:20000]
+    if args.dataset:
+        texts, _ = DigitizationParser().parse_digitization(args.dataset)
+    else:
+        texts = synthetic_essays(vocab, args.synthetic_essays, seed=args.seed)
+    words = [w for w in vocab if len(w) > 3 and w.isalpha()]
+    table = RuleTable(dict((misspell(w, rand), w)
+        for w in rand.sample(words, min(args.num_rules, len(words)))))
+    print('%d essays, %.1f MB, %d rules' % (len(texts),
+        sum(len(t.encode('utf-8')) for t in texts) / 2**20, len(table)))
+    print('%-28s %10s' % ('Method', 'MB/s'))
+    print('%-28s %10.1f' % ('sentence + word tokenize',
+        throughput(lambda ts: tokenized_rules(table.rules, ts), texts)))
+    print('%-28s %10.1f' % ('RuleTable.apply',
+        throughput(lambda ts: [table.apply(t) for t in ts], texts)))
+    print('%-28s %10.1f' % ('RuleTable.apply_batch',
+        throughput(table.apply_batch, texts)))
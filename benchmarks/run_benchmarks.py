@@ -0,0 +1,165 @@
+"""
+Benchmark the spellchecker configurations compared by spellchecker_stats.py.
+
+Each configuration is built and run in a fresh process over each corpus, and
+its construction time, throughput, per-essay latency and peak RSS are
+written to a JSON file so runs from different commits can be compared.
+
+Usage: python run_benchmarks.py -o results.json [-d <dataset file>]
+    [--baseline <previous results.json>]
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import subprocess
+import sys
+import time
+import numpy as np
+from spellcheck.instrumentation import Instrumentation
+from spellcheck.parse_util import DigitizationParser
+from spellcheck.spellchecker_stats import SpellCheckerConfigs
+from synthetic import synthetic_essays
+parser = argparse.ArgumentParser(description='Benchmark spellcheckers.')
+parser.add_argument('-o', '--output', help='Path to write JSON results to.',
+        required=True)
+parser.add_argument('-d', '--dataset', help='Path to a sample dataset file.')
+parser.add_argument('-n', '--synthetic-essays', help='Number of synthetic '
+    'essays to generate.  0 skips the synthetic corpus.', type=int,
+    default=200)
+parser.add_argument('-c', '--config', help='Name of a configuration to run.  '
+    'Can be given more than once.  Defaults to all of them.',
+    action='append', choices=SpellCheckerConfigs.NAMES)
+parser.add_argument('-e', '--edit-counts', help='Path to edit counts file.',
+        default='../edit_counts.txt')
+parser.add_argument('-w', '--word-counts', help='Path to word counts file.',
+        default='../word_counts.txt')
+parser.add_argument('-l', '--lexicon', help='Path to a compiled lexicon file.')
+parser.add_argument('--corpus-artifact', help='Path to a compiled brown '
+    'corpus model artifact.')
+parser.add_argument('--word-counts-artifact', help='Path to a compiled word '
+    'counts model artifact.')
+parser.add_argument('-i', '--instrument', help='Record per-stage timings and '
+    'counters for each run.', action='store_true')
+parser.add_argument('-b', '--baseline', help='Path to JSON results from an '
+    'earlier run to compare against.')
+
+
+def peak_rss_mb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere.
+    if sys.platform == 'darwin':
+        return peak / 2**20
+    return peak / 2**10
+
+
+def run_config(name, dataset, edit_counts_file, word_counts_file,
+        lexicon_file, instrument=False, corpus_artifact_file=None,
+        word_counts_artifact_file=None):
+    """Build and run one configuration.  Meant to run in a fresh process."""
+    start = time.perf_counter()
+    spellchecker = SpellCheckerConfigs(dataset, edit_counts_file,
+        word_counts_file, lexicon_file, corpus_artifact_file,
+        word_counts_artifact_file).build(name)
+    construction_secs = time.perf_counter() - start
+    instrumentation = Instrumentation() if instrument else None
+    spellchecker.set_instrumentation(instrumentation)
+    latencies = []
+    start = time.perf_counter()
+    essay_start = start
+    for _ in spellchecker.spellcheck_iter(dataset):
+        now = time.perf_counter()
+        latencies.append(now - essay_start)
+        essay_start = now
+    total_secs = time.perf_counter() - start
+    num_tokens = sum(len(essay.split()) for essay in dataset)
+    result = {
+        'construction_secs': construction_secs,
+        'spellcheck_secs': total_secs,
+        'essays': len(dataset),
+        'tokens': num_tokens,
+        'tokens_per_sec': num_tokens / total_secs if total_secs else None,
+        'p50_essay_ms': 1e3 * float(np.percentile(latencies, 50)),
+        'p99_essay_ms': 1e3 * float(np.percentile(latencies, 99)),
+        'peak_rss_mb': peak_rss_mb(),
+    }
+    if instrumentation:
+        result['instrumentation'] = instrumentation.as_dict()
+    return result
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', 'HEAD'],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            stderr=subprocess.DEVNULL).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def load_corpora(args):
+    corpora = {}
+    if args.dataset:
+        corpora['sample'], _ = DigitizationParser().parse_digitization(
+            args.dataset)
+    if args.synthetic_essays:
+        with open(args.word_counts) as f:
+            vocab = [line.split('\t')[0] for line in f]
+        corpora['synthetic'] = synthetic_essays(vocab[:20000],
+            args.synthetic_essays)
+    return corpora
+
+
+def compare(results, baseline):
+    """Print the ratio of each metric to the matching baseline result."""
+    baseline_results = dict(((r['config'], r['corpus']), r)
+        for r in baseline['results'])
+    metrics = ['construction_secs', 'tokens_per_sec', 'p50_essay_ms',
+        'p99_essay_ms', 'peak_rss_mb']
+    print('\nRatio to baseline %s' % baseline.get('git_commit'))
+    print('%-45s %-10s ' % ('Config', 'Corpus') +
+        ' '.join('%18s' % m for m in metrics))
+    for result in results:
+        old = baseline_results.get((result['config'], result['corpus']))
+        if not old:
+            continue
+        ratios = [result[m] / old[m] if result[m] and old[m] else float('nan')
+            for m in metrics]
+        print('%-45s %-10s ' % (result['config'], result['corpus']) +
+            ' '.join('%18.2f' % r for r in ratios))
+
+
+if __name__ == '__main__':
+    args = parser.parse_args()
+    names = args.config or SpellCheckerConfigs.NAMES
+    corpora = load_corpora(args)
+    # Spawn rather than fork so each run's peak RSS is its own.
+    context = multiprocessing.get_context('spawn')
+    results = []
+    for corpus_name, dataset in corpora.items():
+        for name in names:
+            with context.Pool(1) as pool:
+                result = pool.apply(run_config, (name, dataset,
+                    args.edit_counts, args.word_counts, args.lexicon,
+                    args.instrument, args.corpus_artifact,
+                    args.word_counts_artifact))
+            result.update({'config': name, 'corpus': corpus_name})
+            results.append(result)
+            print('%-45s %-10s %8.1fs build %10.0f tokens/s %8.1fms p50 '
+                '%8.1fms p99 %8.0fMB' % (name, corpus_name,
+                result['construction_secs'], result['tokens_per_sec'] or 0,
+                result['p50_essay_ms'], result['p99_essay_ms'],
+                result['peak_rss_mb']))
+    with open(args.output, 'w') as f:
+        json.dump({
+            'git_commit': git_commit(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'timestamp': time.time(),
+            'results': results,
+        }, f, indent=2)
+    if args.baseline:
+        with open(args.baseline) as f:
+            compare(results, json.load(f))
@@ -0,0 +1,45 @@
+"""Synthetic corpora shared by the benchmark scripts."""
+import random
+
+
+def misspell(word, rand, alphabet='abcdefghijklmnopqrstuvwxyz'):
+    """Apply one random insertion, deletion, replacement or transposition."""
+    chars = list(word)
+    i = rand.randrange(len(chars))
+    op = rand.randrange(4)
+    if op == 0:
+        chars.insert(i, rand.choice(alphabet))
+    elif op == 1 and len(chars) > 2:
+        del chars[i]
+    elif op == 2 and i + 1 < len(chars):
+        chars[i], chars[i + 1] = chars[i + 1], chars[i]
+    else:
+        chars[i] = rand.choice(alphabet)
+    return ''.join(chars)
+
+
+def synthetic_essays(vocab, num_essays, error_rate=0.05, seed=0,
+        sentence_lengths=(5, 20), essay_lengths=(5, 25)):
+    """
+    Generate essays of random sentences drawn from vocab, with error_rate of
+    the words misspelled.
+
+    Returns:
+        [list of strings] The essays.
+    """
+    rand = random.Random(seed)
+    vocab = [w for w in vocab if len(w) > 1 and w.isalpha()]
+    essays = []
+    for _ in range(num_essays):
+        sentences = []
+        for _ in range(rand.randint(*essay_lengths)):
+            words = []
+            for _ in range(rand.randint(*sentence_lengths)):
+                word = rand.choice(vocab)
+                if rand.random() < error_rate:
+                    word = misspell(word, rand)
+                words.append(word)
+            sentences.append(words[0].capitalize() + ' ' +
+                ' '.join(words[1:]) + '.')
+        essays.append(' '.join(sentences))
+    return essays
@@ -0,0 +1,72 @@
+"""
+Measure tokenization throughput, comparing the NLTK sentence and word
+tokenizers against spellcheck.tokenizer, and check that the tokenizer gives
+the same tokens, and so the same SpellingCorrection indices, as sentence
+tokenizing with Punkt first.
+
+Usage: python tokenizer_benchmark.py [-d <dataset file>]
+    [-n <synthetic essays>]
+"""
+import argparse
+import time
+import nltk
+from nltk.tokenize import sent_tokenize
+from spellcheck.document import Document
+from spellcheck.parse_util import DigitizationParser, word_tokenize
+from spellcheck.tokenizer import token_spans, words
+from synthetic import synthetic_essays
+parser = argparse.ArgumentParser(description='Benchmark tokenization.')
+parser.add_argument('-d', '--dataset', help='Path to a sample dataset file.')
+parser.add_argument('-n', '--synthetic-essays', help='Number of synthetic '
+    'essays to generate if no dataset is given.', type=int, default=2000)
+parser.add_argument('-w', '--word-counts', help='Path to word counts file to '
+    'draw synthetic essay words from.', default='../word_counts.txt')
+parser.add_argument('-s', '--seed', type=int, default=0)
+
+
+def punkt_words(text):
+    """Tokenize text the way spellcheckers used to, for comparison."""
+    return [w for sent in sent_tokenize(text) for w in word_tokenize(sent)]
+
+
+def nltk_words(text):
+    return [w for sent in sent_tokenize(text)
+        for w in nltk.word_tokenize(sent, preserve_line=True)]
+
+
+def throughput(tokenize, texts):
+    """Return tokens/s and the tokens tokenize finds in texts."""
+    start = time.perf_counter()
+    tokens = [tokenize(text) for text in texts]
+    seconds = time.perf_counter() - start
+    return sum(len(t) for t in tokens) / seconds, tokens
+
+
+if __name__ == '__main__':
+    args = parser.parse_args()
+    if args.dataset:
+        texts, _ = DigitizationParser().parse_digitization(args.dataset)
+    else:
+        with open(args.word_counts) as f:
+            vocab = [line.split('\t')[0] for line in f][:20000]
+        texts = synthetic_essays(vocab, args.synthetic_essays, seed=args.seed)
+    methods = [
+        ('nltk sent + word_tokenize', nltk_words),
+        ('sent_tokenize + word_tokenize', punkt_words),
+        ('Document.sentences', lambda text: [w
+            for sent in Document(text).sentences for w in sent]),
+        ('Document.words', lambda text: Document(text).words),
+        ('token_spans', token_spans),
+        ('words', words),
+    ]
+    print('%d essays, %.1f MB' % (len(texts),
+        sum(len(t.encode('utf-8')) for t in texts) / 2**20))
+    print('%-30s %12s' % ('Method', 'tokens/s'))
+    results = {}
+    for name, tokenize in methods:
+        tokens_per_second, results[name] = throughput(tokenize, texts)
+        print('%-30s %12.0f' % (name, tokens_per_second))
+    expected = results['sent_tokenize + word_tokenize']
+    mismatches = sum(e != w for e, w in zip(expected, results['words']))
+    print('%d essays tokenized differently from sent_tokenize + '
+        'word_tokenize' % mismatches)
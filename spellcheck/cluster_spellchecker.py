@@ -1,18 +1,29 @@
-from collections import Counter
-import enchant
-from nltk.tokenize import sent_tokenize
-from spellcheck.parse_util import word_tokenize
-from spellcheck.spellchecker import SpellChecker, SpellingCorrection
-from spellcheck.interactive_corrector import DistMatrix, InteractiveCorrector
+import json
+from collections import Counter, defaultdict
+from spellcheck.spellchecker import SpellChecker
+from spellcheck.document import as_document
+from spellcheck.rule_table import RuleTable
+from spellcheck.dictionary import shared_dictionary
+from spellcheck.interactive_corrector import (InteractiveCorrector,
+    NeighbourIndex)
 from pyxdameraulevenshtein import damerau_levenshtein_distance
 
 class ClusterSpellChecker(SpellChecker):
 
-    def __init__(self, correct_capitalization=False):
-        self.eng_us_dict = enchant.Dict('en_US')
-        self.eng_gb_dict = enchant.Dict('en_GB')
+    RULE_METHODS = ('suggest', 'edit1')
+    _RULE_STATE_VERSION = 1
+
+    def __init__(self, correct_capitalization=False, dictionary=None):
+        self.dictionary = (dictionary if dictionary is not None
+            else shared_dictionary())
         self.rules = {}
         self.correct_capitalization = correct_capitalization
+        # State kept by add_essays() so rules can be learned incrementally.
+        self.rule_method = None
+        self.word_freqs = Counter()
+        self.suggestions = {}
+        self.suggested_by = defaultdict(set)
+        self.neighbours = None
 
     def save_edit1_rules(self, dataset):
         """
@@ -22,48 +33,189 @@ class ClusterSpellChecker(SpellChecker):
         # TODO(smilli): Make overrwrite rules
         dataset_words = []
         for essay in dataset:
-            sents = sent_tokenize(essay)
-            dataset_words += [w for sent in sents for w in word_tokenize(sent) if
+            dataset_words += [w for w in as_document(essay).words if
                 self.valid_word(w)]
         # TODO(smilli): filter out non dict words that are still
         # correct (proper nouns)
         corrector = InteractiveCorrector(
-                DistMatrix(dataset_words, damerau_levenshtein_distance))
+                NeighbourIndex(dataset_words, damerau_levenshtein_distance),
+                self.dictionary)
         rules = corrector.extract_rules()
         self.rules = dict((w, c) for w, c in rules.items() if
                 self.valid_correction(w, c))
         return self.rules
 
-    def save_suggested_rules(self, dataset):
+    def save_suggested_rules(self, dataset, processes=None):
         """
         Add rules for dataset words that are suggested corrections for
         misspelled dataset words.
+
+        Params:
+            dataset: [list of strings] The essays.
+            processes: [int] Number of worker processes to make dictionary
+                suggestions in.  Made in this process if not given.
         """
         dataset_words = []
         for essay in dataset:
-            sents = sent_tokenize(essay)
-            dataset_words += [w for sent in sents for w in word_tokenize(sent) if
+            dataset_words += [w for w in as_document(essay).words if
                 self.valid_word(w)]
         dataset_word_freqs = Counter(dataset_words)
-        for word in set(dataset_words):
-            if self.valid_word(word) and not self.in_dict(word):
-                # TODO(smilli): filter out non dict words that are still
-                # correct (proper nouns)
-                suggestions = self.get_suggestions(word)
-                total_freq = sum(dataset_word_freqs[s] for s in
-                    suggestions)
-                correction = None
-                if total_freq > 0:
-                    for suggestion in suggestions:
-                        if dataset_word_freqs[suggestion]/total_freq >= 0.5:
-                            correction = suggestion
-                            break
-                if correction and self.valid_correction(word, correction):
-                    self.rules[word] = correction
+        misspellings = [word for word in set(dataset_words)
+            if self.valid_word(word) and not self.in_dict(word)]
+        all_suggestions = self.get_suggestions_many(misspellings, processes)
+        for word in misspellings:
+            # TODO(smilli): filter out non dict words that are still
+            # correct (proper nouns)
+            suggestions = all_suggestions[word]
+            total_freq = sum(dataset_word_freqs[s] for s in
+                suggestions)
+            correction = None
+            if total_freq > 0:
+                for suggestion in suggestions:
+                    if dataset_word_freqs[suggestion]/total_freq >= 0.5:
+                        correction = suggestion
+                        break
+            if correction and self.valid_correction(word, correction):
+                self.rules[word] = correction
 
     def remove_saved_rules(self):
         self.rules = {}
 
+    def add_essays(self, essays, method='suggest', processes=None):
+        """
+        Learn rules from essays incrementally.
+
+        The rules are the ones save_suggested_rules() (for method 'suggest')
+        or save_edit1_rules() (for 'edit1') would learn from every essay added
+        so far, but word frequencies and dictionary suggestions are kept
+        between calls, so only rules that can depend on the new essays' words
+        are recomputed.
+
+        Params:
+            essays: [list of strings] The new essays.
+            method: [string] 'suggest' or 'edit1'.  Must be the same for every
+                call.
+            processes: [int] Number of worker processes to make dictionary
+                suggestions in.  Made in this process if not given.
+
+        Returns:
+            [set of strings] The misspellings whose rules were recomputed.
+        """
+        if method not in self.RULE_METHODS:
+            raise ValueError('Unknown rule method: %s' % method)
+        if self.rule_method is None:
+            self.rule_method = method
+            if method == 'edit1':
+                self.neighbours = NeighbourIndex([],
+                    damerau_levenshtein_distance)
+        elif method != self.rule_method:
+            raise ValueError('Rules were learned with the %s method.' %
+                self.rule_method)
+        new_counts = Counter(w for essay in essays
+            for w in as_document(essay).words if self.valid_word(w))
+        self.word_freqs.update(new_counts)
+        affected = set()
+        if method == 'suggest':
+            # A rule only depends on the frequencies of the word's
+            # suggestions, so only new misspellings and misspellings
+            # suggesting one of the new words can change.
+            misspellings = [word for word in new_counts
+                if word not in self.suggestions and not self.in_dict(word)]
+            for word, suggestions in self.get_suggestions_many(misspellings,
+                    processes).items():
+                self.add_suggestions(word, suggestions)
+            affected.update(misspellings)
+            for word in new_counts:
+                affected.update(self.suggested_by.get(word, ()))
+        else:
+            self.neighbours.add_counts(new_counts)
+            for word in new_counts:
+                # A rule depends on the frequencies of the word and the words
+                # an edit away, so those are the rules that can change.
+                affected.update(w for w, _ in
+                    self.neighbours.get_close_words(word, 1)
+                    if not self.in_dict(w))
+        for word in affected:
+            if method == 'suggest':
+                correction = self.suggested_correction(word)
+            else:
+                correction = self.edit1_correction(word)
+            if correction and self.valid_correction(word, correction):
+                self.rules[word] = correction
+            else:
+                self.rules.pop(word, None)
+        return affected
+
+    def add_suggestions(self, word, suggestions):
+        self.suggestions[word] = list(suggestions)
+        for suggestion in suggestions:
+            self.suggested_by[suggestion].add(word)
+
+    def suggested_correction(self, word):
+        """
+        Return the suggestion for word that makes up at least half of the
+        occurrences of its suggestions, or None.
+        """
+        suggestions = self.suggestions[word]
+        total_freq = sum(self.word_freqs[s] for s in suggestions)
+        if total_freq > 0:
+            for suggestion in suggestions:
+                if self.word_freqs[suggestion]/total_freq >= 0.5:
+                    return suggestion
+        return None
+
+    def edit1_correction(self, word):
+        """
+        Return the dictionary word an edit away from word that makes up at
+        least half of the occurrences of word and its neighbours, or None.
+        """
+        close_words = self.neighbours.get_close_words(word, 1)
+        total_counts = sum(c for w, c in close_words)
+        for close_word, count in close_words:
+            if (close_word != word and self.in_dict(close_word)
+                    and count/total_counts >= 0.5):
+                return close_word
+        return None
+
+    def save_rule_state(self, path):
+        """Save the state kept by add_essays() as JSON."""
+        state = {
+            'version': self._RULE_STATE_VERSION,
+            'method': self.rule_method,
+            'correct_capitalization': self.correct_capitalization,
+            # Kept in the order words were first seen, which is the order
+            # the neighbour index was built in.
+            'word_freqs': list(self.word_freqs.items()),
+            'suggestions': self.suggestions,
+            'rules': self.rules,
+        }
+        with open(path, 'w') as f:
+            json.dump(state, f)
+
+    def load_rule_state(self, path):
+        """
+        Replace the rules and add_essays() state with those saved by
+        save_rule_state().
+        """
+        with open(path) as f:
+            state = json.load(f)
+        if state.get('version') != self._RULE_STATE_VERSION:
+            raise InvalidRuleStateException(
+                'Not a version %s rule state file.' %
+                self._RULE_STATE_VERSION)
+        self.rule_method = state['method']
+        self.correct_capitalization = state['correct_capitalization']
+        self.word_freqs = Counter(dict(state['word_freqs']))
+        self.suggestions = {}
+        self.suggested_by = defaultdict(set)
+        for word, suggestions in state['suggestions'].items():
+            self.add_suggestions(word, suggestions)
+        self.neighbours = None
+        if self.rule_method == 'edit1':
+            self.neighbours = NeighbourIndex([], damerau_levenshtein_distance)
+            self.neighbours.add_counts(self.word_freqs)
+        self.rules = state['rules']
+
     def valid_word(self, word):
         """
         Return whether the token is a valid word.
@@ -76,24 +228,35 @@ class ClusterSpellChecker(SpellChecker):
             correction) or (word == correction[0].upper() + correction[1:])))
 
     def get_suggestions(self, word):
-        suggestions = set(self.eng_us_dict.suggest(word)).union(
-            set(self.eng_gb_dict.suggest(word)))
-        return suggestions
+        return self.dictionary.suggest(word)
+
+    def get_suggestions_many(self, words, processes=None):
+        """Return a dict from each of words to its suggestions."""
+        return self.dictionary.suggest_many(words, processes)
 
     def in_dict(self, word):
-        if word:
-            return self.eng_us_dict.check(word) or self.eng_gb_dict.check(word)
-        return False
-
-    def spellcheck(self, dataset):
-        corrections = []
-        for text in dataset:
-            essay_corrections = []
-            sentences = sent_tokenize(text)
-            words  = [w for sent in sentences for w in word_tokenize(sent)]
-            for i, word in enumerate(words):
-                if word in self.rules:
-                    essay_corrections.append(SpellingCorrection(i, word,
-                        [self.rules[word]]))
-            corrections.append(essay_corrections)
-        return corrections
+        return self.dictionary.check(word)
+
+    def spellcheck_text(self, text):
+        instrumentation = self.instrumentation
+        with instrumentation.timer('apply_rules'):
+            essay_corrections = RuleTable(self.rules).apply(text)
+        if instrumentation.enabled:
+            instrumentation.count('tokens', len(text.split()))
+            instrumentation.count('tokens_corrected', len(essay_corrections))
+        return essay_corrections
+
+    def spellcheck_batch(self, texts):
+        with self.instrumentation.timer('apply_rules'):
+            return RuleTable(self.rules).apply_batch(texts)
+
+    def save_rules(self, path):
+        """Save the rules in the versioned JSON format of RuleTable."""
+        RuleTable(self.rules).save(path)
+
+    def load_rules(self, path):
+        """Replace the rules with those saved by save_rules()."""
+        self.rules = RuleTable.load(path).rules
+
+class InvalidRuleStateException(Exception):
+    pass
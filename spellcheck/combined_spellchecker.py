@@ -1,27 +1,145 @@
+from collections.abc import Sequence
+from itertools import tee
 from spellcheck.spellchecker import SpellChecker, SpellingCorrection
+from spellcheck.document import as_document
+from spellcheck.parallel import spellcheck_concurrently
 
 class CombinedSpellChecker(SpellChecker):
 
-    def __init__(self, spellcheckers):
+    def __init__(self, spellcheckers, cascade=False, processes=None,
+            batch_size=64):
         """
         Construct CombinedSpellChecker.
 
         Params:
             spellcheckers: [list] Spellcheckers in order of descending priority.
+            cascade: [bool] Run the spellcheckers one after another on each
+                essay, each skipping the tokens a higher priority spellchecker
+                already corrected, instead of running every spellchecker over
+                every token and merging.  The corrections are the same.
+            processes: [int] Number of processes spellcheck() runs the
+                spellcheckers in at once.  Only used when not cascading, since
+                cascading spellcheckers depend on each other.
+            batch_size: [int] Number of essays of a list spellcheck() checks
+                at a time when cascading, so spellcheckers can work on
+                several essays at a time (such as POS tagging them
+                together).  spellcheck_iter() checks each essay as soon as
+                it arrives.
         """
         self.spellcheckers = spellcheckers
+        self.cascade = cascade
+        self.processes = processes
+        self.batch_size = batch_size
 
-    def spellcheck(self, dataset):
-        sc_corrections = [sc.spellcheck(dataset) for sc in self.spellcheckers]
+    def set_instrumentation(self, instrumentation):
+        """
+        See SpellChecker.set_instrumentation.  Tokens are counted once, as
+        'tokens', and each spellchecker's counters are recorded under its
+        class name, such as 'EditDistanceSpellChecker.tokens'.
+        """
+        super().set_instrumentation(instrumentation)
+        for sc in self.spellcheckers:
+            sc.set_instrumentation(self.instrumentation.prefixed(
+                sc.__class__.__name__ + '.'))
+
+    def count_tokens(self, documents):
+        if self.instrumentation.enabled:
+            self.instrumentation.count('tokens',
+                sum(len(document.words) for document in documents))
+
+    def merge(self, sc_corrections):
+        """
+        Merge the corrections each spellchecker made to one essay, keeping
+        the highest priority correction at each position.
+
+        Params:
+            sc_corrections: [list of lists of SpellingCorrection objects] The
+                corrections from each spellchecker, in priority order.
+        """
+        self.instrumentation.count('merged_corrections',
+            sum(len(c) for c in sc_corrections))
         final_corrections = []
-        for _ in range(len(dataset)):
-            final_corrections.append([])
         corrections_set = set()
-        for sc_correction in sc_corrections:
-            for essay_ind, essay_corrections in enumerate(sc_correction):
-                for correction in essay_corrections:
-                    key = (essay_ind, correction.index, correction.word)
-                    if key not in corrections_set:
-                        corrections_set.add(key)
-                        final_corrections[essay_ind].append(correction)
+        for essay_corrections in sc_corrections:
+            for correction in essay_corrections:
+                key = (correction.index, correction.word)
+                if key not in corrections_set:
+                    corrections_set.add(key)
+                    final_corrections.append(correction)
         return final_corrections
+
+    def spellcheck(self, dataset):
+        if self.cascade:
+            if not isinstance(dataset, Sequence):
+                return super().spellcheck(dataset)
+            dataset_corrections = []
+            for start in range(0, len(dataset), self.batch_size):
+                batch = dataset[start:start + self.batch_size]
+                dataset_corrections += self.spellcheck_skipping(batch,
+                    [set() for _ in batch])
+            return dataset_corrections
+        # Each child checks the whole dataset with its own spellcheck(), so
+        # it can batch its work, and the children share the Documents.
+        documents = [as_document(text) for text in dataset]
+        self.count_tokens(documents)
+        if self.processes:
+            sc_results = spellcheck_concurrently(self.spellcheckers,
+                documents, self.processes)
+        else:
+            sc_results = [sc.spellcheck(documents)
+                for sc in self.spellcheckers]
+        return [self.merge(list(sc_corrections))
+            for sc_corrections in zip(*sc_results)]
+
+    def spellcheck_iter(self, texts):
+        if self.cascade:
+            yield from super().spellcheck_iter(texts)
+            return
+        # Each child consumes its own copy of texts.  The children advance in
+        # lockstep, so tee only ever buffers the current text.  The children
+        # get the same Documents, so they share tokens and tags.
+        def documents():
+            for text in texts:
+                document = as_document(text)
+                self.count_tokens([document])
+                yield document
+        streams = [sc.spellcheck_iter(sc_texts) for sc, sc_texts in
+            zip(self.spellcheckers, tee(documents(), len(self.spellcheckers)))]
+        for results in zip(*streams):
+            essay_ind = results[0][0]
+            yield essay_ind, self.merge(
+                [corrections for _, corrections in results])
+
+    def spellcheck_text(self, text):
+        text = as_document(text)
+        if self.cascade:
+            return self.spellcheck_skipping([text], [set()])[0]
+        self.count_tokens([text])
+        return self.merge([sc.spellcheck_text(text)
+            for sc in self.spellcheckers])
+
+    def spellcheck_skipping(self, texts, skips):
+        """
+        Run the spellcheckers in priority order, each skipping the tokens
+        already in skips or corrected by a spellchecker before it.  See
+        SpellChecker.spellcheck_skipping.
+        """
+        if not self.cascade:
+            return super().spellcheck_skipping(texts, skips)
+        documents = [as_document(text) for text in texts]
+        self.count_tokens(documents)
+        skips = [set(skip) for skip in skips]
+        dataset_corrections = [[] for _ in documents]
+        for sc in self.spellcheckers:
+            self.instrumentation.count('cascade_skipped_tokens',
+                sum(len(skip) for skip in skips))
+            sc_corrections = sc.spellcheck_skipping(documents, skips)
+            for essay_corrections, skip, corrections in zip(
+                    dataset_corrections, skips, sc_corrections):
+                for correction in corrections:
+                    if correction.index not in skip:
+                        skip.add(correction.index)
+                        essay_corrections.append(correction)
+        self.instrumentation.count('merged_corrections',
+            sum(len(c) for c in dataset_corrections))
+        return dataset_corrections
@@ -0,0 +1,167 @@
+import struct
+import sys
+from array import array
+from spellcheck.spellchecker import SpellingCorrection
+
+
+class CorrectionBatch:
+    """
+    Corrections made to many essays, stored in parallel arrays.
+
+    Correction i was made to essay essays[i] at token indices[i].  The
+    misspelled word is strings[words[i]] and the ids of its ranked
+    corrections are correction_ids[correction_first[i]:correction_first[i+1]].
+    Words and corrections are interned, so each distinct string is stored
+    once, and a batch is written to and read from disk as a few flat arrays.
+    """
+
+    _MAGIC = b'SPCB'
+    _VERSION = 1
+    # magic, version, number of corrections, number of correction ids,
+    # number of strings, string bytes
+    _HEADER = struct.Struct('<4sIIIII')
+
+    def __init__(self):
+        self.essays = array('I')
+        self.indices = array('I')
+        self.words = array('I')
+        self.correction_first = array('I', [0])
+        self.correction_ids = array('I')
+        self.strings = []
+        self.string_ids = {}
+
+    @classmethod
+    def from_lists(cls, dataset_corrections):
+        """
+        Build a batch from a list of lists of SpellingCorrection objects, as
+        returned by SpellChecker.spellcheck().
+        """
+        batch = cls()
+        for essay_ind, corrections in enumerate(dataset_corrections):
+            batch.extend(essay_ind, corrections)
+        return batch
+
+    def intern(self, string):
+        """Return the id of string, assigning one if it is new."""
+        string_id = self.string_ids.get(string)
+        if string_id is None:
+            string_id = len(self.strings)
+            self.string_ids[string] = string_id
+            self.strings.append(string)
+        return string_id
+
+    def append(self, essay_ind, index, word, corrections):
+        """
+        Add a correction without building a SpellingCorrection.
+
+        Params:
+            essay_ind: [int] Index of the essay the correction was made to.
+            index: [int] Index of the misspelled token in the essay.
+            word: [string] The misspelling.
+            corrections: [list of strings] Its ranked corrections.
+        """
+        self.essays.append(essay_ind)
+        self.indices.append(index)
+        self.words.append(self.intern(word))
+        self.correction_ids.extend(map(self.intern, corrections))
+        self.correction_first.append(len(self.correction_ids))
+
+    def extend(self, essay_ind, corrections):
+        """Add the corrections made to the essay with index essay_ind."""
+        for correction in corrections:
+            self.append(essay_ind, correction.index, correction.word,
+                correction.corrections)
+
+    def __len__(self):
+        return len(self.essays)
+
+    def __getitem__(self, i):
+        """Return (essay index, SpellingCorrection) for correction i."""
+        corrections = [self.strings[c] for c in self.correction_ids[
+            self.correction_first[i]:self.correction_first[i + 1]]]
+        return self.essays[i], SpellingCorrection(self.indices[i],
+            self.strings[self.words[i]], corrections)
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+    def best_correction_ids(self):
+        """Return an array with the id of each best correction, or -1."""
+        first = self.correction_first
+        return array('q', (self.correction_ids[first[i]]
+            if first[i] < first[i + 1] else -1 for i in range(len(self))))
+
+    def to_lists(self, num_essays=None):
+        """
+        Return the corrections as a list of lists of SpellingCorrection
+        objects, one list per essay.
+
+        Params:
+            num_essays: [int] Number of essays.  Defaults to one more than the
+                largest essay index in the batch.
+        """
+        if num_essays is None:
+            num_essays = max(self.essays) + 1 if self.essays else 0
+        dataset_corrections = [[] for _ in range(num_essays)]
+        for essay_ind, correction in self:
+            dataset_corrections[essay_ind].append(correction)
+        return dataset_corrections
+
+    def to_bytes(self):
+        """Serialize the batch to the format read by from_bytes()."""
+        encoded = [s.encode('utf-8') for s in self.strings]
+        string_offsets = array('I', [0])
+        for s in encoded:
+            string_offsets.append(string_offsets[-1] + len(s))
+        blob = b''.join(encoded)
+        chunks = [self._HEADER.pack(self._MAGIC, self._VERSION, len(self),
+            len(self.correction_ids), len(self.strings), len(blob))]
+        for column in (self.essays, self.indices, self.words,
+                self.correction_first, self.correction_ids, string_offsets):
+            if sys.byteorder == 'big':
+                column = array(column.typecode, column)
+                column.byteswap()
+            chunks.append(column.tobytes())
+        chunks.append(blob)
+        return b''.join(chunks)
+
+    @classmethod
+    def from_bytes(cls, buf):
+        """Build a batch from bytes written by to_bytes()."""
+        view = memoryview(buf)
+        (magic, version, num_corrections, num_correction_ids, num_strings,
+            blob_size) = cls._HEADER.unpack_from(view)
+        if magic != cls._MAGIC or version != cls._VERSION:
+            raise InvalidCorrectionBatchException(
+                'Not a version %s correction batch file.' % cls._VERSION)
+        offset = cls._HEADER.size
+        columns = []
+        for length in (num_corrections, num_corrections, num_corrections,
+                num_corrections + 1, num_correction_ids, num_strings + 1):
+            column = array('I')
+            column.frombytes(view[offset:offset + length * column.itemsize])
+            if sys.byteorder == 'big':
+                column.byteswap()
+            columns.append(column)
+            offset += length * column.itemsize
+        batch = cls()
+        (batch.essays, batch.indices, batch.words, batch.correction_first,
+            batch.correction_ids, string_offsets) = columns
+        blob = bytes(view[offset:offset + blob_size])
+        batch.strings = [blob[string_offsets[i]:string_offsets[i + 1]].decode(
+            'utf-8') for i in range(num_strings)]
+        batch.string_ids = dict((s, i) for i, s in enumerate(batch.strings))
+        return batch
+
+    def save(self, path):
+        with open(path, 'wb') as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'rb') as f:
+            return cls.from_bytes(f.read())
+
+
+class InvalidCorrectionBatchException(Exception):
+    pass
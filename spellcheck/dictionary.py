@@ -0,0 +1,148 @@
+import math
+import multiprocessing
+import enchant
+from spellcheck.cache import LRUCache
+
+DICTIONARY_TAGS = ('en_US', 'en_GB')
+
+
+class CachedDictionary:
+    """
+    The US and GB English enchant dictionaries behind an in-process cache.
+
+    Every spellchecker asks the same dictionary about the same strings, so
+    answers are cached and enchant is only called for strings that haven't
+    been seen.  preload() can additionally move a whole word list into a
+    frozen set up front.  Suggestions, which are much slower than checks, can
+    be kept in an on-disk SuggestionCache and made in a pool of processes
+    with suggest_many().
+    """
+
+    def __init__(self, cache_size=200000, suggestion_cache=None):
+        """
+        Construct CachedDictionary.
+
+        Params:
+            cache_size: [int] Number of check() results to cache.
+            suggestion_cache: [SuggestionCache] Where to look up and store
+                suggestions.  Suggestions aren't cached if not given.
+        """
+        self.eng_us_dict = enchant.Dict('en_US')
+        self.eng_gb_dict = enchant.Dict('en_GB')
+        self.cache = LRUCache(cache_size)
+        self.suggestion_cache = suggestion_cache
+        self.known_words = frozenset()
+        self.known_word_hits = 0
+
+    def __getstate__(self):
+        # Enchant dicts can't be pickled, so other processes open their own.
+        state = self.__dict__.copy()
+        del state['eng_us_dict']
+        del state['eng_gb_dict']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.eng_us_dict = enchant.Dict('en_US')
+        self.eng_gb_dict = enchant.Dict('en_GB')
+
+    def enchant_check(self, word):
+        return self.eng_us_dict.check(word) or self.eng_gb_dict.check(word)
+
+    def check(self, word):
+        """Return whether word is in either dictionary."""
+        if not word:
+            return False
+        if word in self.known_words:
+            self.known_word_hits += 1
+            return True
+        in_dict = self.cache.get(word)
+        if in_dict is None:
+            in_dict = self.enchant_check(word)
+            self.cache.put(word, in_dict)
+        return in_dict
+
+    def preload(self, words):
+        """
+        Add the dictionary words among words to the frozen set of known words,
+        which is checked before the cache and never evicted.
+        """
+        self.known_words = self.known_words.union(
+            w for w in words if w and self.enchant_check(w))
+
+    def suggest(self, word):
+        """Return the set of suggestions either dictionary makes for word."""
+        if self.suggestion_cache is not None:
+            return self.suggest_many([word])[word]
+        return set(self.eng_us_dict.suggest(word)).union(
+            set(self.eng_gb_dict.suggest(word)))
+
+    def suggest_many(self, words, processes=None):
+        """
+        Return a dict from each of words to suggest(word).
+
+        Suggestions found in the suggestion cache are reused, and the rest
+        are made once per distinct word and added to the cache.
+
+        Params:
+            words: [iterable of strings] The words to make suggestions for.
+            processes: [int] Number of worker processes to make suggestions
+                in, each with its own enchant dictionaries.  Suggestions are
+                made in this process if not given.
+        """
+        words = list(dict.fromkeys(words))
+        tag_suggestions = dict((tag, {}) for tag in DICTIONARY_TAGS)
+        if self.suggestion_cache is not None:
+            for tag in DICTIONARY_TAGS:
+                tag_suggestions[tag] = self.suggestion_cache.get_many(tag,
+                    words)
+        missing = [w for w in words if any(w not in tag_suggestions[tag]
+            for tag in DICTIONARY_TAGS)]
+        if processes and len(missing) > 1:
+            chunk_size = max(1, math.ceil(len(missing) / (4 * processes)))
+            chunks = [missing[i:i + chunk_size]
+                for i in range(0, len(missing), chunk_size)]
+            with multiprocessing.Pool(processes, _init_suggest_worker,
+                    (DICTIONARY_TAGS,)) as pool:
+                made = [s for chunk_suggestions in pool.map(_suggest_words,
+                    chunks) for s in chunk_suggestions]
+        else:
+            dicts = (self.eng_us_dict, self.eng_gb_dict)
+            made = [[d.suggest(word) for d in dicts] for word in missing]
+        for i, tag in enumerate(DICTIONARY_TAGS):
+            new_suggestions = dict((word, s[i]) for word, s in
+                zip(missing, made))
+            tag_suggestions[tag].update(new_suggestions)
+            if self.suggestion_cache is not None:
+                self.suggestion_cache.put_many(tag, new_suggestions)
+        return dict((word, set().union(*(tag_suggestions[tag][word]
+            for tag in DICTIONARY_TAGS))) for word in words)
+
+    def stats(self):
+        return {'known_words': len(self.known_words),
+            'known_word_hits': self.known_word_hits,
+            'cache': self.cache.stats()}
+
+
+# The enchant dictionaries each suggestion worker process opened.
+_worker_dicts = None
+
+
+def _init_suggest_worker(tags):
+    global _worker_dicts
+    _worker_dicts = [enchant.Dict(tag) for tag in tags]
+
+
+def _suggest_words(words):
+    return [[d.suggest(word) for d in _worker_dicts] for word in words]
+
+
+_shared_dictionary = None
+
+
+def shared_dictionary():
+    """Return the CachedDictionary shared by every spellchecker in a process."""
+    global _shared_dictionary
+    if _shared_dictionary is None:
+        _shared_dictionary = CachedDictionary()
+    return _shared_dictionary
@@ -0,0 +1,92 @@
+from nltk.tokenize import sent_tokenize
+from nltk.tag import pos_tag_sents
+from spellcheck.tokenizer import split_sentences, token_spans, words
+
+
+class Document(str):
+    """
+    A text that also holds its token spans, sentences, words and POS tags.
+
+    Tokenization happens the first time it is needed and tags are added with
+    tag_documents(), so spellcheckers given the same Document share one
+    tokenization and one tagging pass instead of each repeating them.  Words
+    and token spans are found over the whole text in one pass, so only
+    sentences and tags need the sentence tokenizer.  A
+    Document is a str, so spellcheckers that only need the text can use it
+    as one.
+    """
+
+    def __new__(cls, text):
+        """
+        Construct Document.
+
+        Params:
+            text: [string] The text.
+        """
+        document = super().__new__(cls, text)
+        document._spans = None
+        document._sentences = None
+        document._words = None
+        document.sentence_tags = None
+        return document
+
+    @property
+    def spans(self):
+        """The TokenSpan of each word."""
+        if self._spans is None:
+            self._spans = token_spans(self)
+        return self._spans
+
+    @property
+    def sentences(self):
+        """The list of words of each sentence."""
+        if self._sentences is None:
+            self._sentences = split_sentences(self.words, sent_tokenize(self))
+            self.sentence_tags = [None] * len(self._sentences)
+        return self._sentences
+
+    @property
+    def words(self):
+        """The words of all sentences, the words the spans refer to."""
+        if self._words is None:
+            self._words = words(self)
+        return self._words
+
+    def tagged_words(self):
+        """
+        Return the (word, tag) pairs of all sentences.  Words in sentences
+        that have not been tagged get the tag None.
+        """
+        return [(word, tags[i] if tags is not None else None)
+            for words, tags in zip(self.sentences, self.sentence_tags)
+            for i, word in enumerate(words)]
+
+
+def as_document(text):
+    """Return text as a Document, or text itself if it already is one."""
+    if isinstance(text, Document):
+        return text
+    return Document(text)
+
+
+def tag_documents(documents, should_tag=None):
+    """
+    POS tag the untagged sentences of documents with one pos_tag_sents call.
+
+    Params:
+        documents: [list of Documents] The documents to tag.
+        should_tag: [func] Optional function from a sentence's words to
+            whether it needs tags.  Sentences it rejects are left untagged.
+
+    Returns:
+        [int] The number of sentences tagged.
+    """
+    to_tag = [(document, i) for document in documents
+        for i, words in enumerate(document.sentences)
+        if document.sentence_tags[i] is None
+        and (should_tag is None or should_tag(words))]
+    tagged_sentences = pos_tag_sents(
+        [document.sentences[i] for document, i in to_tag])
+    for (document, i), tagged in zip(to_tag, tagged_sentences):
+        document.sentence_tags[i] = [tag for word, tag in tagged]
+    return len(to_tag)
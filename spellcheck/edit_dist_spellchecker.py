@@ -1,17 +1,31 @@
 from collections import defaultdict, Counter, deque
+from collections.abc import Sequence
+import heapq
+from itertools import count
+import math
 import string
-import enchant
-import nltk
-from nltk.tokenize import sent_tokenize
-from nltk.tag import pos_tag
 from spellcheck.spellchecker import SpellChecker, SpellingCorrection
-from spellcheck.parse_util import word_tokenize
-from spellcheck.constants import contractions
+from spellcheck.document import as_document, tag_documents
+from spellcheck.cache import LRUCache
+from spellcheck.dictionary import shared_dictionary
+from spellcheck.scoring import CandidateScorer
+from spellcheck.lexicon import TrieLexicon, build_default_lexicon
+from spellcheck.symspell import SymmetricDeleteIndex, align_edits
+
+# Lexicon words in the dictionary, keyed by the ids of the lexicon and the
+# dictionary.  See EditDistanceSpellChecker.lexicon_known_good().
+_lexicon_known_good = {}
 
 
 class EditDistanceSpellChecker(SpellChecker):
 
-    def __init__(self, error_model, lang_model):
+    ENGINES = ('recursive', 'symspell', 'beam')
+
+    def __init__(self, error_model, lang_model, lexicon=None,
+            engine='recursive', candidate_index=None, cache_size=10000,
+            num_suggestions=1, dictionary=None, tag_batch_size=64,
+            lazy_tagging=False, known_good=None, max_edits=1,
+            beam_width=100, vocabulary=()):
         """
         Construct EditDistanceSpellChecker.
 
@@ -20,17 +34,137 @@ class EditDistanceSpellChecker(SpellChecker):
                 for types of edits, P(w | c).
             lang_model: [LanguageModel] An estimated probability distribution for
                 words, P(c).
+            lexicon: [TrieLexicon] Words that candidate corrections are
+                built towards.  Pass a lexicon loaded with TrieLexicon.load to
+                share one across spellcheckers; by default one is built from
+                the nltk words corpus.
+            engine: [string] How candidates are generated.  'recursive' walks
+                every edit of the word through the lexicon.  'symspell' probes
+                a SymmetricDeleteIndex of the in-dictionary lexicon prefixes,
+                which is much faster but does not propose corrections that
+                are outside the index (such as inflections missing from the
+                lexicon).  'beam' walks the same edits as 'recursive' in order
+                of error model probability and stops after beam_width
+                candidates; see beam_edits().
+            candidate_index: [SymmetricDeleteIndex] Index to use with the
+                'symspell' engine.  Built from the lexicon if not given.
+            cache_size: [int] Number of words to cache candidates for, and
+                number of (word, tag, context) keys to cache corrections for.
+                Also bounds the scorer's tables of word and edit
+                log-probabilities.  0 disables caching.
+            num_suggestions: [int] Maximum number of ranked corrections to
+                put in each SpellingCorrection.
+            dictionary: [CachedDictionary] Dictionary to check words against.
+                Defaults to the one shared by all spellcheckers.
+            tag_batch_size: [int] Number of essays of a list spellcheck()
+                POS tags in one call.  spellcheck_iter() checks each essay
+                as soon as it arrives and tags it alone.
+            lazy_tagging: [bool] Only POS tag sentences containing a word
+                that could be corrected.  Words in other sentences get the
+                tag None, which never changes whether or how they are
+                corrected.
+            known_good: [set of strings] Words that are never corrected,
+                checked before anything else in should_correct().  Defaults
+                to the lexicon words in the dictionary and the known good
+                words of vocabulary, built the first time it is needed; see
+                build_known_good().
+            max_edits: [int] Maximum number of edits between a word and its
+                candidate corrections.
+            beam_width: [int] Number of candidates the 'beam' engine keeps
+                per word.  None keeps every candidate.
+            vocabulary: [iterable of strings] Words the lang model knows,
+                passed to build_known_good() for the default known_good.
         """
+        if engine not in self.ENGINES:
+            raise ValueError('Unknown candidate engine: %s' % engine)
         self.lang_model = lang_model
         self.error_model = error_model
-        self.eng_us_dict = enchant.Dict('en_US')
-        self.eng_gb_dict = enchant.Dict('en_GB')
-        words = set(nltk.corpus.words.words()).union(contractions)
-        self.prefixes = set(w[:i] for w in words for i in range(len(w) + 1))
+        self.compiled_error_model = error_model.compile()
+        self.dictionary = (dictionary if dictionary is not None
+            else shared_dictionary())
+        self.lexicon = lexicon if lexicon is not None else build_default_lexicon()
         self.alphabet = string.ascii_lowercase + '\''
+        self.engine = engine
+        self.max_edits = max_edits
+        self.beam_width = beam_width
+        self.candidate_index = candidate_index
+        if engine == 'symspell' and candidate_index is None:
+            self.candidate_index = self.build_candidate_index(
+                max(2, max_edits))
+        self.candidate_cache = LRUCache(cache_size)
+        self.correction_cache = LRUCache(cache_size)
+        self.scorer = CandidateScorer(lang_model, self.compiled_error_model,
+            cache_size)
+        self.num_suggestions = num_suggestions
+        self.tag_batch_size = tag_batch_size
+        self.lazy_tagging = lazy_tagging
+        self.vocabulary = vocabulary
+        self._known_good = known_good
+        self.tokens_checked = 0
+        self.known_good_hits = 0
+
+    def build_candidate_index(self, max_edits=2):
+        """
+        Index every lexicon prefix made of alphabet characters that is in the
+        dictionary.  These are the lexicon strings the recursive engine can
+        propose.
+        """
+        alphabet = set(self.alphabet)
+        words = (prefix for node, prefix in self.lexicon.prefixes()
+            if set(prefix) <= alphabet and self.in_dict(prefix))
+        return SymmetricDeleteIndex(words, max_edits)
+
+    @property
+    def known_good(self):
+        if self._known_good is None:
+            self._known_good = self.build_known_good(self.vocabulary)
+        return self._known_good
+
+    @known_good.setter
+    def known_good(self, known_good):
+        self._known_good = known_good
+
+    def lexicon_known_good(self):
+        """
+        Return the frozenset of lexicon words in the dictionary.  It is built
+        once and shared by every spellchecker with the same lexicon and
+        dictionary.
+        """
+        key = (id(self.lexicon), id(self.dictionary))
+        entry = _lexicon_known_good.get(key)
+        if entry is None:
+            # Keep the lexicon and dictionary so their ids aren't reused.
+            entry = (self.lexicon, self.dictionary, frozenset(
+                word for word in self.lexicon.words() if self.in_dict(word)))
+            _lexicon_known_good[key] = entry
+        return entry[2]
+
+    def build_known_good(self, vocabulary=()):
+        """
+        Return the frozenset of words should_correct() can reject without
+        looking at their tag or context.
+
+        Params:
+            vocabulary: [iterable of strings] Words to add to the lexicon
+                words in the dictionary if they are in the dictionary or, when
+                the lang model ignores context, common words.
+        """
+        known_good = self.lexicon_known_good()
+        # Whether a word is common only depends on it for unigram models.
+        context_free = self.lang_model.order() == 1
+        vocabulary_known_good = set(word for word in vocabulary
+            if word not in known_good and (self.in_dict(word)
+            or (context_free and self.common_word(word, ()))))
+        if not vocabulary_known_good:
+            return known_good
+        return known_good | vocabulary_known_good
 
     def should_correct(self, word, tag, context):
         """Return if a word should be corrected or not"""
+        self.tokens_checked += 1
+        if word in self.known_good:
+            self.known_good_hits += 1
+            return False
         if tag and tag == 'NNP':
             return False
         return (self.valid_format_for_correction(word)
@@ -38,9 +172,7 @@ class EditDistanceSpellChecker(SpellChecker):
                 and not self.common_word(word, context))
 
     def in_dict(self, word):
-        if word:
-            return self.eng_us_dict.check(word) or self.eng_gb_dict.check(word)
-        return False
+        return self.dictionary.check(word)
 
     def common_word(self, word, context):
         return self.lang_model.prob(word, context) > 0.0001
@@ -61,8 +193,10 @@ class EditDistanceSpellChecker(SpellChecker):
         """Get edit string from mispelled and correct character changes."""
         return misspelled + '|' + correct
 
-    def edits(self, head, tail, max_edits, edits, results):
+    def edits(self, head, tail, max_edits, edits, results,
+            node=TrieLexicon.ROOT):
         ## Based on http://norvig.com/ngrams/ ##
+        # node is the lexicon node for head
         correction = head+tail
         if self.in_dict(correction):
             edit_string = '+'.join(edits)
@@ -70,54 +204,215 @@ class EditDistanceSpellChecker(SpellChecker):
                 results[correction] = edit_string
             else:
                 results[correction] = max(
-                    results[correction], edit_string, key=self.error_model.prob)
+                    results[correction], edit_string,
+                    key=self.compiled_error_model.prob)
         if max_edits <= 0:
             return results
         # Only try insertion on extensions that are possible prefixes of words
-        extensions = [head + c for c in self.alphabet if head + c in self.prefixes]
+        children = self.lexicon.children(node)
+        extensions = [(head + c, children[c]) for c in self.alphabet
+            if c in children]
         prev_char = (head[-1] if head else '<')
         # Insertion
-        for ext in extensions:
+        for ext, ext_node in extensions:
             results = self.edits(ext, tail, max_edits - 1, edits + [
-                self.get_edit(prev_char, prev_char + ext[-1])], results)
+                self.get_edit(prev_char, prev_char + ext[-1])], results,
+                ext_node)
         if not tail:
             return results
         # Deletion
         results = self.edits(head, tail[1:], max_edits - 1,
-            edits + [self.get_edit(prev_char + tail[0], prev_char)], results)
-        for ext in extensions:
+            edits + [self.get_edit(prev_char + tail[0], prev_char)], results,
+            node)
+        for ext, ext_node in extensions:
             if ext[-1] == tail[0]: # Match
-                results = self.edits(ext, tail[1:], max_edits, edits, results)
+                results = self.edits(ext, tail[1:], max_edits, edits, results,
+                    ext_node)
             else: # Replacement
                 results = self.edits(ext, tail[1:], max_edits - 1, edits +
-                    [self.get_edit(tail[0], ext[-1])], results)
+                    [self.get_edit(tail[0], ext[-1])], results, ext_node)
         # Transpose
-        if len(tail)>=2 and tail[0]!=tail[1] and head+tail[1] in self.prefixes:
-            results = self.edits(head+tail[1], tail[0]+tail[2:], max_edits - 1,
-                edits + [self.get_edit(tail[0:2], tail[1]+tail[0])], results)
+        if len(tail)>=2 and tail[0]!=tail[1]:
+            trans_node = self.lexicon.child(node, tail[1])
+            if trans_node != TrieLexicon.NO_NODE:
+                results = self.edits(head+tail[1], tail[0]+tail[2:],
+                    max_edits - 1, edits +
+                    [self.get_edit(tail[0:2], tail[1]+tail[0])], results,
+                    trans_node)
+        return results
+
+    def beam_edits(self, word, max_edits=1, beam_width=None):
+        """
+        Return a dict of {correction: edit} pairs within max_edits of word,
+        keeping only the beam_width most probable under the error model.
+
+        This makes the same insertion, deletion, replacement and
+        transposition steps as edits(), but keeps the partial corrections in
+        a priority queue ordered by the log prob of their edits so far.
+        Matching characters is free and every edit lowers the log prob, so
+        candidates come off the queue most probable first, each with its most
+        probable edit string, and the search stops once beam_width have been
+        found.  Branches costlier than the beam_width-th best candidate seen
+        so far are never queued.  Edits the error model gives probability 0
+        are never made.
+        """
+        error_model = self.compiled_error_model
+        edit_costs = {}
+        known_words = {}
+
+        def is_word(correction):
+            known = known_words.get(correction)
+            if known is None:
+                known = known_words[correction] = self.in_dict(correction)
+            return known
+
+        results = {}
+        # The beam_width cheapest words queued so far, each at the cost it was
+        # first queued with, as a max heap of negated costs.  Each is at least
+        # the word's best cost, so the largest bounds the cost of the
+        # beam_width-th best candidate from above.
+        best_costs = []
+        queued_words = set()
+        bound = math.inf
+        # Fewest edits each (head, tail) has been expanded with.  States are
+        # popped cheapest first, so a later state with as many edits or more
+        # can't lead anywhere new.
+        expanded = {}
+        tie_breaker = count()
+        queue = [(0.0, next(tie_breaker), '', word, TrieLexicon.ROOT, ())]
+        while queue:
+            cost, _, head, tail, node, edits = heapq.heappop(queue)
+            correction = head + tail
+            if correction not in results and is_word(correction):
+                results[correction] = '+'.join(edits)
+                if beam_width and len(results) >= beam_width:
+                    break
+            if len(edits) >= max_edits:
+                continue
+            leaf = len(edits) + 1 >= max_edits
+            # Matching characters never changes head + tail, so the states
+            # along a run of matches are expanded here instead of queued.
+            while expanded.get((head, tail), max_edits + 1) > len(edits):
+                expanded[head, tail] = len(edits)
+                children = self.lexicon.children(node)
+                extensions = [(c, children[c]) for c in self.alphabet
+                    if c in children]
+                prev_char = (head[-1] if head else '<')
+                steps = [(head + c, tail, ext_node,
+                    self.get_edit(prev_char, prev_char + c))
+                    for c, ext_node in extensions]
+                if tail:
+                    steps.append((head, tail[1:], node,
+                        self.get_edit(prev_char + tail[0], prev_char)))
+                    steps.extend((head + c, tail[1:], ext_node,
+                        self.get_edit(tail[0], c))
+                        for c, ext_node in extensions if c != tail[0])
+                if len(tail) >= 2 and tail[0] != tail[1]:
+                    trans_node = self.lexicon.child(node, tail[1])
+                    if trans_node != TrieLexicon.NO_NODE:
+                        steps.append((head + tail[1], tail[0] + tail[2:],
+                            trans_node, self.get_edit(tail[0:2],
+                            tail[1] + tail[0])))
+                for next_head, next_tail, next_node, edit in steps:
+                    edit_cost = edit_costs.get(edit)
+                    if edit_cost is None:
+                        edit_cost = -error_model.edit_log_probs[
+                            error_model.intern(edit)]
+                        edit_costs[edit] = edit_cost
+                    next_cost = cost + edit_cost
+                    if next_cost == math.inf or next_cost > bound:
+                        continue
+                    next_correction = next_head + next_tail
+                    if next_correction in results:
+                        if leaf:
+                            continue
+                    elif is_word(next_correction):
+                        if beam_width and next_correction not in queued_words:
+                            queued_words.add(next_correction)
+                            heapq.heappush(best_costs, -next_cost)
+                            if len(best_costs) > beam_width:
+                                heapq.heappop(best_costs)
+                            if len(best_costs) == beam_width:
+                                bound = -best_costs[0]
+                    elif leaf:
+                        continue
+                    heapq.heappush(queue, (next_cost, next(tie_breaker),
+                        next_head, next_tail, next_node, edits + (edit,)))
+                if not tail or tail[0] not in self.alphabet:
+                    break
+                node = children.get(tail[0])
+                if node is None:
+                    break
+                head, tail = head + tail[0], tail[1:]
         return results
 
     def get_candidates(self, word, max_edits=1):
         "Return a dict of {correcion: edit} pairs within d edits of word."
-        return self.edits('', word, max_edits, [], {})
+        key = (word, max_edits)
+        candidates = self.candidate_cache.get(key)
+        if candidates is None:
+            with self.instrumentation.timer('get_candidates'):
+                if self.engine == 'symspell':
+                    candidates = self.indexed_candidates(word, max_edits)
+                elif self.engine == 'beam':
+                    candidates = self.beam_edits(word, max_edits,
+                        self.beam_width)
+                else:
+                    candidates = self.edits('', word, max_edits, [], {})
+            self.instrumentation.count('candidate_generations')
+            self.instrumentation.count('candidates_generated',
+                len(candidates))
+            self.candidate_cache.put(key, candidates)
+        # Callers modify the returned dict, so keep the cached one intact.
+        return dict(candidates)
+
+    def indexed_candidates(self, word, max_edits=1):
+        """Return get_candidates() results using the candidate index."""
+        results = {}
+        for correction in sorted(self.candidate_index.lookup(word, max_edits)):
+            edit = align_edits(word, correction, max_edits,
+                self.compiled_error_model, self.alphabet)
+            if edit is not None:
+                results[correction] = edit
+        return results
 
     def correct(self, word, tag, context):
         """Returns a correction for word."""
-        candidates = self.get_candidates(word)
+        return self.ranked_corrections(word, tag, context)[0]
+
+    def ranked_corrections(self, word, tag, context):
+        """
+        Returns up to num_suggestions corrections for word, best first.  The
+        first correction is word itself if no candidate scores higher.
+        """
+        # The tag only matters through the plural check below, and context
+        # holds exactly the n - 1 words the lang model conditions on, so the
+        # key covers everything the correction depends on.
+        key = (word, tag == 'NNS' or tag == 'NNPS', tuple(context))
+        corrections = self.correction_cache.get(key)
+        if corrections is None:
+            corrections = self.rank_candidates(word, tag, context)
+            self.correction_cache.put(key, corrections)
+        return corrections
+
+    def rank_candidates(self, word, tag, context):
+        """Return the highest scoring candidate corrections for word."""
+        candidates = self.get_candidates(word, self.max_edits)
         if word not in candidates:
             candidates[word] = ''
         # Prevent correcting plural nouns into singular nouns
         if ((tag == 'NNS' or tag == 'NNPS')
             and word[-1] == 's' and word[:-1] in candidates):
             candidates.pop(word[:-1])
-        #print(word)
-        #for c, e in candidates.items():
-        #    prob_c = self.lang_model.prob(c, context)
-        #    prob_e = self.error_model.prob(e)
-        #    print(c, prob_c, e, prob_e, prob_c * prob_e)
-        best_correction, edit = max(
-            candidates.items(), key=(lambda c: self.score_correction(c, context)))
-        return best_correction
+        k = self.num_suggestions
+        if k > 1:
+            # word itself may be among the runners up
+            k += 1
+        with self.instrumentation.timer('scoring'):
+            ranked = self.scorer.rank(candidates, context, k)
+        best_correction = ranked[0][0]
+        return [best_correction] + [c for c, e in ranked[1:]
+            if c != word][:self.num_suggestions - 1]
 
     def score_correction(self, candidate, context):
         """
@@ -137,33 +432,140 @@ class EditDistanceSpellChecker(SpellChecker):
         return self.lang_model.prob(correction, context) * self.error_model.prob(edit)
 
     def correct_with_capitalization(self, word, tag, context):
-        correction = self.correct(word.lower(), tag, context)
-        if correction and self.is_capitalized(word):
-           correction = self.capitalize(correction)
-        return correction
+        return self.corrections_with_capitalization(word, tag, context)[0]
 
-    def spellcheck(self, dataset):
-        corrections = []
-        for text in dataset:
-            sentences = sent_tokenize(text)
-            # Check quality of POS tagging
-            tagged_words = [(word, tag) for sent in sentences for
-                (word, tag) in pos_tag(word_tokenize(sent))]
-            text_corrections = []
-            context = deque([''] * (self.lang_model.order() - 1))
-            for ind, tagged_word in enumerate(tagged_words):
-                word, tag = tagged_word
-                if self.should_correct(word, tag, context):
-                    word_corrected = self.correct_with_capitalization(word, tag,
-                            context)
-                    if word_corrected != word:
-                        text_corrections.append(SpellingCorrection(ind, word,
-                            [word_corrected]))
-                if context:
-                    context.popleft()
-                    context.append(word)
-            corrections.append(text_corrections)
+    def corrections_with_capitalization(self, word, tag, context):
+        corrections = self.ranked_corrections(word.lower(), tag, context)
+        if self.is_capitalized(word):
+            corrections = [self.capitalize(c) if c else c for c in corrections]
         return corrections
 
+    def spellcheck(self, dataset):
+        """
+        Check spelling of all texts in dataset.  Lists and other sequences of
+        texts are checked tag_batch_size texts at a time so their sentences
+        can be POS tagged together; other iterables are streamed through
+        spellcheck_iter().
+        """
+        if not isinstance(dataset, Sequence):
+            return super().spellcheck(dataset)
+        dataset_corrections = []
+        for start in range(0, len(dataset), self.tag_batch_size):
+            batch = dataset[start:start + self.tag_batch_size]
+            dataset_corrections += [self.spellcheck_tagged(tagged_words)
+                for tagged_words in self.tokenize_and_tag(batch)]
+        return dataset_corrections
+
+    def spellcheck_text(self, text):
+        return self.spellcheck_tagged(self.tokenize_and_tag([text])[0])
+
+    def spellcheck_skipping(self, texts, skips):
+        """
+        Check spelling of texts without trying to correct the tokens at
+        skipped indices.  Skipped tokens still serve as context for the
+        tokens after them, so the other corrections are the same as
+        spellcheck() makes.  See SpellChecker.spellcheck_skipping.
+        """
+        return [self.spellcheck_tagged(tagged_words, skip) for tagged_words,
+            skip in zip(self.tokenize_and_tag(texts), skips)]
+
+    def needs_tagging(self, words):
+        """Return if any of the words of a sentence could be corrected."""
+        return any(word not in self.known_good
+            and self.valid_format_for_correction(word)
+            and not self.in_dict(word) for word in words)
+
+    def tokenize_and_tag(self, texts):
+        """
+        Tokenize texts and POS tag all of their sentences in one call.
+
+        Params:
+            texts: [list of strings or Documents] Texts to tag.  Sentences of
+                Documents that are already tagged are not tagged again.
+
+        Returns:
+            [list of lists of (string, string)] The (word, tag) pairs of each
+                text.  With lazy_tagging, sentences that don't need tagging
+                have the tag None.
+        """
+        instrumentation = self.instrumentation
+        documents = [as_document(text) for text in texts]
+        with instrumentation.timer('tokenize'):
+            for document in documents:
+                document.sentences
+        with instrumentation.timer('pos_tag'):
+            num_tagged = tag_documents(documents,
+                self.needs_tagging if self.lazy_tagging else None)
+        instrumentation.count('sentences_tagged', num_tagged)
+        return [document.tagged_words() for document in documents]
+
+    def spellcheck_tagged(self, tagged_words, skip=None):
+        """
+        Check spelling of a tokenized and tagged text.
+
+        Params:
+            tagged_words: [list of (string, string)] The text's (word, tag)
+                pairs, as returned by tokenize_and_tag().
+            skip: [set of ints] Indices of words not to correct.
+
+        Returns:
+            List of SpellingCorrection objects.
+        """
+        instrumentation = self.instrumentation
+        if instrumentation.enabled:
+            counts_before = self.lookup_counts()
+        text_corrections = []
+        context = deque([''] * (self.lang_model.order() - 1))
+        for ind, tagged_word in enumerate(tagged_words):
+            word, tag = tagged_word
+            if skip and ind in skip:
+                should_correct = False
+            else:
+                with instrumentation.timer('should_correct'):
+                    should_correct = self.should_correct(word, tag, context)
+            if should_correct:
+                with instrumentation.timer('correct'):
+                    corrections = self.corrections_with_capitalization(word,
+                        tag, context)
+                if corrections[0] != word:
+                    text_corrections.append(SpellingCorrection(ind, word,
+                        corrections))
+            if context:
+                context.popleft()
+                context.append(word)
+        if instrumentation.enabled:
+            instrumentation.count('tokens', len(tagged_words))
+            instrumentation.count('tokens_corrected', len(text_corrections))
+            for name, num_lookups in self.lookup_counts().items():
+                instrumentation.count(name, num_lookups - counts_before[name])
+        return text_corrections
+
+    def lookup_counts(self):
+        """Return running totals of cache and dictionary lookups."""
+        dictionary_stats = self.dictionary.stats()
+        return {
+            'candidate_cache_hits': self.candidate_cache.hits,
+            'candidate_cache_misses': self.candidate_cache.misses,
+            'correction_cache_hits': self.correction_cache.hits,
+            'correction_cache_misses': self.correction_cache.misses,
+            'dictionary_known_word_hits': dictionary_stats['known_word_hits'],
+            'dictionary_cache_hits': dictionary_stats['cache']['hits'],
+            'enchant_lookups': dictionary_stats['cache']['misses'],
+            'known_good_tokens': self.known_good_hits,
+        }
+
+    def fast_path_stats(self):
+        """Return how many checked tokens were found in known_good."""
+        return {'known_good_words': len(self.known_good),
+            'tokens': self.tokens_checked,
+            'known_good_tokens': self.known_good_hits,
+            'rate': (self.known_good_hits / self.tokens_checked
+                if self.tokens_checked else 0.0)}
+
+    def cache_stats(self):
+        """Return hit and miss counts for the candidate and correction caches."""
+        return {'candidates': self.candidate_cache.stats(),
+            'corrections': self.correction_cache.stats()}
+
     def __str__(self):
         return self.__class__.__name__
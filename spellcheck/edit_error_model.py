@@ -1,5 +1,8 @@
+import math
+from array import array
 from functools import reduce
 from operator import mul
+from spellcheck.cache import LRUCache
 
 class EditErrorModel():
     """Estimated probability distribution for edits."""
@@ -31,5 +34,107 @@ class EditErrorModel():
                 return self.prob_spelling_error * prob_edit_given_error
         raise InvalidEditException()
 
+    def log_prob(self, edit):
+        """
+        Return log P(edit), summing the logs of the single edit probabilities
+        so that composite edits don't underflow.
+        """
+        if self.valid_edit(edit):
+            if edit == '':
+                return _log(1 - self.prob_spelling_error)
+            return _log(self.prob_spelling_error) + sum(
+                _log(self.edit_pdist[e]) for e in edit.split('+'))
+        raise InvalidEditException()
+
+    def compile(self, cache_size=100000):
+        return CompiledEditErrorModel(self, cache_size)
+
+class CompiledEditErrorModel():
+    """
+    EditErrorModel with each single edit interned to an integer id.
+
+    A composite edit is a tuple of ids, and the probabilities of single edits
+    are kept in flat arrays indexed by id.  Edit strings are still accepted:
+    each distinct string is split and interned once, and its probability is
+    remembered in an LRU cache, so repeated calls are usually a dict lookup.
+    prob() multiplies in the same order as EditErrorModel.prob() and returns
+    exactly the same value.
+    """
+
+    def __init__(self, error_model, cache_size=100000):
+        """
+        Construct CompiledEditErrorModel.
+
+        Params:
+            error_model: [EditErrorModel] The model to compile.
+            cache_size: [int] Number of edit strings whose ids, prob and log
+                prob are each remembered.
+        """
+        self.edit_pdist = error_model.edit_pdist
+        self.prob_spelling_error = error_model.prob_spelling_error
+        self.log_prob_spelling_error = _log(self.prob_spelling_error)
+        self.log_prob_no_error = _log(1 - self.prob_spelling_error)
+        self.edit_ids = {}
+        self.edit_probs = array('d')
+        self.edit_log_probs = array('d')
+        for edit in self.edit_pdist:
+            self.intern(edit)
+        self.composite_ids = LRUCache(cache_size)
+        self.composite_probs = LRUCache(cache_size)
+        self.composite_log_probs = LRUCache(cache_size)
+
+    def intern(self, edit):
+        """Return the id of a single edit, assigning one if it is new."""
+        edit_id = self.edit_ids.get(edit)
+        if edit_id is None:
+            # Unknown edits get the same prob (or KeyError) edit_pdist gives.
+            prob = self.edit_pdist[edit]
+            edit_id = len(self.edit_probs)
+            self.edit_ids[edit] = edit_id
+            self.edit_probs.append(prob)
+            self.edit_log_probs.append(_log(prob))
+        return edit_id
+
+    def ids(self, edit):
+        """Return the tuple of single edit ids for an edit string or tuple."""
+        if isinstance(edit, tuple):
+            return edit
+        if edit == '':
+            return ()
+        edit_ids = self.composite_ids.get(edit)
+        if edit_ids is None:
+            edit_ids = tuple(self.intern(e) for e in edit.split('+'))
+            self.composite_ids.put(edit, edit_ids)
+        return edit_ids
+
+    def prob(self, edit):
+        """Return P(edit) for an edit string or tuple of edit ids."""
+        prob = self.composite_probs.get(edit)
+        if prob is None:
+            edit_ids = self.ids(edit)
+            if not edit_ids:
+                prob = 1 - self.prob_spelling_error
+            else:
+                prob = self.prob_spelling_error * reduce(
+                    mul, (self.edit_probs[i] for i in edit_ids))
+            self.composite_probs.put(edit, prob)
+        return prob
+
+    def log_prob(self, edit):
+        """Return log P(edit) for an edit string or tuple of edit ids."""
+        log_prob = self.composite_log_probs.get(edit)
+        if log_prob is None:
+            edit_ids = self.ids(edit)
+            if not edit_ids:
+                log_prob = self.log_prob_no_error
+            else:
+                log_prob = self.log_prob_spelling_error + sum(
+                    self.edit_log_probs[i] for i in edit_ids)
+            self.composite_log_probs.put(edit, log_prob)
+        return log_prob
+
+def _log(prob):
+    return math.log(prob) if prob > 0 else -math.inf
+
 class InvalidEditException(Exception):
     pass
@@ -0,0 +1,218 @@
+from array import array
+import numpy as np
+from spellcheck.correction_batch import CorrectionBatch
+
+EDIT_TYPES = ['insertion', 'deletion', 'substitution', 'transposition',
+    'capitalization', 'multiple', 'none']
+MAX_WORD_LENGTH = 15
+
+
+class Evaluator:
+    """
+    Scores spellchecker corrections against gold corrections with arrays.
+
+    Every correction is encoded as an integer key made from its essay index,
+    token index, misspelled word and best correction, so comparing two sets
+    of corrections is a sort and a search rather than a set of Python objects
+    per essay.  Gold corrections are encoded once and can be compared with
+    the corrections of any number of spellcheckers.
+    """
+
+    def __init__(self, gold_corrections):
+        """
+        Construct Evaluator.
+
+        Params:
+            gold_corrections: [list of lists of SpellingCorrection objects or
+                CorrectionBatch] The correct corrections for each essay.
+        """
+        self.string_ids = {}
+        self.strings = []
+        self.gold = self.encode(gold_corrections)
+
+    def intern(self, string):
+        string_id = self.string_ids.get(string)
+        if string_id is None:
+            string_id = len(self.strings)
+            self.string_ids[string] = string_id
+            self.strings.append(string)
+        return string_id
+
+    def encode(self, corrections):
+        """
+        Return a dict of int64 arrays with the essay index, token index, word
+        id and best correction id (-1 if none) of each correction.
+        """
+        if isinstance(corrections, CorrectionBatch):
+            string_ids = np.array([self.intern(s) for s in corrections.strings]
+                + [-1], dtype=np.int64)
+            first = np.array(corrections.correction_first, dtype=np.int64)
+            correction_ids = np.array(corrections.correction_ids,
+                dtype=np.int64)
+            best = np.full(len(corrections), -1, dtype=np.int64)
+            has_correction = first[:-1] < first[1:]
+            best[has_correction] = correction_ids[first[:-1][has_correction]]
+            return {
+                'essay': np.array(corrections.essays, dtype=np.int64),
+                'index': np.array(corrections.indices, dtype=np.int64),
+                'word': string_ids[np.array(corrections.words, dtype=np.int64)],
+                # -1 indexes the trailing -1, so missing corrections stay -1.
+                'correction': string_ids[best],
+            }
+        columns = dict((name, array('q')) for name in
+            ('essay', 'index', 'word', 'correction'))
+        for essay_ind, essay_corrections in enumerate(corrections):
+            for correction in essay_corrections:
+                best_correction = correction.best_correction
+                columns['essay'].append(essay_ind)
+                columns['index'].append(correction.index)
+                columns['word'].append(self.intern(correction.word))
+                columns['correction'].append(-1 if best_correction is None
+                    else self.intern(best_correction))
+        return dict((name, np.array(column, dtype=np.int64))
+            for name, column in columns.items())
+
+    def keys(self, predicted):
+        """
+        Return integer keys for the gold and predicted corrections.  Two
+        corrections have the same key when they are equal SpellingCorrections
+        in the same essay.
+        """
+        gold = self.gold
+        # Essay and token index fit in one int64, as do word and correction
+        # ids.  Ranking both over gold and predicted packs them into one key.
+        positions = np.concatenate([
+            (gold['essay'] << 32) | gold['index'],
+            (predicted['essay'] << 32) | predicted['index']])
+        pairs = np.concatenate([
+            (gold['word'] << 32) | (gold['correction'] + 1),
+            (predicted['word'] << 32) | (predicted['correction'] + 1)])
+        _, position_ranks = np.unique(positions, return_inverse=True)
+        pair_values, pair_ranks = np.unique(pairs, return_inverse=True)
+        keys = (position_ranks.astype(np.int64) * len(pair_values)
+            + pair_ranks.reshape(-1))
+        num_gold = len(gold['essay'])
+        return keys[:num_gold], keys[num_gold:]
+
+    def evaluate(self, predicted_corrections):
+        """
+        Score a spellchecker's corrections.
+
+        Params:
+            predicted_corrections: [list of lists of SpellingCorrection
+                objects or CorrectionBatch] The spellchecker's corrections for
+                each essay.
+
+        Returns:
+            [dict] 'overall' precision, recall and F1 stats, and the same
+                stats 'by_edit_type' and 'by_word_length'.  Duplicate
+                corrections count once, as in a set.
+        """
+        predicted = self.encode(predicted_corrections)
+        gold_keys, predicted_keys = self.keys(predicted)
+        gold_keys, gold_rows = np.unique(gold_keys, return_index=True)
+        predicted_keys, predicted_rows = np.unique(predicted_keys,
+            return_index=True)
+        gold_found = np.isin(gold_keys, predicted_keys, assume_unique=True)
+        result = {'overall': stats(len(gold_keys), len(predicted_keys),
+            int(gold_found.sum()))}
+        gold = dict((name, column[gold_rows])
+            for name, column in self.gold.items())
+        predicted = dict((name, column[predicted_rows])
+            for name, column in predicted.items())
+        result['by_edit_type'] = self.breakdown(EDIT_TYPES,
+            self.edit_types(gold), self.edit_types(predicted), gold_found)
+        length_labels = [str(n) for n in range(MAX_WORD_LENGTH + 1)]
+        length_labels[-1] += '+'
+        result['by_word_length'] = self.breakdown(length_labels,
+            self.word_lengths(gold), self.word_lengths(predicted),
+            gold_found)
+        return result
+
+    def breakdown(self, labels, gold_groups, predicted_groups, gold_found):
+        """
+        Return the stats of each group that has any corrections.  Correctly
+        predicted corrections are in the same group as the gold correction
+        they match.
+        """
+        num_groups = len(labels)
+        gold_counts = np.bincount(gold_groups, minlength=num_groups)
+        predicted_counts = np.bincount(predicted_groups, minlength=num_groups)
+        found_counts = np.bincount(gold_groups[gold_found],
+            minlength=num_groups)
+        return dict((label, stats(int(gold_counts[i]),
+            int(predicted_counts[i]), int(found_counts[i])))
+            for i, label in enumerate(labels)
+            if gold_counts[i] or predicted_counts[i])
+
+    def edit_types(self, corrections):
+        """Return the index in EDIT_TYPES of each correction's edit."""
+        # Edit types are computed once per distinct (word, correction) pair.
+        pairs, inverse = np.unique(
+            (corrections['word'] << 32) | (corrections['correction'] + 1),
+            return_inverse=True)
+        pair_types = np.array([EDIT_TYPES.index(edit_type(
+            self.strings[pair >> 32],
+            self.strings[(pair & 0xffffffff) - 1] if pair & 0xffffffff
+            else None)) for pair in pairs.tolist()], dtype=np.int64)
+        return pair_types[inverse.reshape(-1)]
+
+    def word_lengths(self, corrections):
+        """Return each misspelled word's length, at most MAX_WORD_LENGTH."""
+        string_lengths = np.array([len(s) for s in self.strings],
+            dtype=np.int64)
+        return np.minimum(string_lengths[corrections['word']],
+            MAX_WORD_LENGTH)
+
+
+def stats(num_gold, num_predicted, true_positives):
+    """Return precision, recall and F1 from correction counts."""
+    precision = true_positives / num_predicted if num_predicted else None
+    recall = true_positives / num_gold if num_gold else None
+    f1 = None
+    if precision and recall:
+        f1 = 2 * precision * recall / (precision + recall)
+    elif precision is not None and recall is not None:
+        f1 = 0.0
+    return {'precision': precision, 'recall': recall, 'f1': f1,
+        'gold': num_gold, 'predicted': num_predicted,
+        'true_positives': true_positives}
+
+
+def edit_type(word, correction):
+    """
+    Classify the error that turned correction into word.
+
+    Returns:
+        [string] 'insertion' if word has an extra character, 'deletion' if it
+            is missing one, 'substitution' if one character differs,
+            'transposition' if two adjacent characters are swapped,
+            'capitalization' if only case differs, 'multiple' for anything
+            else and 'none' if there is no correction or word is correct.
+    """
+    if correction is None or word == correction:
+        return 'none'
+    if word.lower() == correction.lower():
+        return 'capitalization'
+    if len(word) == len(correction) + 1:
+        return 'insertion' if _one_deletion(word, correction) else 'multiple'
+    if len(word) + 1 == len(correction):
+        return 'deletion' if _one_deletion(correction, word) else 'multiple'
+    if len(word) != len(correction):
+        return 'multiple'
+    diffs = [i for i, (a, b) in enumerate(zip(word, correction)) if a != b]
+    if len(diffs) == 1:
+        return 'substitution'
+    if (len(diffs) == 2 and diffs[1] == diffs[0] + 1
+            and word[diffs[0]] == correction[diffs[1]]
+            and word[diffs[1]] == correction[diffs[0]]):
+        return 'transposition'
+    return 'multiple'
+
+
+def _one_deletion(longer, shorter):
+    """Return if deleting one character from longer gives shorter."""
+    i = 0
+    while i < len(shorter) and longer[i] == shorter[i]:
+        i += 1
+    return longer[i + 1:] == shorter[i:]
@@ -0,0 +1,219 @@
+import math
+import time
+from collections import defaultdict
+
+
+class Instrumentation:
+    """
+    Per-stage timers and counters for spellchecking runs.
+
+    Attach one to a spellchecker with set_instrumentation().  Results are
+    accumulated across calls and can be read with as_dict(), or streamed to a
+    callback as they are recorded.
+    """
+
+    enabled = True
+
+    def __init__(self, callback=None):
+        """
+        Construct Instrumentation.
+
+        Params:
+            callback: [func] Optional function called as
+                callback(kind, name, value) for every recorded event, where
+                kind is 'timer' (value in seconds) or 'count'.
+        """
+        self.callback = callback
+        self.seconds = defaultdict(float)
+        self.calls = defaultdict(int)
+        self.counters = defaultdict(int)
+
+    def timer(self, stage):
+        """Return a context manager that times a stage."""
+        return _Timer(self, stage)
+
+    def add_time(self, stage, seconds):
+        self.seconds[stage] += seconds
+        self.calls[stage] += 1
+        if self.callback:
+            self.callback('timer', stage, seconds)
+
+    def count(self, name, n=1):
+        self.counters[name] += n
+        if self.callback:
+            self.callback('count', name, n)
+
+    def prefixed(self, prefix):
+        """
+        Return a view of this instrumentation that records counters under
+        names starting with prefix.  See PrefixedInstrumentation.
+        """
+        return PrefixedInstrumentation(self, prefix)
+
+    def reset(self):
+        self.seconds.clear()
+        self.calls.clear()
+        self.counters.clear()
+
+    def as_dict(self):
+        return {
+            'timers': dict((stage, {'seconds': self.seconds[stage],
+                'calls': self.calls[stage]}) for stage in self.seconds),
+            'counters': dict(self.counters),
+        }
+
+
+class PrefixedInstrumentation:
+    """
+    Records counters in another Instrumentation under prefixed names.
+
+    Spellcheckers combined into one share its Instrumentation through
+    prefixed views, so a counter such as 'tokens' counts each token once
+    for the combination and once per spellchecker under its own name.
+    Timers are recorded unchanged, so the time spent in a stage adds up
+    across the spellcheckers.
+    """
+
+    enabled = True
+
+    def __init__(self, instrumentation, prefix):
+        """
+        Construct PrefixedInstrumentation.
+
+        Params:
+            instrumentation: [Instrumentation] Where to record events.
+            prefix: [string] Prefix of the names counters are recorded as.
+        """
+        self.instrumentation = instrumentation
+        self.prefix = prefix
+
+    def timer(self, stage):
+        return self.instrumentation.timer(stage)
+
+    def count(self, name, n=1):
+        self.instrumentation.count(self.prefix + name, n)
+
+    def prefixed(self, prefix):
+        return PrefixedInstrumentation(self.instrumentation,
+            self.prefix + prefix)
+
+    def as_dict(self):
+        return self.instrumentation.as_dict()
+
+
+class _Timer:
+
+    def __init__(self, instrumentation, stage):
+        self.instrumentation = instrumentation
+        self.stage = stage
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.instrumentation.add_time(self.stage,
+            time.perf_counter() - self.start)
+        return False
+
+
+class NullInstrumentation:
+    """Instrumentation that records nothing.  Used when instrumentation is off."""
+
+    enabled = False
+
+    def timer(self, stage):
+        return _NULL_TIMER
+
+    def count(self, name, n=1):
+        pass
+
+    def prefixed(self, prefix):
+        return self
+
+    def as_dict(self):
+        return {'timers': {}, 'counters': {}}
+
+
+class _NullTimer:
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+NULL_INSTRUMENTATION = NullInstrumentation()
+
+
+class LatencyHistogram:
+    """
+    Histogram of latencies in exponentially growing buckets.
+
+    Bucket i counts latencies up to min_seconds * growth ** i, so a fixed
+    number of buckets covers microseconds to minutes with bounded relative
+    error, and recording a latency is a log and an increment.
+    """
+
+    def __init__(self, min_seconds=1e-5, growth=1.25, num_buckets=80):
+        """
+        Construct LatencyHistogram.
+
+        Params:
+            min_seconds: [float] Upper bound of the first bucket.
+            growth: [float] Ratio between consecutive bucket bounds.
+            num_buckets: [int] Number of buckets.  Larger latencies are
+                counted in the last one.
+        """
+        self.min_seconds = min_seconds
+        self.growth = growth
+        self.counts = [0] * num_buckets
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def bucket(self, seconds):
+        if seconds <= self.min_seconds:
+            return 0
+        i = math.ceil(math.log(seconds / self.min_seconds, self.growth))
+        return min(i, len(self.counts) - 1)
+
+    def upper_bound(self, i):
+        return self.min_seconds * self.growth ** i
+
+    def record(self, seconds):
+        self.counts[self.bucket(seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def percentile(self, p):
+        """Return the upper bound of the bucket holding the pth percentile."""
+        if not self.count:
+            return None
+        rank = math.ceil(p / 100 * self.count)
+        seen = 0
+        for i, count in enumerate(self.counts):
+            seen += count
+            if seen >= max(rank, 1):
+                return min(self.upper_bound(i), self.max)
+        return self.max
+
+    def as_dict(self):
+        """Return counts and summary statistics, in milliseconds."""
+        return {
+            'count': self.count,
+            'mean_ms': 1e3 * self.total / self.count if self.count else None,
+            'max_ms': 1e3 * self.max,
+            'p50_ms': _ms(self.percentile(50)),
+            'p90_ms': _ms(self.percentile(90)),
+            'p99_ms': _ms(self.percentile(99)),
+            'buckets': [[1e3 * self.upper_bound(i), count]
+                for i, count in enumerate(self.counts) if count],
+        }
+
+
+def _ms(seconds):
+    return None if seconds is None else 1e3 * seconds
@@ -1,9 +1,11 @@
 import argparse
-import enchant
 import numpy as np
-from collections import Counter
-from nltk import sent_tokenize
-from spellcheck.parse_util import DigitizationParser, word_tokenize
+import math
+from collections import Counter, defaultdict
+from spellcheck.parse_util import DigitizationParser
+from spellcheck import tokenizer
+from spellcheck.dictionary import shared_dictionary
+from spellcheck.symspell import deletion_variants
 from pyxdameraulevenshtein import damerau_levenshtein_distance
 from prettytable import PrettyTable
 parser = argparse.ArgumentParser(description='Cluster ngrams in a dataset.')
@@ -69,17 +71,106 @@ class DistMatrix:
         return close_words
 
 
+class NeighbourIndex:
+    """
+    Answers the same get_close_words() queries as DistMatrix without
+    computing the distance between every pair of words.
+
+    Two words within an edit distance of d of each other (counting
+    insertions, deletions, substitutions and adjacent transpositions as one
+    edit each, as in Levenshtein or optimal string alignment distance) share
+    a string that is at most d deletions away from both.  Words are indexed
+    by their deletion variants, so only words sharing a variant with the
+    query have their distance computed.
+    """
+
+    def __init__(self, words, compute_distance, max_dist=1):
+        """
+        Construct NeighbourIndex.
+
+        Params:
+            words: [list] list of words
+            compute_distance: [func] function that takes two words as arguments
+                and returns the edit distance between them.
+            max_dist: [int] The largest max_dist get_close_words() will be
+                asked for.
+        """
+        self.compute_distance = compute_distance
+        self.max_dist = max_dist
+        self.words_counter = Counter()
+        self.words = []
+        self.words_to_ind = {}
+        self.deletes = defaultdict(list)
+        self.add_words(words)
+
+    def add_words(self, words):
+        """Add occurrences of words, indexing any that are new."""
+        self.add_counts(Counter(words))
+
+    def add_counts(self, counts):
+        """
+        Add occurrences of words, indexing any that are new.
+
+        Params:
+            counts: [dict{string, int}] Dict from word to its number of new
+                occurrences.  New words are indexed in the dict's order.
+        """
+        self.words_counter.update(counts)
+        for word in counts:
+            if word not in self.words_to_ind:
+                self.words_to_ind[word] = len(self.words)
+                for variant in deletion_variants(word, self.max_dist):
+                    self.deletes[variant].append(len(self.words))
+                self.words.append(word)
+
+    def pair_to_dist(self, w1, w2):
+        return self.compute_distance(w1, w2)
+
+    def get_words(self):
+        """Get all words in index."""
+        return self.words
+
+    def get_close_words(self, word, max_dist):
+        """
+        Get all words within max_dist of given word.
+
+        The current word will be returned in the list of close words.
+
+        Params:
+            word: [string] The word to find close words to.
+            max_dist: [float] Maximum distance a word can be from given word to
+                be considered a close word.  Can't be more than the max_dist
+                the index was built with.
+
+        Returns:
+            close_words [list] List of tuples of form (close word,
+             num occurence of close word)
+        """
+        if max_dist > self.max_dist:
+            raise ValueError('Index was built for a max_dist of at most %s.' %
+                self.max_dist)
+        candidates = set()
+        for variant in deletion_variants(word, math.floor(max_dist)):
+            candidates.update(self.deletes.get(variant, ()))
+        close_words = [(word, self.words_counter[word])]
+        for ind in sorted(candidates):
+            other_word = self.words[ind]
+            if (other_word != word and
+                    self.compute_distance(word, other_word) <= max_dist):
+                close_words.append(
+                    (other_word, self.words_counter[other_word]))
+        return close_words
+
+
 class InteractiveCorrector:
 
-    def __init__(self, matrix):
+    def __init__(self, matrix, dictionary=None):
         self.d_matrix = matrix
-        self.eng_us_dict = enchant.Dict('en_US')
-        self.eng_gb_dict = enchant.Dict('en_GB')
+        self.dictionary = (dictionary if dictionary is not None
+            else shared_dictionary())
 
     def in_dict(self, word):
-        if word:
-            return self.eng_us_dict.check(word) or self.eng_gb_dict.check(word)
-        return False
+        return self.dictionary.check(word)
 
     def extract_rules(self, save_file_path=None):
         rules = {}
@@ -115,9 +206,8 @@ if __name__ == '__main__':
             args.dataset)
     dataset_words = []
     for essay in dataset:
-        sents = sent_tokenize(essay)
-        dataset_words += [w for sent in sents for w in word_tokenize(sent) if
+        dataset_words += [w for w in tokenizer.words(essay) if
                 w.isalpha() and not any([char.isupper() for char in w[1:]])]
     corrector = InteractiveCorrector(
-            DistMatrix(dataset_words, damerau_levenshtein_distance))
+            NeighbourIndex(dataset_words, damerau_levenshtein_distance))
     corrector.extract_rules(args.save_file)
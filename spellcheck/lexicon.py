@@ -0,0 +1,199 @@
+import argparse
+import mmap
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+parser = argparse.ArgumentParser(description='Compile a word list into a '
+    'trie lexicon file.')
+parser.add_argument('-o', '--output', help='Path to write the lexicon to.',
+        required=True)
+parser.add_argument('-w', '--words-file', help='Path to a newline separated '
+    'word list.  Defaults to the nltk words corpus plus contractions.')
+
+
+class TrieLexicon:
+    """
+    Array-backed trie over a word list.
+
+    Node 0 is the root.  The edges leaving node i are stored at
+    edge_labels[first_edge[i]:first_edge[i + 1]] (as code points, sorted) and
+    edge_targets[first_edge[i]:first_edge[i + 1]].  A lexicon saved with
+    save() can be memory-mapped with load(), so the pages are shared by every
+    process that loads the same file.
+    """
+
+    ROOT = 0
+    NO_NODE = -1
+    _MAGIC = b'SPLX'
+    _VERSION = 1
+    _HEADER = struct.Struct('<4sIII')
+
+    def __init__(self, first_edge, edge_labels, edge_targets, terminal,
+            path=None):
+        """
+        Construct TrieLexicon.  Use from_words() or load() instead of calling
+        this directly.
+
+        Params:
+            first_edge: [memoryview of int32] Offset of each node's first edge,
+                with one extra entry marking the end of the last node's edges.
+            edge_labels: [memoryview of uint32] Code point of each edge.
+            edge_targets: [memoryview of int32] Node each edge leads to.
+            terminal: [memoryview of uint8] 1 if a word ends at the node.
+            path: [string] File the lexicon was loaded from, if any.
+        """
+        self.first_edge = first_edge
+        self.edge_labels = edge_labels
+        self.edge_targets = edge_targets
+        self.terminal = terminal
+        self.path = path
+
+    @classmethod
+    def from_words(cls, words):
+        """Build a lexicon containing words."""
+        root = {}
+        for word in words:
+            node = root
+            for char in word:
+                node = node.setdefault(char, {})
+            node[None] = True
+        # Number the nodes breadth first so each node's edges are contiguous.
+        first_edge = array('i', [0])
+        edge_labels = array('I')
+        edge_targets = array('i')
+        terminal = array('B')
+        queue = [root]
+        for node in queue:
+            terminal.append(1 if None in node else 0)
+            for char in sorted(c for c in node if c is not None):
+                edge_labels.append(ord(char))
+                edge_targets.append(len(queue))
+                queue.append(node[char])
+            first_edge.append(len(edge_labels))
+        return cls(memoryview(first_edge), memoryview(edge_labels),
+                memoryview(edge_targets), memoryview(terminal))
+
+    @classmethod
+    def from_buffer(cls, buf, path=None):
+        """Build a lexicon backed by buf, which holds a saved lexicon."""
+        view = memoryview(buf)
+        magic, version, num_nodes, num_edges = cls._HEADER.unpack_from(view)
+        if magic != cls._MAGIC or version != cls._VERSION:
+            raise InvalidLexiconException(
+                'Not a version %s lexicon file.' % cls._VERSION)
+        offset = cls._HEADER.size
+        sections = []
+        for typecode, length in (('i', num_nodes + 1), ('I', num_edges),
+                ('i', num_edges), ('B', num_nodes)):
+            size = length * array(typecode).itemsize
+            section = view[offset:offset + size].cast(typecode)
+            if sys.byteorder == 'big' and typecode != 'B':
+                swapped = array(typecode, section)
+                swapped.byteswap()
+                section = memoryview(swapped)
+            sections.append(section)
+            offset += size
+        return cls(*sections, path=path)
+
+    @classmethod
+    def load(cls, path):
+        """Memory-map a lexicon file written by save()."""
+        with open(path, 'rb') as f:
+            buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls.from_buffer(buf, path=path)
+
+    def to_bytes(self):
+        """Serialize the lexicon to the format read by from_buffer()."""
+        chunks = [self._HEADER.pack(self._MAGIC, self._VERSION,
+            self.num_nodes, len(self.edge_labels))]
+        for section in (self.first_edge, self.edge_labels, self.edge_targets,
+                self.terminal):
+            section = array(section.format, section)
+            if sys.byteorder == 'big':
+                section.byteswap()
+            chunks.append(section.tobytes())
+        return b''.join(chunks)
+
+    def save(self, path):
+        with open(path, 'wb') as f:
+            f.write(self.to_bytes())
+
+    def __reduce__(self):
+        # Worker processes re-map the file instead of copying the arrays.
+        if self.path:
+            return (self.__class__.load, (self.path,))
+        return (self.__class__.from_buffer, (self.to_bytes(),))
+
+    @property
+    def num_nodes(self):
+        return len(self.terminal)
+
+    def child(self, node, char):
+        """Return the node reached from node by char, or NO_NODE."""
+        lo = self.first_edge[node]
+        hi = self.first_edge[node + 1]
+        code = ord(char)
+        i = bisect_left(self.edge_labels, code, lo, hi)
+        if i < hi and self.edge_labels[i] == code:
+            return self.edge_targets[i]
+        return self.NO_NODE
+
+    def children(self, node):
+        """Return a dict from each edge character leaving node to its node."""
+        lo = self.first_edge[node]
+        hi = self.first_edge[node + 1]
+        return dict(zip(map(chr, self.edge_labels[lo:hi]),
+            self.edge_targets[lo:hi]))
+
+    def find(self, prefix):
+        """Return the node for prefix, or NO_NODE if no word starts with it."""
+        node = self.ROOT
+        for char in prefix:
+            node = self.child(node, char)
+            if node == self.NO_NODE:
+                break
+        return node
+
+    def is_word(self, node):
+        return bool(self.terminal[node])
+
+    def __contains__(self, prefix):
+        """Return whether prefix is a prefix of some word in the lexicon."""
+        return self.find(prefix) != self.NO_NODE
+
+    def prefixes(self):
+        """Iterate over every prefix in the lexicon in code point order."""
+        stack = [(self.ROOT, '')]
+        while stack:
+            node, prefix = stack.pop()
+            yield node, prefix
+            stack.extend(reversed(
+                [(n, prefix + c) for c, n in self.children(node).items()]))
+
+    def words(self):
+        """Iterate over the words in the lexicon in code point order."""
+        return (prefix for node, prefix in self.prefixes()
+            if self.terminal[node])
+
+
+class InvalidLexiconException(Exception):
+    pass
+
+
+def build_default_lexicon():
+    """Build a lexicon from the nltk words corpus plus contractions."""
+    import nltk
+    from spellcheck.constants import contractions
+    return TrieLexicon.from_words(
+        set(nltk.corpus.words.words()).union(contractions))
+
+
+if __name__ == '__main__':
+    args = parser.parse_args()
+    if args.words_file:
+        with open(args.words_file) as f:
+            lexicon = TrieLexicon.from_words(set(f.read().split()))
+    else:
+        lexicon = build_default_lexicon()
+    lexicon.save(args.output)
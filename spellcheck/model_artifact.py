@@ -0,0 +1,401 @@
+import argparse
+import mmap
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from collections import Counter, defaultdict
+from pylm.lang_model import LanguageModel
+from pylm.util import mle_pdist
+from spellcheck.edit_error_model import EditErrorModel
+from spellcheck.parse_util import parse_counts
+parser = argparse.ArgumentParser(description='Compile n-gram counts and an '
+    'edit error model into a model artifact file.')
+parser.add_argument('-o', '--output', help='Path to write the artifact to.',
+        required=True)
+parser.add_argument('-w', '--word-counts', help='Path to a word counts file '
+    'to take unigram counts from.  Unigram and bigram counts are taken from '
+    'the lowercased nltk brown corpus if not given.')
+parser.add_argument('-n', '--order', help='Order of the n-grams to count '
+    'from the brown corpus, 1 or 2.', type=int, default=2, choices=(1, 2))
+parser.add_argument('-e', '--edit-counts', help='Path to an edit counts file '
+    'to build the error model from.')
+parser.add_argument('-p', '--prob-spelling-error', help='Probability of a '
+    'spelling error for the error model.', type=float, default=0.05)
+
+
+class ModelArtifact:
+    """
+    Unigram and bigram counts, and optionally an edit error model, stored in
+    flat arrays.
+
+    Words are numbered by their position in the sorted vocabulary.  The
+    bigrams starting with the word with id i are stored at
+    bigram_words[bigram_first[i]:bigram_first[i + 1]] (sorted by id) and
+    bigram_counts[bigram_first[i]:bigram_first[i + 1]].  An artifact saved
+    with save() can be memory-mapped with load(), so loading takes no time
+    and the pages are shared by every process that loads the same file.
+    """
+
+    _MAGIC = b'SPLM'
+    _VERSION = 1
+    # magic, version, order, vocabulary size, number of bigrams, number of
+    # edits, vocabulary bytes, edit bytes, total unigram count, P(error)
+    _HEADER = struct.Struct('<4sIIIIIQQQd')
+    # Sections are padded so every array starts on an 8 byte boundary.
+    _ALIGN = 8
+
+    def __init__(self, order, vocab, unigram_counts, total, bigram_first,
+            bigram_words, bigram_counts, context_totals, edits, edit_probs,
+            prob_spelling_error, path=None):
+        """
+        Construct ModelArtifact.  Use build() or load() instead of calling
+        this directly.
+
+        Params:
+            order: [int] Highest order of the stored n-grams, 1 or 2.
+            vocab: [StringTable] The sorted vocabulary.
+            unigram_counts: [memoryview of int64] Count of each word.
+            total: [int] Sum of unigram_counts.
+            bigram_first: [memoryview of int64] Offset of each word's first
+                bigram, with one extra entry marking the end of the last
+                word's bigrams.  Empty if order is 1.
+            bigram_words: [memoryview of int32] Second word of each bigram.
+            bigram_counts: [memoryview of int64] Count of each bigram.
+            context_totals: [memoryview of int64] Sum of the counts of the
+                bigrams starting with each word.  Empty if order is 1.
+            edits: [StringTable] The sorted single edits of the error model.
+            edit_probs: [memoryview of float64] P(edit|spelling error) of each
+                edit.
+            prob_spelling_error: [float] The probability that a spelling
+                error occurs in text, or 0 if there is no error model.
+            path: [string] File the artifact was loaded from, if any.
+        """
+        self.order = order
+        self.vocab = vocab
+        self.unigram_counts = unigram_counts
+        self.total = total
+        self.bigram_first = bigram_first
+        self.bigram_words = bigram_words
+        self.bigram_counts = bigram_counts
+        self.context_totals = context_totals
+        self.edits = edits
+        self.edit_probs = edit_probs
+        self.prob_spelling_error = prob_spelling_error
+        self.path = path
+        self.ids = {}
+
+    @classmethod
+    def build(cls, unigram_counts, bigram_counts=None, edit_pdist=None,
+            prob_spelling_error=0.0):
+        """
+        Build an artifact from counts.
+
+        Params:
+            unigram_counts: [dict{string, int}] Count of each word.
+            bigram_counts: [dict{(string, string), int}] Count of each pair
+                of words.  The first word may be a padding word that is not
+                in unigram_counts.  The artifact has order 1 if not given.
+            edit_pdist: [dict{string, float}] Dict from a single edit to
+                P(edit|spelling error), as passed to EditErrorModel.
+            prob_spelling_error: [float] The probability that a spelling
+                error occurs in text.
+        """
+        words = set(unigram_counts)
+        if bigram_counts:
+            for context, word in bigram_counts:
+                words.add(context)
+                words.add(word)
+        vocab = StringTable.from_strings(words)
+        ids = dict((word, i) for i, word in enumerate(vocab))
+        unigrams = array('q', (unigram_counts.get(word, 0) for word in vocab))
+        bigram_first = array('q')
+        bigram_words = array('i')
+        bigrams = array('q')
+        context_totals = array('q')
+        order = 1
+        if bigram_counts:
+            order = 2
+            by_context = defaultdict(list)
+            for (context, word), count in bigram_counts.items():
+                by_context[ids[context]].append((ids[word], count))
+            for context_id in range(len(vocab)):
+                bigram_first.append(len(bigram_words))
+                pairs = sorted(by_context.get(context_id, ()))
+                bigram_words.extend(word_id for word_id, count in pairs)
+                bigrams.extend(count for word_id, count in pairs)
+                context_totals.append(sum(count for word_id, count in pairs))
+            bigram_first.append(len(bigram_words))
+        edit_pdist = edit_pdist or {}
+        edits = StringTable.from_strings(edit_pdist)
+        edit_probs = array('d', (edit_pdist[edit] for edit in edits))
+        return cls(order, vocab, memoryview(unigrams), sum(unigrams),
+            memoryview(bigram_first), memoryview(bigram_words),
+            memoryview(bigrams), memoryview(context_totals), edits,
+            memoryview(edit_probs), prob_spelling_error)
+
+    @classmethod
+    def from_buffer(cls, buf, path=None):
+        """Build an artifact backed by buf, which holds a saved artifact."""
+        view = memoryview(buf)
+        (magic, version, order, vocab_size, num_bigrams, num_edits,
+            vocab_bytes, edit_bytes, total,
+            prob_spelling_error) = cls._HEADER.unpack_from(view)
+        if magic != cls._MAGIC or version != cls._VERSION:
+            raise InvalidArtifactException(
+                'Not a version %s model artifact file.' % cls._VERSION)
+        num_contexts = vocab_size if order > 1 else 0
+        layout = [('I', vocab_size + 1), ('B', vocab_bytes),
+            ('q', vocab_size), ('q', num_contexts + 1 if num_contexts else 0),
+            ('i', num_bigrams), ('q', num_bigrams), ('q', num_contexts),
+            ('I', num_edits + 1), ('B', edit_bytes), ('d', num_edits)]
+        offset = _padded(cls._HEADER.size)
+        sections = []
+        for typecode, length in layout:
+            size = length * array(typecode).itemsize
+            section = view[offset:offset + size].cast(typecode)
+            if sys.byteorder == 'big' and typecode != 'B':
+                swapped = array(typecode, section)
+                swapped.byteswap()
+                section = memoryview(swapped)
+            sections.append(section)
+            offset += _padded(size)
+        (vocab_offsets, vocab_blob, unigrams, bigram_first, bigram_words,
+            bigrams, context_totals, edit_offsets, edit_blob,
+            edit_probs) = sections
+        return cls(order, StringTable(vocab_offsets, vocab_blob), unigrams,
+            total, bigram_first, bigram_words, bigrams, context_totals,
+            StringTable(edit_offsets, edit_blob), edit_probs,
+            prob_spelling_error, path=path)
+
+    @classmethod
+    def load(cls, path):
+        """Memory-map an artifact file written by save()."""
+        with open(path, 'rb') as f:
+            buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls.from_buffer(buf, path=path)
+
+    def to_bytes(self):
+        """Serialize the artifact to the format read by from_buffer()."""
+        chunks = [self._HEADER.pack(self._MAGIC, self._VERSION, self.order,
+            len(self.vocab), len(self.bigram_words), len(self.edits),
+            len(self.vocab.blob), len(self.edits.blob), self.total,
+            self.prob_spelling_error)]
+        for section in (self.vocab.offsets, self.vocab.blob,
+                self.unigram_counts, self.bigram_first, self.bigram_words,
+                self.bigram_counts, self.context_totals, self.edits.offsets,
+                self.edits.blob, self.edit_probs):
+            chunks.append(b'\0' * (_padded(len(chunks[-1])) - len(chunks[-1])))
+            section = array(section.format, section)
+            if sys.byteorder == 'big':
+                section.byteswap()
+            chunks.append(section.tobytes())
+        return b''.join(chunks)
+
+    def save(self, path):
+        with open(path, 'wb') as f:
+            f.write(self.to_bytes())
+
+    def __reduce__(self):
+        # Worker processes re-map the file instead of copying the arrays.
+        if self.path:
+            return (self.__class__.load, (self.path,))
+        return (self.__class__.from_buffer, (self.to_bytes(),))
+
+    def word_id(self, word):
+        """Return the id of word, or None if it is not in the vocabulary."""
+        try:
+            return self.ids[word]
+        except KeyError:
+            word_id = self.vocab.index(word)
+            # Only vocabulary words are cached, so arbitrary text can't grow
+            # the cache beyond the size of the vocabulary.
+            if word_id is not None:
+                self.ids[word] = word_id
+            return word_id
+
+    def words(self):
+        """Iterate over the words with a unigram count."""
+        return (word for word, count in zip(self.vocab, self.unigram_counts)
+            if count)
+
+    def unigram_prob(self, word):
+        word_id = self.word_id(word)
+        if word_id is None or not self.total:
+            return 0.0
+        return self.unigram_counts[word_id] / self.total
+
+    def bigram_prob(self, word, context):
+        """Return P(word | context) where context is the previous word."""
+        context_id = self.word_id(context)
+        word_id = self.word_id(word)
+        if context_id is None or word_id is None:
+            return 0.0
+        lo = self.bigram_first[context_id]
+        hi = self.bigram_first[context_id + 1]
+        i = bisect_left(self.bigram_words, word_id, lo, hi)
+        if i < hi and self.bigram_words[i] == word_id:
+            return self.bigram_counts[i] / self.context_totals[context_id]
+        return 0.0
+
+    def ngram_model(self, order=None):
+        """Return an MLE n-gram model of order 1 or 2 over the counts."""
+        return ArtifactNgramModel(self, order or self.order)
+
+    def interpolation_model(self, weights):
+        """
+        Return a bigram model interpolated with the unigram model.
+
+        Params:
+            weights: [list of floats] Weight of the bigram and of the unigram
+                probability, in that order.
+        """
+        return ArtifactInterpolationModel(self, weights)
+
+    def error_model(self):
+        """Return the EditErrorModel stored in the artifact."""
+        if not self.prob_spelling_error:
+            raise InvalidArtifactException('Artifact has no error model.')
+        # The edit table is small, so it is copied into a dict for speed.
+        return EditErrorModel(defaultdict(int, zip(self.edits,
+            self.edit_probs)), self.prob_spelling_error)
+
+    def stats(self):
+        return {'order': self.order, 'words': len(self.vocab),
+            'bigrams': len(self.bigram_words), 'edits': len(self.edits)}
+
+
+class ArtifactNgramModel(LanguageModel):
+    """MLE n-gram model backed by a ModelArtifact."""
+
+    def __init__(self, artifact, order):
+        if order > artifact.order:
+            raise ValueError('Artifact only has n-grams up to order %s.' %
+                artifact.order)
+        self.artifact = artifact
+        self.n = order
+
+    def order(self):
+        return self.n
+
+    def prob(self, word, context):
+        if self.n == 1:
+            return self.artifact.unigram_prob(word)
+        return self.artifact.bigram_prob(word, context[-1])
+
+
+class ArtifactInterpolationModel(LanguageModel):
+    """Bigram model interpolated with a unigram model, backed by a ModelArtifact."""
+
+    def __init__(self, artifact, weights):
+        if artifact.order < 2:
+            raise ValueError('Artifact has no bigrams.')
+        self.artifact = artifact
+        self.weights = weights
+
+    def order(self):
+        return 2
+
+    def prob(self, word, context):
+        return (self.weights[0] * self.artifact.bigram_prob(word, context[-1])
+            + self.weights[1] * self.artifact.unigram_prob(word))
+
+
+class StringTable:
+    """Sorted strings stored as utf-8 in one blob with an array of offsets."""
+
+    def __init__(self, offsets, blob):
+        """
+        Params:
+            offsets: [memoryview of uint32] Start of each string in blob, with
+                one extra entry marking the end of the last string.
+            blob: [memoryview of bytes] The encoded strings.
+        """
+        self.offsets = offsets
+        self.blob = blob
+
+    @classmethod
+    def from_strings(cls, strings):
+        offsets = array('I', [0])
+        chunks = []
+        # utf-8 preserves code point order, so the blob is sorted too.
+        for string in sorted(strings):
+            chunks.append(string.encode('utf-8'))
+            offsets.append(offsets[-1] + len(chunks[-1]))
+        return cls(memoryview(offsets),
+            memoryview(bytearray(b''.join(chunks))))
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def encoded(self, i):
+        return bytes(self.blob[self.offsets[i]:self.offsets[i + 1]])
+
+    def __getitem__(self, i):
+        return self.encoded(i).decode('utf-8')
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+    def index(self, string):
+        """Return the position of string, or None if it is not stored."""
+        encoded = string.encode('utf-8')
+        lo, hi = 0, len(self)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.encoded(mid) < encoded:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < len(self) and self.encoded(lo) == encoded:
+            return lo
+        return None
+
+
+class InvalidArtifactException(Exception):
+    pass
+
+
+def _padded(size):
+    align = ModelArtifact._ALIGN
+    return (size + align - 1) // align * align
+
+
+def count_ngrams(sents, order=2):
+    """
+    Count the unigrams, and bigrams if order is 2, in sents.  Each sentence
+    is padded with the '' word the spellcheckers use as initial context.
+    """
+    unigrams = Counter()
+    bigrams = Counter()
+    for sent in sents:
+        unigrams.update(sent)
+        if order > 1:
+            bigrams.update(zip([''] + sent[:-1], sent))
+    return unigrams, bigrams
+
+
+def build_artifact(word_counts_file=None, order=2, edit_counts_file=None,
+        prob_spelling_error=0.05):
+    """Build the artifact described by the command line options."""
+    if word_counts_file:
+        unigrams, bigrams = parse_counts(file_name=word_counts_file), None
+    else:
+        import nltk
+        unigrams, bigrams = count_ngrams(
+            ([w.lower() for w in sent] for sent in nltk.corpus.brown.sents()),
+            order)
+    edit_pdist = None
+    if edit_counts_file:
+        edit_pdist = mle_pdist(parse_counts(file_name=edit_counts_file,
+            encoding='ISO-8859-1'))
+    else:
+        prob_spelling_error = 0.0
+    return ModelArtifact.build(unigrams, bigrams, edit_pdist,
+        prob_spelling_error)
+
+
+if __name__ == '__main__':
+    args = parser.parse_args()
+    build_artifact(args.word_counts, args.order, args.edit_counts,
+        args.prob_spelling_error).save(args.output)
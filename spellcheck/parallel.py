@@ -0,0 +1,100 @@
+import math
+import multiprocessing
+
+# The spellchecker each worker process was initialized with.
+_worker_spellchecker = None
+
+
+def init_worker(spellchecker):
+    """
+    Initialize a worker process to run spellcheck_shard() with spellchecker.
+    Pass it as the initializer of a process pool.
+    """
+    global _worker_spellchecker
+    _worker_spellchecker = spellchecker
+
+
+def spellcheck_shard(shard):
+    """Spellcheck a list of texts in a worker set up by init_worker()."""
+    return _worker_spellchecker.spellcheck(shard)
+
+
+def parallel_spellcheck(spellchecker, dataset, processes=None,
+        shard_size=None):
+    """
+    Spellcheck dataset by sharding its essays across a pool of processes.
+
+    Each worker receives the spellchecker once, when it starts, rather than
+    with every shard.  On platforms that fork, workers share the parent's
+    language model, error model and memory-mapped lexicon pages without
+    pickling them at all.
+
+    Params:
+        spellchecker: [SpellChecker] The spellchecker to run.
+        dataset: [list of strings] List of texts in data.
+        processes: [int] Number of worker processes.  Defaults to the number
+            of CPUs.
+        shard_size: [int] Number of essays sent to a worker at a time.
+            Defaults to splitting the dataset into four shards per worker.
+
+    Returns:
+        List of lists of SpellingCorrection objects, in the order of dataset
+            and identical to spellchecker.spellcheck(dataset).
+    """
+    dataset = list(dataset)
+    if processes is None:
+        processes = multiprocessing.cpu_count()
+    if shard_size is None:
+        shard_size = max(1, math.ceil(len(dataset) / (4 * processes)))
+    shards = [dataset[i:i + shard_size]
+        for i in range(0, len(dataset), shard_size)]
+    with multiprocessing.Pool(processes, init_worker,
+            (spellchecker,)) as pool:
+        shard_corrections = pool.map(spellcheck_shard, shards)
+    return [essay_corrections for corrections in shard_corrections
+        for essay_corrections in corrections]
+
+
+# The spellcheckers and dataset forked workers run configurations from.
+_worker_configs = None
+
+
+def _spellcheck_config(i):
+    spellcheckers, dataset = _worker_configs
+    return spellcheckers[i].spellcheck_batch(dataset)
+
+
+def spellcheck_concurrently(spellcheckers, dataset, processes=None):
+    """
+    Run several spellcheckers over the same dataset at once, one per process.
+
+    Workers are forked, so they inherit the spellcheckers and dataset
+    (including any tokens and tags already computed for Documents in it)
+    without pickling them, and only the columnar results are sent back.
+    Where fork isn't available the spellcheckers run one after another.
+
+    Params:
+        spellcheckers: [list of SpellCheckers] The spellcheckers to run.
+        dataset: [list of strings or Documents] List of texts in data.
+        processes: [int] Number of worker processes.  Defaults to one per
+            spellchecker, up to the number of CPUs.
+
+    Returns:
+        List with each spellchecker's list of lists of SpellingCorrection
+            objects, as returned by spellcheck(dataset).
+    """
+    global _worker_configs
+    dataset = list(dataset)
+    if 'fork' not in multiprocessing.get_all_start_methods():
+        return [spellchecker.spellcheck(dataset)
+            for spellchecker in spellcheckers]
+    if processes is None:
+        processes = min(len(spellcheckers), multiprocessing.cpu_count())
+    _worker_configs = (spellcheckers, dataset)
+    try:
+        with multiprocessing.get_context('fork').Pool(processes) as pool:
+            batches = pool.map(_spellcheck_config, range(len(spellcheckers)),
+                chunksize=1)
+    finally:
+        _worker_configs = None
+    return [batch.to_lists(len(dataset)) for batch in batches]
@@ -1,6 +1,9 @@
 from spellcheck.spellchecker import SpellingCorrection
+from spellcheck import tokenizer
 import re
 
+TAG_RE = re.compile(r'<([^>]*)>')
+
 class DigitizationParser:
 
     def __init__(self, end_of_essay='# # # # # # #'):
@@ -29,7 +32,7 @@ class DigitizationParser:
         """
         corrections = []
         for correction in essay_metadata[2:]:
-            index, word, correction = list(self._split_string(correction, ','))
+            index, word, correction = correction.split(',')
             index = int(index)
             corrections.append(SpellingCorrection(index, word, [correction]))
         return corrections
@@ -39,18 +42,33 @@ class DigitizationParser:
         Parse essay text and SpellingCorrection objs out of each digitization.
         """
         essays = []
-        corrections = []
-        with open(file_name) as data_file:
-            lines = data_file.read().splitlines()
-            essays_with_metadata = list(self._split(lines, self.end_of_essay))
-            essays = []
-            essay_corrections = []
-            for e in essays_with_metadata[:-1]:
-                essay_text = re.sub(r'<([^>]*)>', r'\1', e[1])
-                essays.append(essay_text)
-                essay_corrections.append(self._parse_correction(e))
+        essay_corrections = []
+        for essay_text, corrections in self.iter_digitization(file_name):
+            essays.append(essay_text)
+            essay_corrections.append(corrections)
         return essays, essay_corrections
 
+    def iter_digitization(self, file_name):
+        """
+        Parse digitizations one at a time while reading the file line by line,
+        so memory use is bounded by the largest essay rather than the file.
+
+        Yields:
+            (essay text, list of SpellingCorrection objects) for each essay.
+        """
+        with open(file_name) as data_file:
+            essay_metadata = []
+            for file_line in data_file:
+                # Split on the same line boundaries as str.splitlines().
+                for line in file_line.splitlines():
+                    if line == self.end_of_essay:
+                        yield (TAG_RE.sub(r'\1', essay_metadata[1]),
+                            self._parse_correction(essay_metadata))
+                        essay_metadata = []
+                    else:
+                        essay_metadata.append(line)
+            # Anything after the last end of essay marker is not an essay.
+
 def parse_counts(file_name, sep='\t', encoding=None):
     """
     Parse frequency counts from file.
@@ -73,12 +91,6 @@ def parse_counts(file_name, sep='\t', encoding=None):
 
 def word_tokenize(sent):
     """
-    Split sentence into words.
+    Split sentence into words.  See spellcheck.tokenizer.
     """
-    words = []
-    for word in sent.split():
-        if (len(word) > 1 and word[-1] in '.?!,'):
-            words.append(word[:-1])
-        else:
-            words.append(word)
-    return words
+    return tokenizer.words(sent)
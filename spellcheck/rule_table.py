@@ -0,0 +1,101 @@
+import json
+from spellcheck.correction_batch import CorrectionBatch
+from spellcheck.spellchecker import SpellingCorrection
+from spellcheck.tokenizer import TRAILING_PUNCTUATION
+
+
+class RuleTable:
+    """
+    A mapping from misspellings to corrections, applied to raw text.
+
+    Tokens are found with a single str.split() over the whole text, and a
+    token's trailing punctuation is stripped the same way spellcheck.tokenizer
+    strips it, so token indices match the ones spellcheckers get from
+    Document without running the sentence tokenizer.  The table refers to
+    the rules dict it was built from rather than copying it, so it always
+    applies the current rules.
+    """
+
+    FORMAT = 'spellcheck-rules'
+    VERSION = 1
+
+    def __init__(self, rules=None):
+        """
+        Construct RuleTable.
+
+        Params:
+            rules: [dict{string, string}] Dict from misspelling to correction.
+        """
+        self.rules = rules if rules is not None else {}
+
+    def apply(self, text):
+        """
+        Return a SpellingCorrection for every token of text with a rule.
+        """
+        rules = self.rules
+        corrections = []
+        for i, token in enumerate(text.split()):
+            correction = rules.get(token)
+            if correction is None:
+                if len(token) < 2 or token[-1] not in TRAILING_PUNCTUATION:
+                    continue
+                token = token[:-1]
+                correction = rules.get(token)
+                if correction is None:
+                    continue
+            corrections.append(SpellingCorrection(i, token, [correction]))
+        return corrections
+
+    def apply_batch(self, texts):
+        """
+        Apply the rules to every text.
+
+        Returns:
+            [CorrectionBatch] The corrections made to every text, built
+                without creating a SpellingCorrection per correction.
+        """
+        rules = self.rules
+        batch = CorrectionBatch()
+        append = batch.append
+        for essay_ind, text in enumerate(texts):
+            for i, token in enumerate(text.split()):
+                correction = rules.get(token)
+                if correction is None:
+                    if (len(token) < 2
+                            or token[-1] not in TRAILING_PUNCTUATION):
+                        continue
+                    token = token[:-1]
+                    correction = rules.get(token)
+                    if correction is None:
+                        continue
+                append(essay_ind, i, token, (correction,))
+        return batch
+
+    def __len__(self):
+        return len(self.rules)
+
+    def to_json(self):
+        return json.dumps({'format': self.FORMAT, 'version': self.VERSION,
+            'rules': self.rules}, ensure_ascii=False, separators=(',', ':'))
+
+    @classmethod
+    def from_json(cls, text):
+        state = json.loads(text)
+        if (not isinstance(state, dict) or state.get('format') != cls.FORMAT
+                or state.get('version') != cls.VERSION):
+            raise InvalidRuleTableException(
+                'Not a version %s rule table.' % cls.VERSION)
+        return cls(state['rules'])
+
+    def save(self, path):
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(self.to_json())
+
+    @classmethod
+    def load(cls, path):
+        with open(path, encoding='utf-8') as f:
+            return cls.from_json(f.read())
+
+
+class InvalidRuleTableException(Exception):
+    pass
@@ -0,0 +1,133 @@
+import math
+import numpy as np
+
+
+class LogProbTable:
+    """
+    Interns keys to integer ids and stores their log-probabilities.
+
+    The table is cleared once it holds max_size keys, so it stays bounded
+    however many distinct keys it sees.
+    """
+
+    def __init__(self, key_log_prob, max_size=100000):
+        """
+        Construct LogProbTable.
+
+        Params:
+            key_log_prob: [func] Function from a key to its log-probability.
+                It is called once per distinct key while the key is in the
+                table.
+            max_size: [int] Number of keys after which the table is cleared.
+        """
+        self.key_log_prob = key_log_prob
+        self.max_size = max_size
+        self.ids = {}
+        self.log_probs = np.empty(256)
+
+    def clear(self):
+        self.ids = {}
+
+    def add(self, key):
+        key_id = len(self.ids)
+        if key_id == len(self.log_probs):
+            self.log_probs = np.resize(self.log_probs, 2 * key_id)
+        self.log_probs[key_id] = self.key_log_prob(key)
+        self.ids[key] = key_id
+        return key_id
+
+    def key_ids(self, keys):
+        """Return an array with the id of each key."""
+        # Only clear between calls, so the ids of one call stay valid.
+        if len(self.ids) >= self.max_size:
+            self.clear()
+        ids = self.ids
+        return np.fromiter(
+            (ids[key] if key in ids else self.add(key) for key in keys),
+            dtype=np.intp, count=len(keys))
+
+    def lookup(self, keys):
+        """Return an array with the log-probability of each key."""
+        # Interning can grow log_probs, so get the ids before indexing it.
+        ids = self.key_ids(keys)
+        return self.log_probs[ids]
+
+
+class CandidateScorer:
+    """
+    Ranks candidate corrections by log P(c) + log P(w | c) with NumPy.
+
+    Edit strings, and words when the lang model ignores context, are interned
+    to integer ids whose log-probabilities are computed once, so ranking a
+    token's candidates is an array gather, an add and an argmax.  Edit
+    log-probabilities are sums of the log-probabilities of single edits, so
+    composite edits don't underflow the way multiplying their probabilities
+    does.
+    """
+
+    def __init__(self, lang_model, error_model, cache_size=100000):
+        """
+        Construct CandidateScorer.
+
+        Params:
+            lang_model: [LanguageModel] Estimated distribution for words, P(c).
+            error_model: [EditErrorModel or CompiledEditErrorModel] Estimated
+                distribution for edits.
+            cache_size: [int] Number of edit strings, and of words, whose
+                log-probabilities are kept before the tables are cleared.
+        """
+        self.lang_model = lang_model
+        self.error_model = error_model
+        self.edit_table = LogProbTable(error_model.log_prob, cache_size)
+        self.word_table = None
+        if lang_model.order() == 1:
+            self.word_table = LogProbTable(
+                lambda word: log_prob(lang_model.prob(word, ())), cache_size)
+
+    def lang_model_log_probs(self, corrections, context):
+        if self.word_table is not None:
+            return self.word_table.lookup(corrections)
+        return np.fromiter(
+            (log_prob(self.lang_model.prob(c, context)) for c in corrections),
+            dtype=float, count=len(corrections))
+
+    def scores(self, candidates, context):
+        """
+        Score candidate corrections.
+
+        Params:
+            candidates: [list of (string, string)] (correction, edit string)
+                pairs.
+            context: [deque] The n - 1 words before the word being corrected.
+
+        Returns:
+            [numpy array] The log score of each candidate.
+        """
+        return (self.lang_model_log_probs([c for c, e in candidates], context)
+            + self.edit_table.lookup([e for c, e in candidates]))
+
+    def rank(self, candidates, context, k=1):
+        """
+        Return the k best (correction, edit string) pairs, best first.
+
+        Candidates with equal scores keep their order in candidates, so the
+        best candidate is the same one max() over the candidates would pick.
+
+        Params:
+            candidates: [dict{string, string}] Dict from correction to edit
+                string, as returned by get_candidates().
+            context: [deque] The n - 1 words before the word being corrected.
+            k: [int] Number of candidates to return.
+        """
+        items = list(candidates.items())
+        scores = self.scores(items, context)
+        if k == 1:
+            return [items[int(np.argmax(scores))]]
+        order = np.argsort(-scores, kind='stable')[:k]
+        return [items[i] for i in order]
+
+
+def log_prob(prob):
+    if prob <= 0:
+        return -math.inf
+    return math.log(prob)
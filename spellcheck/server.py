@@ -0,0 +1,299 @@
+"""
+Serve a spellchecker over TCP or a Unix socket.
+
+Clients send one JSON object per line and get one JSON object per line back:
+
+    {"id": 1, "text": "I lik Python."}
+    -> {"id": 1, "corrections": [{"index": 1, "word": "lik",
+        "corrections": ["like"]}], "latency_ms": 3.2}
+    {"id": 2, "stats": true}
+    -> {"id": 2, "stats": {...}}
+
+Requests may be pipelined on one connection, and responses come back as they
+finish, so clients should match them up by id.
+"""
+import argparse
+import asyncio
+import concurrent.futures
+import json
+import time
+from spellcheck.instrumentation import LatencyHistogram
+from spellcheck.parallel import init_worker, spellcheck_shard
+parser = argparse.ArgumentParser(description='Serve a spellchecker.')
+parser.add_argument('-c', '--config', help='Name of the spellchecker '
+    'configuration to serve.', default='1-gram Word Counts')
+parser.add_argument('--host', help='Host to listen on.', default='127.0.0.1')
+parser.add_argument('--port', help='Port to listen on.', type=int,
+    default=8765)
+parser.add_argument('-u', '--unix', help='Path of a Unix socket to listen on '
+    'instead of a TCP port.')
+parser.add_argument('-b', '--max-batch-size', help='Most texts to spellcheck '
+    'in one call.', type=int, default=32)
+parser.add_argument('-t', '--max-delay-ms', help='Longest time to wait for '
+    'more requests to fill a batch.', type=float, default=2)
+parser.add_argument('--max-line-bytes', help='Longest request line to '
+    'accept.  Longer requests get an error response.', type=int,
+    default=2**20)
+parser.add_argument('-p', '--processes', help='Number of worker processes to '
+    'spellcheck in.  Spellchecks in one background thread if not given.',
+    type=int)
+parser.add_argument('-e', '--edit-counts', help='Path to edit counts file.',
+        default='../edit_counts.txt')
+parser.add_argument('-w', '--word-counts', help='Path to word counts file.',
+        default='../word_counts.txt')
+parser.add_argument('-l', '--lexicon', help='Path to a compiled lexicon file.')
+parser.add_argument('--corpus-artifact', help='Path to a compiled brown '
+    'corpus model artifact.')
+parser.add_argument('--word-counts-artifact', help='Path to a compiled word '
+    'counts model artifact.')
+
+
+class SpellcheckServer:
+    """
+    Answers spellcheck requests, grouping concurrent ones into batches.
+
+    Requests are queued, and a batcher task takes up to max_batch_size of them
+    at a time, waiting at most max_delay for a batch to fill, and runs one
+    spellcheck() call per batch in an executor so the event loop keeps
+    accepting requests while it runs.
+    """
+
+    def __init__(self, spellchecker, max_batch_size=32, max_delay=0.002,
+            processes=None, max_line_bytes=2**20):
+        """
+        Construct SpellcheckServer.
+
+        Params:
+            spellchecker: [SpellChecker] The spellchecker to serve.
+            max_batch_size: [int] Most texts to spellcheck in one call.
+            max_delay: [float] Longest time in seconds to wait for more
+                requests after the first one of a batch arrives.
+            processes: [int] Number of worker processes to spellcheck in, each
+                running one batch at a time.  By default batches run one at a
+                time in a background thread.
+            max_line_bytes: [int] Longest request line to read.  Longer
+                requests are skipped and get an error response.
+        """
+        self.spellchecker = spellchecker
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self.max_line_bytes = max_line_bytes
+        if processes:
+            self.executor = concurrent.futures.ProcessPoolExecutor(processes,
+                initializer=init_worker, initargs=(spellchecker,))
+            self.spellcheck = spellcheck_shard
+        else:
+            # Spellcheckers aren't thread safe, so use a single thread.
+            self.executor = concurrent.futures.ThreadPoolExecutor(1)
+            self.spellcheck = spellchecker.spellcheck
+        self.concurrency = processes or 1
+        self.queue = None
+        self.batcher = None
+        self.latency = LatencyHistogram()
+        self.queue_latency = LatencyHistogram()
+        self.batch_latency = LatencyHistogram()
+        self.num_requests = 0
+        self.num_batches = 0
+        self.num_errors = 0
+
+    async def start(self, host='127.0.0.1', port=8765, unix_path=None):
+        """
+        Start serving.
+
+        Returns:
+            [asyncio.Server] The listening server.
+        """
+        self.queue = asyncio.Queue()
+        self.batcher = asyncio.ensure_future(self.run_batches())
+        if unix_path:
+            return await asyncio.start_unix_server(self.handle_connection,
+                unix_path, limit=self.max_line_bytes)
+        return await asyncio.start_server(self.handle_connection, host, port,
+            limit=self.max_line_bytes)
+
+    async def close(self):
+        if self.batcher:
+            self.batcher.cancel()
+            try:
+                await self.batcher
+            except asyncio.CancelledError:
+                pass
+        self.executor.shutdown()
+
+    async def spellcheck_text(self, text):
+        """Return the corrections for text once its batch has run."""
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((text, time.perf_counter(), future))
+        return await future
+
+    async def next_batch(self):
+        batch = [await self.queue.get()]
+        deadline = time.perf_counter() + self.max_delay
+        while len(batch) < self.max_batch_size:
+            timeout = deadline - time.perf_counter()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def run_batches(self):
+        slots = asyncio.Semaphore(self.concurrency)
+        while True:
+            batch = await self.next_batch()
+            await slots.acquire()
+            task = asyncio.ensure_future(self.run_batch(batch))
+            task.add_done_callback(lambda _: slots.release())
+
+    async def run_batch(self, batch):
+        start = time.perf_counter()
+        for _, queued, _ in batch:
+            self.queue_latency.record(start - queued)
+        self.num_batches += 1
+        try:
+            results = await self.run_texts([text for text, _, _ in batch])
+        except Exception as e:
+            if len(batch) > 1:
+                # Retry the texts one at a time so one bad text only fails
+                # its own request.
+                for request in batch:
+                    await self.retry(request)
+            elif not batch[0][2].done():
+                batch[0][2].set_exception(e)
+            return
+        self.batch_latency.record(time.perf_counter() - start)
+        for (_, _, future), corrections in zip(batch, results):
+            if not future.done():
+                future.set_result(corrections)
+
+    async def run_texts(self, texts):
+        """Return the corrections for texts from one call in the executor."""
+        return await asyncio.get_running_loop().run_in_executor(
+            self.executor, self.spellcheck, texts)
+
+    async def retry(self, request):
+        """
+        Spellcheck the text of one request from a failed batch on its own.
+        Retries are not counted as batches or in the latency stats.
+        """
+        text, _, future = request
+        try:
+            corrections = (await self.run_texts([text]))[0]
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+            return
+        if not future.done():
+            future.set_result(corrections)
+
+    async def handle_connection(self, reader, writer):
+        pending = set()
+        try:
+            while True:
+                try:
+                    line = await reader.readuntil(b'\n')
+                except asyncio.IncompleteReadError as e:
+                    # The connection ended, possibly after a last line
+                    # without a newline.
+                    line = e.partial
+                    if not line.strip():
+                        break
+                except asyncio.LimitOverrunError:
+                    await self.skip_line(reader)
+                    self.num_errors += 1
+                    await self.write_response(writer, {'error':
+                        'Request longer than %d bytes' % self.max_line_bytes,
+                        'id': None})
+                    continue
+                except ConnectionError:
+                    break
+                if not line.strip():
+                    continue
+                task = asyncio.ensure_future(self.respond(line, writer))
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+        finally:
+            if pending:
+                await asyncio.wait(pending)
+            writer.close()
+
+    async def skip_line(self, reader):
+        """Discard the rest of a line too long to read."""
+        while True:
+            try:
+                await reader.readuntil(b'\n')
+                return
+            except asyncio.LimitOverrunError as e:
+                await reader.readexactly(e.consumed)
+            except asyncio.IncompleteReadError:
+                return
+
+    async def respond(self, line, writer):
+        start = time.perf_counter()
+        request_id = None
+        try:
+            request = json.loads(line.decode('utf-8'))
+            request_id = request.get('id')
+            if request.get('stats'):
+                response = {'stats': self.stats()}
+            else:
+                text = request['text']
+                if not isinstance(text, str):
+                    raise TypeError('text must be a string')
+                self.num_requests += 1
+                corrections = await self.spellcheck_text(text)
+                latency = time.perf_counter() - start
+                self.latency.record(latency)
+                response = {'corrections': [{'index': c.index,
+                    'word': c.word, 'corrections': c.corrections}
+                    for c in corrections], 'latency_ms': 1e3 * latency}
+        except Exception as e:
+            self.num_errors += 1
+            response = {'error': '%s: %s' % (e.__class__.__name__, e)}
+        response['id'] = request_id
+        await self.write_response(writer, response)
+
+    async def write_response(self, writer, response):
+        try:
+            writer.write(json.dumps(response).encode('utf-8') + b'\n')
+            await writer.drain()
+        except ConnectionError:
+            # The client disconnected, so there is no one to respond to.
+            writer.close()
+
+    def stats(self):
+        return {
+            'requests': self.num_requests,
+            'errors': self.num_errors,
+            'batches': self.num_batches,
+            'mean_batch_size': (self.num_requests / self.num_batches
+                if self.num_batches else None),
+            'latency': self.latency.as_dict(),
+            'queue_latency': self.queue_latency.as_dict(),
+            'batch_latency': self.batch_latency.as_dict(),
+        }
+
+
+async def serve(spellchecker, args):
+    server = SpellcheckServer(spellchecker, args.max_batch_size,
+        args.max_delay_ms / 1e3, args.processes, args.max_line_bytes)
+    listener = await server.start(args.host, args.port, args.unix)
+    print('Serving %s on %s' % (args.config,
+        args.unix or '%s:%s' % (args.host, args.port)))
+    try:
+        await listener.serve_forever()
+    finally:
+        await server.close()
+
+
+if __name__ == '__main__':
+    from spellcheck.spellchecker_stats import SpellCheckerConfigs
+    args = parser.parse_args()
+    # Rules of the cluster configurations are learned from a dataset, which a
+    # server doesn't have, so they start with no rules.
+    spellchecker = SpellCheckerConfigs([], args.edit_counts, args.word_counts,
+        args.lexicon, args.corpus_artifact,
+        args.word_counts_artifact).build(args.config)
+    asyncio.run(serve(spellchecker, args))
@@ -1,8 +1,11 @@
-from operator import xor
+from spellcheck.parallel import parallel_spellcheck
+from spellcheck.instrumentation import NULL_INSTRUMENTATION
 
 class SpellChecker:
     """Abstract class for SpellChecker"""
 
+    instrumentation = NULL_INSTRUMENTATION
+
     def __init__(self, dataset):
         """
         Params:
@@ -10,17 +13,100 @@ class SpellChecker:
         """
         pass
 
-    def spellcheck(self):
+    def spellcheck(self, dataset):
         """
         Check spelling of all texts in dataset.
 
         Returns:
             List of lists of SpellingCorrection objects.
         """
+        return [corrections for _, corrections in self.spellcheck_iter(dataset)]
+
+    def spellcheck_iter(self, texts):
+        """
+        Check spelling of texts one at a time.
+
+        Params:
+            texts: [iterable of strings] Texts to check.  This can be any
+                iterable, such as a generator reading essays from a file, and
+                is consumed lazily.
+
+        Yields:
+            (essay index, list of SpellingCorrection objects) for each text,
+                as soon as the text has been checked.
+        """
+        for essay_ind, text in enumerate(texts):
+            yield essay_ind, self.spellcheck_text(text)
+
+    def spellcheck_text(self, text):
+        """
+        Check spelling of a single text.
+
+        Returns:
+            List of SpellingCorrection objects.
+        """
         pass
 
+    def spellcheck_skipping(self, texts, skips):
+        """
+        Check spelling of texts, leaving alone the tokens whose indices are
+        in the matching set of skips.
+
+        By default every token is checked and corrections at skipped indices
+        are dropped.  Spellcheckers that can avoid the work for skipped tokens
+        override this.
+
+        Params:
+            texts: [list of strings] Texts to check.
+            skips: [list of sets of ints] Token indices to skip in each text.
+
+        Returns:
+            List of lists of SpellingCorrection objects.
+        """
+        return [[c for c in self.spellcheck_text(text) if c.index not in skip]
+            for text, skip in zip(texts, skips)]
+
+    def set_instrumentation(self, instrumentation):
+        """
+        Record per-stage timings and counters of later spellcheck calls.
+
+        Params:
+            instrumentation: [Instrumentation] Where to record them.  Pass
+                None to turn instrumentation off again.
+        """
+        if instrumentation is None:
+            instrumentation = NULL_INSTRUMENTATION
+        self.instrumentation = instrumentation
+
+    def spellcheck_batch(self, texts):
+        """
+        Check spelling of texts and collect the results in columns.
+
+        Returns:
+            [CorrectionBatch] The corrections made to every text.
+        """
+        from spellcheck.correction_batch import CorrectionBatch
+        batch = CorrectionBatch()
+        for essay_ind, corrections in self.spellcheck_iter(texts):
+            batch.extend(essay_ind, corrections)
+        return batch
+
+    def parallel_spellcheck(self, dataset, processes=None, shard_size=None):
+        """
+        Check spelling of all texts in dataset using a pool of processes.
+
+        See spellcheck.parallel.parallel_spellcheck for the params.
+
+        Returns:
+            The same list of lists of SpellingCorrection objects as
+                spellcheck(dataset).
+        """
+        return parallel_spellcheck(self, dataset, processes, shard_size)
+
 class SpellingCorrection:
 
+    __slots__ = ('index', 'word', 'corrections')
+
     def __init__(self, index, word, corrections):
         """
         Constructor for SpellingCorrection.
@@ -45,13 +131,16 @@ class SpellingCorrection:
         return 'Incorrect word: %s at index %s.  Corrections: %s' % (self.word,
                 self.index, self.corrections)
 
+    def key(self):
+        """Return (index, word, best correction), which identifies it."""
+        return (self.index, self.word,
+            self.corrections[0] if self.corrections else None)
+
     def __eq__(self, other):
-        return (self.index == other.index and self.word == other.word and
-                self.best_correction == other.best_correction)
+        return self.key() == other.key()
 
     def __ne__(self, other):
         return not self.__eq__(other)
 
     def __hash__(self):
-        return xor(hash(self.index), xor(hash(self.word),
-            hash(self.best_correction)))
+        return hash(self.key())
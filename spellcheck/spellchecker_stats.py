@@ -1,58 +1,78 @@
-from collections import defaultdict
 import nltk
-from nltk.tokenize import word_tokenize, sent_tokenize
 from prettytable import PrettyTable
-import enchant
 from spellcheck.edit_dist_spellchecker import EditDistanceSpellChecker
 from spellcheck.cluster_spellchecker import ClusterSpellChecker
 from spellcheck.combined_spellchecker import CombinedSpellChecker
 from spellcheck.parse_util import DigitizationParser, parse_counts
 from spellcheck.edit_error_model import EditErrorModel
+from spellcheck.evaluation import Evaluator
+from spellcheck.lexicon import TrieLexicon, build_default_lexicon
+from spellcheck.model_artifact import ModelArtifact
+from spellcheck.dictionary import shared_dictionary
+from spellcheck.suggestion_cache import SuggestionCache
+from spellcheck.document import Document, tag_documents
+from spellcheck.parallel import spellcheck_concurrently
 from spellcheck.dummy_lang_model import DummyLanguageModel
 from pylm.util import mle_pdist, mle_cpd, ngram_cfd
-from pylm.lang_model import NgramModel, InterpolationModel, CachedModel
+from pylm.lang_model import NgramModel, InterpolationModel
 import argparse
 parser = argparse.ArgumentParser(description='Compare Spellcheckers on a '
     'dataset')
 parser.add_argument('-d', '--dataset', help='Path to dataset file.',
         required=True)
 parser.add_argument('-f', '--save-file', help='Path to file to save stats to.')
+parser.add_argument('-l', '--lexicon', help='Path to a lexicon file compiled '
+    'with lexicon.py.  Built from the nltk words corpus if not given.')
+parser.add_argument('-c', '--corpus-artifact', help='Path to a model artifact '
+    'compiled with model_artifact.py from the brown corpus, used instead of '
+    'counting the corpus.  Its error model is used if it has one.')
+parser.add_argument('-w', '--word-counts-artifact', help='Path to a model '
+    'artifact compiled with model_artifact.py from the word counts file.')
+parser.add_argument('-b', '--breakdown', action='store_true', help='Also '
+    'show stats by edit type and by word length.')
+parser.add_argument('-j', '--jobs', type=int, help='Number of spellchecker '
+    'configurations to run at once, each in its own process.')
+parser.add_argument('-p', '--processes', type=int, help='Number of processes '
+    'to spellcheck the dataset with.  Runs in a single process if not given.')
+parser.add_argument('-s', '--suggestion-cache', help='Path to a sqlite file '
+    'to keep dictionary suggestions in between runs.')
+parser.add_argument('--suggest-processes', type=int, help='Number of '
+    'processes to make dictionary suggestions in when learning rules.')
 
 
-def compute_stats(dataset_corrections, spellchecker_corrections):
+def compute_stats(dataset_corrections, spellchecker_corrections,
+        evaluator=None):
     """
-    Calculate precision and recall.
+    Calculate precision, recall and F1.
 
     Params:
-        dataset_corrections: [list of SpellingCorrection objects] The
-            SpellCheckers to test
+        dataset_corrections: [list of lists of SpellingCorrection objects] The
+            correct corrections for each essay.
+        spellchecker_corrections: [list of lists of SpellingCorrection
+            objects] The corrections a spellchecker made to each essay.
+        evaluator: [Evaluator] Evaluator built from dataset_corrections, to
+            reuse across spellcheckers.
     """
-    positives = 0
-    true_positives = 0
-    false_negatives = 0
-    for (dataset_essay_corrections, spellchecker_essay_corrections) in zip(
-            dataset_corrections, spellchecker_corrections):
-        dataset_essay_corrections = set(dataset_essay_corrections)
-        spellchecker_essay_corrections = set(spellchecker_essay_corrections)
-        positives += len(spellchecker_essay_corrections)
-        true_positives += len(
-                dataset_essay_corrections.intersection(
-                    spellchecker_essay_corrections))
-        false_negatives += len(
-                dataset_essay_corrections.difference(
-                    spellchecker_essay_corrections))
-    if positives == 0:
-        return ['N/A', 'N/A']
-    return [true_positives/positives,
-            true_positives/(true_positives+false_negatives)]
+    if evaluator is None:
+        evaluator = Evaluator(dataset_corrections)
+    overall = evaluator.evaluate(spellchecker_corrections)['overall']
+    return format_stats(overall)
+
+
+def format_stats(stats):
+    if not stats['predicted']:
+        return ['N/A', 'N/A', 'N/A']
+    return [s if s is not None else 'N/A'
+        for s in (stats['precision'], stats['recall'], stats['f1'])]
 
 
 def display_corrections(spellchecker_name, spellchecker_corrections,
         dataset_corrections, save_file=None):
     t = PrettyTable(['Essay #', 'Index', 'Word', 'Correction', 'Correct?'])
     for (essay_ind, essay_corrections) in enumerate(spellchecker_corrections):
+        gold_corrections = set(dataset_corrections[essay_ind])
         for correction in essay_corrections:
-            is_correct = (correction in dataset_corrections[essay_ind])
+            is_correct = (correction in gold_corrections)
             t.add_row([essay_ind, correction.index, correction.word,
                 correction.best_correction, is_correct])
     print('%s Corrections' % spellchecker_name)
@@ -63,8 +83,26 @@ def display_corrections(spellchecker_name, spellchecker_corrections,
             print(t, file=f)
 
 
+def display_breakdown(spellchecker_name, result, save_file=None):
+    """Display a spellchecker's stats by edit type and by word length."""
+    for breakdown, column in (('by_edit_type', 'Edit Type'),
+            ('by_word_length', 'Word Length')):
+        t = PrettyTable([column, 'Gold', 'Predicted', 'Precision', 'Recall',
+            'F1'])
+        for label, stats in result[breakdown].items():
+            t.add_row([label, stats['gold'], stats['predicted']] +
+                format_stats(stats))
+        print('%s Stats by %s' % (spellchecker_name, column))
+        print(t)
+        if save_file:
+            with open(save_file, 'a') as f:
+                print('%s Stats by %s' % (spellchecker_name, column), file=f)
+                print(t, file=f)
+
+
 def display_spellchecker_stats(dataset, dataset_corrections, spellcheckers,
-        spellchecker_names, save_file=None):
+        spellchecker_names, save_file=None, processes=None, breakdown=False,
+        jobs=None):
     """
     Display statistics for the performance of different spellcheckers.
 
@@ -76,17 +114,38 @@ def display_spellchecker_stats(dataset, dataset_corrections, spellcheckers,
         spellchecker_names: [list of strings] Names to display for
             Spellcheckers.
         save_file: [string] Path to file to save stats to.
+        processes: [int] Number of processes to spellcheck the dataset with.
+        breakdown: [bool] Also display stats by edit type and word length.
+        jobs: [int] Number of spellcheckers to run at once, each in its own
+            process.  Spellcheckers run one after another if not given.
     """
     assert(len(spellcheckers) == len(spellchecker_names))
     display_corrections('Golden Standard', dataset_corrections,
             dataset_corrections, save_file)
-    stats_t = PrettyTable(['SpellChecker', 'Precision', 'Recall'])
-    for spellchecker, spellchecker_name in zip(spellcheckers, spellchecker_names):
-        spellchecker_corrections = spellchecker.spellcheck(dataset)
+    evaluator = Evaluator(dataset_corrections)
+    stats_t = PrettyTable(['SpellChecker', 'Precision', 'Recall', 'F1'])
+    # Every spellchecker gets the same Documents, so the dataset is tokenized
+    # and tagged once.
+    documents = [Document(text) for text in dataset]
+    if jobs:
+        # Tag before forking so every worker inherits the tags.
+        tag_documents(documents)
+        all_corrections = spellcheck_concurrently(spellcheckers, documents,
+            jobs)
+    elif processes:
+        all_corrections = (spellchecker.parallel_spellcheck(documents,
+            processes) for spellchecker in spellcheckers)
+    else:
+        all_corrections = (spellchecker.spellcheck(documents)
+            for spellchecker in spellcheckers)
+    for spellchecker_name, spellchecker_corrections in zip(
+            spellchecker_names, all_corrections):
         display_corrections(spellchecker_name, spellchecker_corrections,
             dataset_corrections, save_file)
-        next_row = [spellchecker_name] + compute_stats(dataset_corrections,
-            spellchecker_corrections)
+        result = evaluator.evaluate(spellchecker_corrections)
+        if breakdown:
+            display_breakdown(spellchecker_name, result, save_file)
+        next_row = [spellchecker_name] + format_stats(result['overall'])
         stats_t.add_row(next_row)
     print(stats_t)
     if save_file:
@@ -99,84 +158,190 @@ def get_word_counts_model(word_counts_file):
     word_counts_cpd = mle_cpd(word_counts_cfd)
     return NgramModel(word_counts_cpd, 1)
 
-def create_cache_from_dataset(dataset):
-    eng_us_dict = enchant.Dict('en_US')
-    eng_gb_dict = enchant.Dict('en_GB')
-    words = defaultdict(lambda: defaultdict(int))
-    for text in dataset:
-        for sent in sent_tokenize(text):
-            for w in word_tokenize(sent):
-                if eng_us_dict.check(w) or eng_gb_dict.check(w):
-                    words[()][w] += 1
-    return NgramModel(mle_cpd(words), 1)
-
 def corpus_lowercase_sents(corpus):
     for sent in corpus.sents():
         sent = [w.lower() for w in sent]
         yield sent
 
+class SpellCheckerConfigs:
+    """
+    Builds the spellchecker configurations compared by this script.  Models
+    are built the first time a configuration needs them and are shared by
+    every configuration built afterwards.
+    """
+
+    NAMES = [
+        'Dummy',
+        'Edit Cluster',
+        'Suggest Cluster',
+        '1-gram Word Counts',
+        'Cluster + 1-gram Word Counts',
+        '1-gram Brown Corpus',
+        'Cluster + 1-gram Brown Corpus',
+        'Interpolated 2-gram Brown Corpus',
+        'Cluster + Interpolated 2-gram Brown Corpus',
+    #    '2-gram Brown Corpus',
+    ]
+
+    def __init__(self, dataset, edit_counts_file='../edit_counts.txt',
+            word_counts_file='../word_counts.txt', lexicon_file=None,
+            corpus_artifact_file=None, word_counts_artifact_file=None,
+            suggest_processes=None):
+        """
+        Construct SpellCheckerConfigs.
+
+        Params:
+            dataset: [list of strings] The essays rules are learned from.
+            edit_counts_file: [string] Path to the edit counts file.
+            word_counts_file: [string] Path to the word counts file.
+            lexicon_file: [string] Path to a compiled lexicon file.  The
+                lexicon is built from the nltk words corpus if not given.
+            corpus_artifact_file: [string] Path to a ModelArtifact with the
+                brown corpus counts.  Counted from nltk if not given.
+            word_counts_artifact_file: [string] Path to a ModelArtifact with
+                the word counts.  Parsed from word_counts_file if not given.
+            suggest_processes: [int] Number of processes to make dictionary
+                suggestions in when learning rules.
+        """
+        self.dataset = dataset
+        self.edit_counts_file = edit_counts_file
+        self.word_counts_file = word_counts_file
+        self.lexicon_file = lexicon_file
+        self.corpus_artifact_file = corpus_artifact_file
+        self.word_counts_artifact_file = word_counts_artifact_file
+        self.suggest_processes = suggest_processes
+        self.built = {}
+
+    def get(self, key, build):
+        if key not in self.built:
+            self.built[key] = build()
+        return self.built[key]
+
+    def artifact(self, path):
+        return self.get(('artifact', path), lambda: ModelArtifact.load(path))
+
+    def error_model(self):
+        def build():
+            for path in (self.corpus_artifact_file,
+                    self.word_counts_artifact_file):
+                if path and self.artifact(path).prob_spelling_error:
+                    return self.artifact(path).error_model()
+            return EditErrorModel(mle_pdist(parse_counts(
+                file_name=self.edit_counts_file, encoding='ISO-8859-1')), 0.05)
+        return self.get('error_model', build)
+
+    def lexicon(self):
+        def build():
+            if self.lexicon_file:
+                lexicon = TrieLexicon.load(self.lexicon_file)
+            else:
+                lexicon = build_default_lexicon()
+            # Most lookups are for lexicon words, so answer those without
+            # enchant.
+            shared_dictionary().preload(lexicon.words())
+            return lexicon
+        return self.get('lexicon', build)
+
+    def word_counts_model(self):
+        if self.word_counts_artifact_file:
+            return self.artifact(self.word_counts_artifact_file).ngram_model(1)
+        return self.get('word_counts_model',
+            lambda: get_word_counts_model(self.word_counts_file))
+
+    def word_counts_vocabulary(self):
+        if self.word_counts_artifact_file:
+            return self.artifact(self.word_counts_artifact_file).words()
+        return self.get('word_counts_vocabulary', lambda: list(
+            parse_counts(file_name=self.word_counts_file)))
+
+    def corpus_model(self, order):
+        """Return the unigram or interpolated bigram brown corpus model."""
+        if self.corpus_artifact_file:
+            artifact = self.artifact(self.corpus_artifact_file)
+            if order == 1:
+                return artifact.ngram_model(1)
+            return artifact.interpolation_model([0.75, 0.25])
+        if order == 1:
+            return NgramModel(self.corpus_cpd(), 1)
+        return InterpolationModel(self.corpus_cpd(), 2, [0.75, 0.25])
+
+    def corpus_vocabulary(self):
+        if self.corpus_artifact_file:
+            return self.artifact(self.corpus_artifact_file).words()
+        return self.get('corpus_vocabulary', lambda: set(
+            w.lower() for w in nltk.corpus.brown.words()))
+
+    def corpus_cpd(self):
+        return self.get('corpus_cpd', lambda: mle_cpd(
+            ngram_cfd(corpus_lowercase_sents(nltk.corpus.brown), 2)))
+
+    def edit_spellchecker(self, name, build_lang_model, vocabulary=None):
+        """
+        Return an EditDistanceSpellChecker.  If given, vocabulary returns the
+        words the lang model knows, whose common words are added to the
+        spellchecker's known good words.
+        """
+        def build():
+            return EditDistanceSpellChecker(self.error_model(),
+                build_lang_model(), self.lexicon(),
+                vocabulary=vocabulary() if vocabulary else ())
+        return self.get(name, build)
+
+    def edit_cluster_spellchecker(self):
+        def build():
+            spellchecker = ClusterSpellChecker()
+            spellchecker.save_edit1_rules(self.dataset)
+            return spellchecker
+        return self.get('Edit Cluster', build)
+
+    def suggest_cluster_spellchecker(self):
+        def build():
+            spellchecker = ClusterSpellChecker()
+            spellchecker.save_suggested_rules(self.dataset,
+                self.suggest_processes)
+            return spellchecker
+        return self.get('Suggest Cluster', build)
+
+    def build(self, name):
+        """Return the spellchecker configuration called name."""
+        edit_1_wc = lambda: self.edit_spellchecker('1-gram Word Counts',
+            self.word_counts_model, self.word_counts_vocabulary)
+        edit_1_brown = lambda: self.edit_spellchecker('1-gram Brown Corpus',
+            lambda: self.corpus_model(1), self.corpus_vocabulary)
+        edit_2_brown = lambda: self.edit_spellchecker(
+            'Interpolated 2-gram Brown Corpus', lambda: self.corpus_model(2))
+        builders = {
+            'Dummy': lambda: self.edit_spellchecker('Dummy',
+                DummyLanguageModel),
+            'Edit Cluster': self.edit_cluster_spellchecker,
+            'Suggest Cluster': self.suggest_cluster_spellchecker,
+            '1-gram Word Counts': edit_1_wc,
+            'Cluster + 1-gram Word Counts': lambda: CombinedSpellChecker(
+                [self.edit_cluster_spellchecker(), edit_1_wc()], cascade=True),
+            '1-gram Brown Corpus': edit_1_brown,
+            'Cluster + 1-gram Brown Corpus': lambda: CombinedSpellChecker(
+                [self.edit_cluster_spellchecker(), edit_1_brown()],
+                cascade=True),
+            'Interpolated 2-gram Brown Corpus': edit_2_brown,
+            'Cluster + Interpolated 2-gram Brown Corpus':
+                lambda: CombinedSpellChecker(
+                    [self.edit_cluster_spellchecker(), edit_2_brown()],
+                    cascade=True),
+        }
+        return builders[name]()
+
 if __name__ == '__main__':
     args = parser.parse_args()
     dataset, dataset_corrections = DigitizationParser().parse_digitization(
             args.dataset)
-    error_model = EditErrorModel(
-        mle_pdist(parse_counts(file_name='../edit_counts.txt',
-            encoding='ISO-8859-1')), 0.05)
-    cache_unigram_model = create_cache_from_dataset(dataset)
-    dummy_lang_model = DummyLanguageModel()
-    cache_weight = 0.4
-    word_counts_model = get_word_counts_model('../word_counts.txt')
-    word_counts_cached_model= CachedModel(
-        word_counts_model, cache_unigram_model, cache_weight)
-    corpus_cpd = mle_cpd(
-        ngram_cfd(corpus_lowercase_sents(nltk.corpus.brown), 2))
-    corpus_unigram_model = NgramModel(corpus_cpd, 1)
-    corpus_bigram_model = NgramModel(corpus_cpd, 2)
-    corpus_interpolation_model = InterpolationModel(corpus_cpd, 2, [0.75, 0.25])
-    corpus_cached_unigram_model = CachedModel(
-        corpus_unigram_model, cache_unigram_model, cache_weight)
-    corpus_cached_bigram_model = CachedModel(
-        corpus_bigram_model, cache_unigram_model, cache_weight)
-    corpus_cached_interpolation_model = CachedModel(
-        corpus_interpolation_model, cache_unigram_model, cache_weight)
-    edit_cluster_spellchecker = ClusterSpellChecker()
-    edit_cluster_spellchecker.save_edit1_rules(dataset)
-    suggest_cluster_spellchecker = ClusterSpellChecker()
-    suggest_cluster_spellchecker.save_suggested_rules(dataset)
-    edit1_wc_spellchecker = EditDistanceSpellChecker(
-        error_model, word_counts_model)
-    edit_1_brown_sc = EditDistanceSpellChecker(error_model, corpus_unigram_model)
-    edit_2_brown_sc = EditDistanceSpellChecker(error_model, corpus_interpolation_model)
+    if args.suggestion_cache:
+        shared_dictionary().suggestion_cache = SuggestionCache(
+            args.suggestion_cache)
+    configs = SpellCheckerConfigs(dataset, lexicon_file=args.lexicon,
+        corpus_artifact_file=args.corpus_artifact,
+        word_counts_artifact_file=args.word_counts_artifact,
+        suggest_processes=args.suggest_processes)
     display_spellchecker_stats(dataset, dataset_corrections,
-        [
-            EditDistanceSpellChecker(error_model, dummy_lang_model),
-            edit_cluster_spellchecker,
-            suggest_cluster_spellchecker,
-            edit1_wc_spellchecker,
-            CombinedSpellChecker([edit_cluster_spellchecker, edit1_wc_spellchecker]),
-            edit_1_brown_sc,
-            CombinedSpellChecker([edit_cluster_spellchecker, edit_1_brown_sc]),
-            edit_2_brown_sc,
-            CombinedSpellChecker([edit_cluster_spellchecker, edit_2_brown_sc])
-        #    EditDistanceSpellChecker(error_model, corpus_bigram_model),
-        #    EditDistanceSpellChecker(error_model, word_counts_cached_model),
-        #    EditDistanceSpellChecker(error_model, corpus_cached_unigram_model),
-        #    EditDistanceSpellChecker(error_model, corpus_cached_bigram_model),
-        #    EditDistanceSpellChecker(error_model, corpus_cached_interpolation_model)
-        ],
-        [
-            'Dummy',
-            'Edit Cluster',
-            'Suggest Cluster',
-            '1-gram Word Counts',
-            'Cluster + 1-gram Word Counts',
-            '1-gram Brown Corpus',
-            'Cluster + 1-gram Brown Corpus',
-            'Interpolated 2-gram Brown Corpus',
-            'Cluster + Interpolated 2-gram Brown Corpus',
-        #    '2-gram Brown Corpus',
-        #    '1-gram Word Counts Cached',
-        #    'Cached 1-gram Brown Corpus',
-        #    'Cached 2-gram Brown Corpus',
-        #    'Cached Interpolated 2-gram Brown Corpus'
-        ], args.save_file)
+        [configs.build(name) for name in SpellCheckerConfigs.NAMES],
+        SpellCheckerConfigs.NAMES, args.save_file, args.processes,
+        args.breakdown, args.jobs)
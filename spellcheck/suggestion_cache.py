@@ -0,0 +1,74 @@
+import json
+import sqlite3
+
+
+class SuggestionCache:
+    """
+    Dictionary suggestions kept on disk in a sqlite database.
+
+    Suggestions are keyed by (dictionary tag, word) and never change for a
+    given dictionary, so a cache shared between runs means enchant only has
+    to make suggestions for words no earlier run has seen.
+    """
+
+    # sqlite limits the number of parameters in one statement.
+    _MAX_PARAMS = 500
+
+    def __init__(self, path):
+        """
+        Construct SuggestionCache.
+
+        Params:
+            path: [string] Path of the sqlite database.  Created if it doesn't
+                exist.
+        """
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        with self.connection:
+            self.connection.execute('CREATE TABLE IF NOT EXISTS suggestions ('
+                'dictionary TEXT NOT NULL, word TEXT NOT NULL, '
+                'suggestions TEXT NOT NULL, PRIMARY KEY (dictionary, word))')
+        self.hits = 0
+        self.misses = 0
+
+    def __reduce__(self):
+        # Connections can't be pickled, so other processes reopen the file.
+        return (self.__class__, (self.path,))
+
+    def get_many(self, dictionary, words):
+        """
+        Return a dict from each of words with cached suggestions from
+        dictionary to its list of suggestions.
+        """
+        words = list(words)
+        found = {}
+        for i in range(0, len(words), self._MAX_PARAMS):
+            chunk = words[i:i + self._MAX_PARAMS]
+            rows = self.connection.execute('SELECT word, suggestions FROM '
+                'suggestions WHERE dictionary = ? AND word IN (%s)' %
+                ', '.join('?' * len(chunk)), [dictionary] + chunk)
+            found.update((word, json.loads(suggestions))
+                for word, suggestions in rows)
+        self.hits += len(found)
+        self.misses += len(words) - len(found)
+        return found
+
+    def put_many(self, dictionary, suggestions):
+        """
+        Cache suggestions, a dict from word to the list of suggestions
+        dictionary makes for it.
+        """
+        with self.connection:
+            self.connection.executemany('INSERT OR REPLACE INTO suggestions '
+                'VALUES (?, ?, ?)', ((dictionary, word, json.dumps(s))
+                for word, s in suggestions.items()))
+
+    def __len__(self):
+        return self.connection.execute(
+            'SELECT COUNT(*) FROM suggestions').fetchone()[0]
+
+    def close(self):
+        self.connection.close()
+
+    def stats(self):
+        return {'size': len(self), 'hits': self.hits, 'misses': self.misses}
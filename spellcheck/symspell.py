@@ -0,0 +1,121 @@
+from collections import defaultdict
+
+
+class SymmetricDeleteIndex:
+    """
+    Index from deletion variants of dictionary words to the words.
+
+    Two strings within n edits of each other share a string that is at most n
+    deletions away from both, so candidates for a word are found by probing
+    the index with the word's own deletion variants.  As in SymSpell, only
+    the first prefix_length characters of each word are indexed, which bounds
+    the number of variants per word.
+    """
+
+    def __init__(self, words, max_edits=2, prefix_length=7):
+        """
+        Construct SymmetricDeleteIndex.
+
+        Params:
+            words: [iterable of strings] The dictionary words to index.
+            max_edits: [int] The largest edit distance lookups may ask for.
+            prefix_length: [int] Number of leading characters of each word to
+                generate deletion variants from.
+        """
+        self.max_edits = max_edits
+        self.prefix_length = prefix_length
+        self.deletes = defaultdict(list)
+        for word in set(words):
+            for variant in deletion_variants(word[:prefix_length], max_edits):
+                self.deletes[variant].append(word)
+
+    def lookup(self, word, max_edits=1):
+        """
+        Return the set of indexed words that may be within max_edits of word.
+
+        The result can contain words further away than max_edits, so callers
+        should verify candidates, for example with align_edits().
+        """
+        if max_edits > self.max_edits:
+            raise ValueError('Index was built for at most %s edits.' %
+                self.max_edits)
+        candidates = set()
+        for variant in deletion_variants(word[:self.prefix_length], max_edits):
+            for candidate in self.deletes.get(variant, ()):
+                if abs(len(candidate) - len(word)) <= max_edits:
+                    candidates.add(candidate)
+        return candidates
+
+    def __len__(self):
+        return len(self.deletes)
+
+
+def deletion_variants(word, max_deletes):
+    """Return the set of strings within max_deletes deletions of word."""
+    variants = {word}
+    layer = variants
+    for _ in range(max_deletes):
+        layer = set(w[:i] + w[i + 1:] for w in layer for i in range(len(w)))
+        variants |= layer
+    return variants
+
+
+def align_edits(word, correction, max_edits, error_model, alphabet):
+    """
+    Return the most probable edit string turning word into correction.
+
+    This follows the same insertion, deletion, replacement and transposition
+    steps as EditDistanceSpellChecker.edits(), restricted to the paths that
+    lead to correction, so the edit string it returns is the one edits()
+    would have recorded for correction.
+
+    Params:
+        word: [string] The misspelled word.
+        correction: [string] The candidate correction.
+        max_edits: [int] The maximum number of edits allowed.
+        error_model: [EditErrorModel] Used to pick between edit strings.
+        alphabet: [string] The characters that may be inserted or replaced.
+
+    Returns:
+        [string] The edit string, or None if correction is more than
+            max_edits edits away from word.
+    """
+    best = {}
+
+    def walk(head_len, tail, max_edits, edits):
+        if correction[:head_len] + tail == correction:
+            edit_string = '+'.join(edits)
+            if correction not in best:
+                best[correction] = edit_string
+            else:
+                best[correction] = max(
+                    best[correction], edit_string, key=error_model.prob)
+        if max_edits <= 0:
+            return
+        prev_char = correction[head_len - 1] if head_len else '<'
+        next_char = None
+        if head_len < len(correction) and correction[head_len] in alphabet:
+            next_char = correction[head_len]
+        # Insertion
+        if next_char:
+            walk(head_len + 1, tail, max_edits - 1,
+                edits + [prev_char + '|' + prev_char + next_char])
+        if not tail:
+            return
+        # Deletion
+        walk(head_len, tail[1:], max_edits - 1,
+            edits + [prev_char + tail[0] + '|' + prev_char])
+        if next_char:
+            if next_char == tail[0]: # Match
+                walk(head_len + 1, tail[1:], max_edits, edits)
+            else: # Replacement
+                walk(head_len + 1, tail[1:], max_edits - 1,
+                    edits + [tail[0] + '|' + next_char])
+        # Transpose
+        if (len(tail) >= 2 and tail[0] != tail[1] and head_len < len(correction)
+                and correction[head_len] == tail[1]):
+            walk(head_len + 1, tail[0] + tail[2:], max_edits - 1,
+                edits + [tail[0:2] + '|' + tail[1] + tail[0]])
+
+    walk(0, word, max_edits, [])
+    return best.get(correction)
@@ -0,0 +1,31 @@
+import unittest
+from spellcheck.cache import LRUCache
+
+class TestLRUCache(unittest.TestCase):
+
+    def test_eviction(self):
+        cache = LRUCache(2)
+        cache.put('teh', 'the')
+        cache.put('becuase', 'because')
+        self.assertEqual(cache.get('teh'), 'the')
+        cache.put('recieve', 'receive')
+        self.assertNotIn('becuase', cache)
+        self.assertIn('teh', cache)
+        self.assertEqual(len(cache), 2)
+
+    def test_counters(self):
+        cache = LRUCache(10)
+        self.assertIsNone(cache.get('teh'))
+        cache.put('teh', 'the')
+        cache.get('teh')
+        cache.get('teh')
+        self.assertEqual(cache.stats(), {'size': 1, 'maxsize': 10, 'hits': 2,
+            'misses': 1, 'hit_rate': 2/3})
+
+    def test_disabled(self):
+        cache = LRUCache(0)
+        cache.put('teh', 'the')
+        self.assertEqual(len(cache), 0)
+
+if __name__ == '__main__':
+    unittest.main()
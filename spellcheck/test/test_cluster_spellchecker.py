@@ -1,3 +1,5 @@
+import os
+import tempfile
 import unittest
 from spellcheck.cluster_spellchecker import ClusterSpellChecker
 
@@ -13,5 +15,49 @@ class TestClusterSpelllchecker(unittest.TestCase):
         self.assertEqual(self.spellchecker.rules['beeich'], 'beach')
         self.assertEqual(self.spellchecker.rules['butiful'], 'beautiful')
 
+    def test_add_essays(self):
+        dataset = ['I walked along a beach.', 'The beach was beautiful.',
+            'The beeich was butiful.', 'The beach was beautful.',
+            'The beeich was beautiful.']
+        for method in ('suggest', 'edit1'):
+            full = ClusterSpellChecker()
+            if method == 'suggest':
+                full.save_suggested_rules(dataset)
+            else:
+                full.save_edit1_rules(dataset)
+            incremental = ClusterSpellChecker()
+            incremental.add_essays(dataset[:3], method)
+            affected = incremental.add_essays(dataset[3:], method)
+            self.assertTrue(full.rules)
+            self.assertEqual(incremental.rules, full.rules)
+            self.assertNotIn('walked', affected)
+
+    def test_rule_state(self):
+        self.spellchecker.add_essays(['The beach was beautiful.',
+            'The beeich was butiful.'])
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'rules.json')
+            self.spellchecker.save_rule_state(path)
+            loaded = ClusterSpellChecker()
+            loaded.load_rule_state(path)
+        self.assertEqual(loaded.rules, self.spellchecker.rules)
+        self.assertEqual(loaded.word_freqs, self.spellchecker.word_freqs)
+        self.spellchecker.add_essays(['A beach.'])
+        loaded.add_essays(['A beach.'])
+        self.assertEqual(loaded.rules, self.spellchecker.rules)
+        with self.assertRaises(ValueError):
+            loaded.add_essays(['A beach.'], 'edit1')
+
+    def test_save_rules(self):
+        self.spellchecker.rules = {'beeich': 'beach'}
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'rules.json')
+            self.spellchecker.save_rules(path)
+            loaded = ClusterSpellChecker()
+            loaded.load_rules(path)
+        corrections = loaded.spellcheck(['The beeich.', 'A beeich, a beach.'])
+        self.assertEqual([[(c.index, c.best_correction) for c in essay]
+            for essay in corrections], [[(1, 'beach')], [(1, 'beach')]])
+
 if __name__ == '__main__':
     unittest.main()
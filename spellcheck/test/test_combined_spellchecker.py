@@ -0,0 +1,81 @@
+import unittest
+from spellcheck.combined_spellchecker import CombinedSpellChecker
+from spellcheck.spellchecker import SpellChecker, SpellingCorrection
+
+class RuleSpellChecker(SpellChecker):
+
+    def __init__(self, rules):
+        self.rules = rules
+
+    def spellcheck_text(self, text):
+        return [SpellingCorrection(i, w, [self.rules[w]])
+            for i, w in enumerate(text.split()) if w in self.rules]
+
+class SkipRecordingSpellChecker(RuleSpellChecker):
+
+    def __init__(self, rules):
+        super().__init__(rules)
+        self.skips = []
+
+    def spellcheck_skipping(self, texts, skips):
+        self.skips.extend(set(skip) for skip in skips)
+        return super().spellcheck_skipping(texts, skips)
+
+class TestCombinedSpellChecker(unittest.TestCase):
+
+    def setUp(self):
+        self.spellchecker = CombinedSpellChecker([
+            RuleSpellChecker({'teh': 'the'}),
+            RuleSpellChecker({'teh': 'tech', 'becuase': 'because'})])
+        self.dataset = ['teh cat', 'becuase teh', 'fine']
+
+    def test_spellcheck(self):
+        corrections = self.spellchecker.spellcheck(self.dataset)
+        self.assertEqual(corrections, [
+            [SpellingCorrection(0, 'teh', ['the'])],
+            [SpellingCorrection(1, 'teh', ['the']),
+             SpellingCorrection(0, 'becuase', ['because'])],
+            []])
+
+    def test_spellcheck_iter_is_lazy(self):
+        consumed = []
+        def texts():
+            for text in self.dataset:
+                consumed.append(text)
+                yield text
+        stream = self.spellchecker.spellcheck_iter(texts())
+        essay_ind, corrections = next(stream)
+        self.assertEqual(essay_ind, 0)
+        self.assertEqual(consumed, ['teh cat'])
+        self.assertEqual([essay_ind for essay_ind, _ in stream], [1, 2])
+
+    def test_cascade_iter_is_lazy(self):
+        consumed = []
+        def texts():
+            for text in self.dataset:
+                consumed.append(text)
+                yield text
+        self.spellchecker.cascade = True
+        stream = self.spellchecker.spellcheck_iter(texts())
+        self.assertEqual(next(stream),
+            (0, [SpellingCorrection(0, 'teh', ['the'])]))
+        self.assertEqual(consumed, ['teh cat'])
+        self.assertEqual([essay_ind for essay_ind, _ in stream], [1, 2])
+
+    def test_cascade(self):
+        expected = self.spellchecker.spellcheck(self.dataset)
+        second = SkipRecordingSpellChecker({'teh': 'tech',
+            'becuase': 'because'})
+        cascade = CombinedSpellChecker([RuleSpellChecker({'teh': 'the'}),
+            second], cascade=True, batch_size=2)
+        self.assertEqual(cascade.spellcheck(self.dataset), expected)
+        self.assertEqual(second.skips, [{0}, {1}, set()])
+        self.assertEqual(cascade.spellcheck_text('becuase teh'), expected[1])
+
+    def test_concurrent(self):
+        expected = self.spellchecker.spellcheck(self.dataset)
+        self.spellchecker.processes = 2
+        self.assertEqual(self.spellchecker.spellcheck(self.dataset), expected)
+
+if __name__ == '__main__':
+    unittest.main()
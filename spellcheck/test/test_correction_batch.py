@@ -0,0 +1,64 @@
+import os
+import pickle
+import tempfile
+import unittest
+from spellcheck.correction_batch import CorrectionBatch
+from spellcheck.spellchecker import SpellingCorrection
+
+class TestCorrectionBatch(unittest.TestCase):
+
+    def setUp(self):
+        self.dataset_corrections = [
+            [SpellingCorrection(1, 'lik', ['like', 'lick'])],
+            [],
+            [SpellingCorrection(0, 'teh', ['the']),
+             SpellingCorrection(4, 'lik', ['like']),
+             SpellingCorrection(5, 'caf\xe9s', [])]]
+        self.batch = CorrectionBatch.from_lists(self.dataset_corrections)
+
+    def test_columns(self):
+        self.assertEqual(len(self.batch), 4)
+        self.assertEqual(list(self.batch.essays), [0, 2, 2, 2])
+        self.assertEqual(list(self.batch.indices), [1, 0, 4, 5])
+        self.assertEqual(self.batch.words[0], self.batch.words[2])
+        best = self.batch.best_correction_ids()
+        self.assertEqual(self.batch.strings[best[0]], 'like')
+        self.assertEqual(best[0], best[2])
+        self.assertEqual(best[3], -1)
+
+    def test_append(self):
+        batch = CorrectionBatch()
+        batch.append(2, 4, 'lik', ['like'])
+        self.assertEqual(list(batch),
+            [(2, SpellingCorrection(4, 'lik', ['like']))])
+
+    def test_to_lists(self):
+        dataset_corrections = self.batch.to_lists()
+        self.assertEqual(dataset_corrections, self.dataset_corrections)
+        self.assertEqual(dataset_corrections[0][0].corrections,
+            ['like', 'lick'])
+        self.assertEqual(len(self.batch.to_lists(5)), 5)
+
+    def test_save_load(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'corrections.bin')
+            self.batch.save(path)
+            loaded = CorrectionBatch.load(path)
+        self.assertEqual([(e, c.index, c.word, c.corrections)
+            for e, c in loaded], [(e, c.index, c.word, c.corrections)
+            for e, c in self.batch])
+
+class TestSpellingCorrection(unittest.TestCase):
+
+    def test_eq_and_hash(self):
+        correction = SpellingCorrection(1, 'lik', ['like', 'lick'])
+        same = SpellingCorrection(1, 'lik', ['like'])
+        self.assertEqual(correction, same)
+        self.assertEqual(hash(correction), hash(same))
+        self.assertNotEqual(correction, SpellingCorrection(1, 'lik', ['lick']))
+        self.assertFalse(hasattr(correction, '__dict__'))
+        self.assertEqual(pickle.loads(pickle.dumps(correction)).corrections,
+            ['like', 'lick'])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+import os
+import pickle
+import tempfile
+import unittest
+from spellcheck.dictionary import CachedDictionary
+from spellcheck.suggestion_cache import SuggestionCache
+
+class TestCachedDictionary(unittest.TestCase):
+
+    def setUp(self):
+        self.dictionary = CachedDictionary(cache_size=10)
+
+    def test_check(self):
+        self.assertTrue(self.dictionary.check('colour'))
+        self.assertTrue(self.dictionary.check('color'))
+        self.assertFalse(self.dictionary.check('colr'))
+        self.assertFalse(self.dictionary.check(''))
+
+    def test_cache_stats(self):
+        self.dictionary.check('beach')
+        self.dictionary.check('beach')
+        self.dictionary.check('beeich')
+        stats = self.dictionary.stats()['cache']
+        self.assertEqual(stats['hits'], 1)
+        self.assertEqual(stats['misses'], 2)
+
+    def test_preload(self):
+        self.dictionary.preload(['beach', 'beeich'])
+        self.assertEqual(self.dictionary.known_words, frozenset(['beach']))
+        self.assertTrue(self.dictionary.check('beach'))
+        self.assertEqual(self.dictionary.stats()['known_word_hits'], 1)
+        self.assertEqual(self.dictionary.stats()['cache']['misses'], 0)
+
+    def test_pickle(self):
+        self.dictionary.check('beach')
+        unpickled = pickle.loads(pickle.dumps(self.dictionary))
+        self.assertTrue(unpickled.check('beach'))
+        self.assertFalse(unpickled.check('beeich'))
+
+    def test_suggest_many(self):
+        words = ['beeich', 'butiful', 'beeich']
+        expected = dict((w, self.dictionary.suggest(w)) for w in words)
+        self.assertEqual(self.dictionary.suggest_many(words), expected)
+        self.assertEqual(self.dictionary.suggest_many(words, processes=2),
+            expected)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cache = SuggestionCache(os.path.join(tmp_dir, 'suggestions.db'))
+            self.dictionary.suggestion_cache = cache
+            try:
+                self.assertEqual(self.dictionary.suggest_many(words),
+                    expected)
+                self.assertEqual(self.dictionary.suggest('beeich'),
+                    expected['beeich'])
+                self.assertEqual(cache.stats()['hits'], 2)
+            finally:
+                cache.close()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,33 @@
+import unittest
+from spellcheck.document import Document, as_document, tag_documents
+
+class TestDocument(unittest.TestCase):
+
+    def setUp(self):
+        self.document = Document('I like Python. I lik Python.')
+
+    def test_is_text(self):
+        self.assertEqual(self.document, 'I like Python. I lik Python.')
+        self.assertIs(as_document(self.document), self.document)
+
+    def test_tokens(self):
+        self.assertEqual(self.document.sentences,
+            [['I', 'like', 'Python'], ['I', 'lik', 'Python']])
+        self.assertEqual(self.document.words,
+            ['I', 'like', 'Python', 'I', 'lik', 'Python'])
+        self.assertEqual([self.document[s.start:s.end]
+            for s in self.document.spans], self.document.words)
+
+    def test_tag_documents(self):
+        num_tagged = tag_documents([self.document],
+            lambda words: 'lik' in words)
+        self.assertEqual(num_tagged, 1)
+        tagged_words = self.document.tagged_words()
+        self.assertEqual([tag for word, tag in tagged_words[:3]], [None] * 3)
+        self.assertTrue(all(tag for word, tag in tagged_words[3:]))
+        # Tagged sentences are not tagged again.
+        self.assertEqual(tag_documents([self.document]), 1)
+        self.assertTrue(all(tag for word, tag in self.document.tagged_words()))
+
+if __name__ == '__main__':
+    unittest.main()
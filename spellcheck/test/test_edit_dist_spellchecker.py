@@ -2,6 +2,7 @@ import unittest
 from collections import defaultdict
 from spellcheck.edit_dist_spellchecker import EditDistanceSpellChecker
 from spellcheck.edit_error_model import EditErrorModel
+from spellcheck.lexicon import TrieLexicon
 from pylm.lang_model import NgramModel
 from pylm.util import ngram_cfd, mle_cpd
 
@@ -32,6 +33,95 @@ class TestEditDistanceSpellchecker(unittest.TestCase):
         correction = corrections[0][0]
         self.assertEqual(correction.best_correction, 'like')
 
+    def test_correction_cache(self):
+        self.spellchecker.spellcheck(['I lik Python', 'I lik Python'])
+        stats = self.spellchecker.cache_stats()
+        self.assertEqual(stats['corrections']['misses'], 1)
+        self.assertEqual(stats['corrections']['hits'], 1)
+
+    def test_batched_tagging(self):
+        dataset = ['I lik Python.', 'I like Python. I lik Python.']
+        expected = [self.spellchecker.spellcheck_text(text)
+            for text in dataset]
+        self.spellchecker.tag_batch_size = 2
+        self.assertEqual(self.spellchecker.spellcheck(dataset), expected)
+
+    def test_spellcheck_iter_streams(self):
+        pulled = []
+        def texts():
+            for text in ['I lik Python.', 'I like Python.']:
+                pulled.append(text)
+                yield text
+        stream = self.spellchecker.spellcheck_iter(texts())
+        essay_ind, corrections = next(stream)
+        self.assertEqual(essay_ind, 0)
+        self.assertEqual(corrections[0].best_correction, 'like')
+        self.assertEqual(pulled, ['I lik Python.'])
+        self.assertEqual(next(stream), (1, []))
+
+    def test_lazy_tagging(self):
+        self.spellchecker.lazy_tagging = True
+        tagged_words = self.spellchecker.tokenize_and_tag(
+            ['I like Python. I lik Python.'])[0]
+        self.assertEqual([tag for word, tag in tagged_words[:3]],
+            [None] * 3)
+        self.assertTrue(all(tag for word, tag in tagged_words[3:]))
+        corrections = self.spellchecker.spellcheck(
+            ['I like Python. I lik Python.'])
+        self.assertEqual(corrections[0][0].index, 4)
+        self.assertEqual(corrections[0][0].best_correction, 'like')
+
+    def test_spellcheck_skipping(self):
+        dataset = ['I lik Python', 'I lik Python']
+        corrections = self.spellchecker.spellcheck_skipping(dataset,
+            [{1}, {2}])
+        self.assertEqual(corrections[0], [])
+        self.assertEqual(corrections[1], self.spellchecker.spellcheck_text(
+            dataset[1]))
+
+    def test_known_good(self):
+        self.spellchecker.known_good = self.spellchecker.build_known_good(
+            ['I', 'like', 'Python', 'lik'])
+        self.assertIn('like', self.spellchecker.known_good)
+        self.assertNotIn('lik', self.spellchecker.known_good)
+        self.spellchecker.spellcheck(['I lik Python'])
+        stats = self.spellchecker.fast_path_stats()
+        self.assertEqual(stats['tokens'], 3)
+        self.assertEqual(stats['known_good_tokens'], 2)
+
+    def test_known_good_is_lazy_and_shared(self):
+        spellchecker = EditDistanceSpellChecker(self.spellchecker.error_model,
+            self.spellchecker.lang_model, self.spellchecker.lexicon,
+            vocabulary=['I', 'like', 'Python', 'lik'])
+        self.assertIsNone(spellchecker._known_good)
+        self.assertIn('like', spellchecker.known_good)
+        self.assertNotIn('lik', spellchecker.known_good)
+        self.assertIs(spellchecker.lexicon_known_good(),
+            self.spellchecker.lexicon_known_good())
+
+    def test_beam_engine(self):
+        edit_pdist = defaultdict(int, {'k|ke': 0.2, 'i|a': 0.1, 'a|i': 0.1,
+            'ai|a': 0.3, 'ek|ke': 0.05})
+        error_model = EditErrorModel(edit_pdist)
+        lexicon = TrieLexicon.from_words(['I', 'like', 'lake', 'Python'])
+        recursive = EditDistanceSpellChecker(error_model,
+            self.spellchecker.lang_model, lexicon)
+        beam = EditDistanceSpellChecker(error_model,
+            self.spellchecker.lang_model, lexicon, engine='beam',
+            beam_width=None)
+        for word in ('lik', 'lak', 'laik', 'lekk', 'lke'):
+            for max_edits in (1, 2):
+                # The beam engine never makes edits with probability 0.
+                expected = dict((c, e) for c, e in recursive.get_candidates(
+                    word, max_edits).items() if error_model.prob(e) > 0)
+                self.assertEqual(beam.get_candidates(word, max_edits),
+                    expected)
+        # The most probable candidates are kept.
+        self.assertEqual(beam.beam_edits('lak', 2, 1), {'lake': 'k|ke'})
+        self.assertEqual(beam.beam_edits('lik', 2, 1), {'like': 'k|ke'})
+        self.assertEqual(beam.beam_edits('lak', 2, 2),
+            {'lake': 'k|ke', 'like': 'a|i+k|ke'})
+
 
 if __name__ == '__main__':
     unittest.main()
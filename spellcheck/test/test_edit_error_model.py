@@ -1,3 +1,4 @@
+import math
 import unittest
 from collections import defaultdict
 from spellcheck.edit_error_model import EditErrorModel
@@ -18,6 +19,42 @@ class TestEditErrorModel(unittest.TestCase):
         self.assertEqual(error_model.prob('s|st+e|i+ai|a'), 0.03 *
                 prob_spelling_error)
 
+    def test_compiled_edit_error_model(self):
+        edit_pdist = defaultdict(int, {'e|i': 0.5, 's|st': 0.2, 'ai|a': 0.3})
+        error_model = EditErrorModel(edit_pdist, prob_spelling_error=0.01)
+        compiled = error_model.compile()
+        for edit in ['e|i', 's|st+e|i', 's|st+e|i+ai|a', 'x|y']:
+            self.assertEqual(compiled.prob(edit), error_model.prob(edit))
+            self.assertEqual(compiled.prob(compiled.ids(edit)),
+                error_model.prob(edit))
+        self.assertEqual(compiled.prob(''), 0.99)
+        self.assertEqual(compiled.ids('s|st+e|i'),
+            (compiled.edit_ids['s|st'], compiled.edit_ids['e|i']))
+        self.assertAlmostEqual(compiled.log_prob('s|st+e|i'),
+            math.log(error_model.prob('s|st+e|i')))
+        self.assertEqual(compiled.log_prob('x|y'), -math.inf)
+
+    def test_compiled_cache_is_bounded(self):
+        edit_pdist = defaultdict(int, {'e|i': 0.5, 's|st': 0.2, 'ai|a': 0.3})
+        error_model = EditErrorModel(edit_pdist, prob_spelling_error=0.01)
+        compiled = error_model.compile(cache_size=2)
+        edits = ['e|i', 's|st+e|i', 's|st+e|i+ai|a', 'ai|a+e|i']
+        for edit in edits * 2:
+            self.assertEqual(compiled.prob(edit), error_model.prob(edit))
+            self.assertAlmostEqual(compiled.log_prob(edit),
+                math.log(error_model.prob(edit)))
+        self.assertEqual(len(compiled.composite_probs), 2)
+        self.assertEqual(len(compiled.composite_log_probs), 2)
+        self.assertEqual(len(compiled.composite_ids), 2)
+        self.assertEqual(compiled.prob(''), 0.99)
+
+    def test_no_spelling_errors(self):
+        error_model = EditErrorModel(defaultdict(int, {'e|i': 0.5}),
+            prob_spelling_error=0)
+        compiled = error_model.compile()
+        self.assertEqual(compiled.log_prob('e|i'), -math.inf)
+        self.assertEqual(compiled.log_prob(''), 0)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,55 @@
+import unittest
+from spellcheck.correction_batch import CorrectionBatch
+from spellcheck.evaluation import Evaluator, edit_type
+from spellcheck.spellchecker import SpellingCorrection
+
+class TestEvaluator(unittest.TestCase):
+
+    def setUp(self):
+        self.gold = [
+            [SpellingCorrection(0, 'teh', ['the']),
+             SpellingCorrection(3, 'wrold', ['world'])],
+            [SpellingCorrection(1, 'lik', ['like'])]]
+        self.predicted = [
+            [SpellingCorrection(0, 'teh', ['the', 'tea']),
+             SpellingCorrection(3, 'wrold', ['would'])],
+            [SpellingCorrection(1, 'lik', ['like']),
+             SpellingCorrection(1, 'lik', ['like']),
+             SpellingCorrection(2, 'Pyhton', ['Python'])]]
+        self.evaluator = Evaluator(self.gold)
+
+    def test_overall(self):
+        overall = self.evaluator.evaluate(self.predicted)['overall']
+        self.assertEqual(overall['true_positives'], 2)
+        self.assertEqual(overall['predicted'], 4)
+        self.assertEqual(overall['gold'], 3)
+        self.assertEqual(overall['precision'], 2 / 4)
+        self.assertEqual(overall['recall'], 2 / 3)
+        self.assertAlmostEqual(overall['f1'], 4 / 7)
+
+    def test_batch_matches_lists(self):
+        self.assertEqual(
+            self.evaluator.evaluate(CorrectionBatch.from_lists(self.predicted)),
+            self.evaluator.evaluate(self.predicted))
+
+    def test_breakdowns(self):
+        result = self.evaluator.evaluate(self.predicted)
+        by_edit_type = result['by_edit_type']
+        self.assertEqual(by_edit_type['transposition']['gold'], 2)
+        self.assertEqual(by_edit_type['transposition']['true_positives'], 1)
+        self.assertEqual(by_edit_type['deletion']['recall'], 1)
+        self.assertEqual(by_edit_type['multiple']['precision'], 0)
+        self.assertEqual(result['by_word_length']['3']['true_positives'], 2)
+        self.assertEqual(result['by_word_length']['5']['recall'], 0)
+
+    def test_edit_type(self):
+        self.assertEqual(edit_type('thhe', 'the'), 'insertion')
+        self.assertEqual(edit_type('th', 'the'), 'deletion')
+        self.assertEqual(edit_type('tha', 'the'), 'substitution')
+        self.assertEqual(edit_type('teh', 'the'), 'transposition')
+        self.assertEqual(edit_type('The', 'the'), 'capitalization')
+        self.assertEqual(edit_type('xyz', 'the'), 'multiple')
+        self.assertEqual(edit_type('the', None), 'none')
+
+if __name__ == '__main__':
+    unittest.main()
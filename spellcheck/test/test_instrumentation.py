@@ -0,0 +1,73 @@
+import unittest
+from spellcheck.combined_spellchecker import CombinedSpellChecker
+from spellcheck.instrumentation import Instrumentation, NULL_INSTRUMENTATION
+from spellcheck.spellchecker import SpellChecker, SpellingCorrection
+
+class CountingSpellChecker(SpellChecker):
+
+    def __init__(self, rules):
+        self.rules = rules
+
+    def spellcheck_text(self, text):
+        with self.instrumentation.timer('tokenize'):
+            words = text.split()
+        self.instrumentation.count('tokens', len(words))
+        return [SpellingCorrection(i, w, [self.rules[w]])
+            for i, w in enumerate(words) if w in self.rules]
+
+class TestInstrumentation(unittest.TestCase):
+
+    def test_timers_and_counters(self):
+        instrumentation = Instrumentation()
+        with instrumentation.timer('stage'):
+            pass
+        with instrumentation.timer('stage'):
+            pass
+        instrumentation.count('tokens', 3)
+        instrumentation.count('tokens')
+        stats = instrumentation.as_dict()
+        self.assertEqual(stats['timers']['stage']['calls'], 2)
+        self.assertGreaterEqual(stats['timers']['stage']['seconds'], 0)
+        self.assertEqual(stats['counters'], {'tokens': 4})
+        instrumentation.reset()
+        self.assertEqual(instrumentation.as_dict(),
+            {'timers': {}, 'counters': {}})
+
+    def test_callback(self):
+        events = []
+        instrumentation = Instrumentation(
+            lambda kind, name, value: events.append((kind, name)))
+        with instrumentation.timer('stage'):
+            instrumentation.count('tokens', 2)
+        self.assertEqual(events, [('count', 'tokens'), ('timer', 'stage')])
+
+    def test_disabled_by_default(self):
+        spellchecker = CountingSpellChecker({'teh': 'the'})
+        self.assertIs(spellchecker.instrumentation, NULL_INSTRUMENTATION)
+        self.assertFalse(spellchecker.instrumentation.enabled)
+        spellchecker.spellcheck(['teh cat'])
+        self.assertEqual(NULL_INSTRUMENTATION.as_dict(),
+            {'timers': {}, 'counters': {}})
+
+    def test_combined_spellchecker_propagates(self):
+        spellchecker = CombinedSpellChecker([
+            CountingSpellChecker({'teh': 'the'}),
+            CountingSpellChecker({'becuase': 'because'})])
+        instrumentation = Instrumentation()
+        spellchecker.set_instrumentation(instrumentation)
+        spellchecker.spellcheck(['teh cat', 'becuase teh'])
+        stats = instrumentation.as_dict()
+        self.assertEqual(stats['counters']['tokens'], 4)
+        self.assertEqual(stats['counters']['CountingSpellChecker.tokens'], 8)
+        self.assertEqual(stats['counters']['merged_corrections'], 3)
+        self.assertEqual(stats['timers']['tokenize']['calls'], 4)
+        instrumentation.reset()
+        spellchecker.cascade = True
+        spellchecker.spellcheck(['teh cat', 'becuase teh'])
+        self.assertEqual(instrumentation.as_dict()['counters']['tokens'], 4)
+        spellchecker.set_instrumentation(None)
+        for sc in spellchecker.spellcheckers:
+            self.assertIs(sc.instrumentation, NULL_INSTRUMENTATION)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,5 @@
 import unittest
-from spellcheck.interactive_corrector import DistMatrix
+from spellcheck.interactive_corrector import DistMatrix, NeighbourIndex
 from pyxdameraulevenshtein import damerau_levenshtein_distance
 
 class TestDistMatrix(unittest.TestCase):
@@ -27,5 +27,41 @@ class TestDistMatrix(unittest.TestCase):
             self.dmatrix.get_close_words('bye', 2),
             [('bye', 1), ('but', 2)])
 
+class TestNeighbourIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.words = [
+            'hello', 'ello', 'great', 'walk',
+            'bye', 'hell', 'hello', 'but', 'but', 'hlelo']
+        self.index = NeighbourIndex(self.words, damerau_levenshtein_distance,
+            max_dist=2)
+
+    def test_get_words(self):
+        self.assertCountEqual(self.index.get_words(), set(self.words))
+
+    def test_get_close_words(self):
+        self.assertCountEqual(
+            self.index.get_close_words('hello', 1),
+            [('hello', 2), ('ello', 1), ('hell', 1), ('hlelo', 1)])
+        self.assertCountEqual(
+            self.index.get_close_words('bye', 2),
+            [('bye', 1), ('but', 2)])
+        with self.assertRaises(ValueError):
+            self.index.get_close_words('bye', 3)
+
+    def test_matches_dist_matrix(self):
+        matrix = DistMatrix(self.words, damerau_levenshtein_distance)
+        for word in matrix.get_words():
+            for max_dist in [1, 2]:
+                self.assertCountEqual(
+                    self.index.get_close_words(word, max_dist),
+                    matrix.get_close_words(word, max_dist))
+
+    def test_add_words(self):
+        self.index.add_words(['hello', 'jello'])
+        self.assertCountEqual(
+            self.index.get_close_words('jello', 1),
+            [('jello', 1), ('hello', 3), ('ello', 1)])
+
 if __name__ == '__main__':
     unittest.main()
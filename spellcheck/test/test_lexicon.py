@@ -0,0 +1,46 @@
+import os
+import pickle
+import tempfile
+import unittest
+from spellcheck.lexicon import TrieLexicon
+
+class TestTrieLexicon(unittest.TestCase):
+
+    def setUp(self):
+        self.words = ['walk', 'walked', 'wall', 'cat', "can't", 'a']
+        self.lexicon = TrieLexicon.from_words(self.words)
+
+    def test_contains_prefixes(self):
+        prefixes = set(w[:i] for w in self.words for i in range(len(w) + 1))
+        for prefix in prefixes:
+            self.assertIn(prefix, self.lexicon)
+        for not_prefix in ['walks', 'b', 'cats', 'wak']:
+            self.assertNotIn(not_prefix, self.lexicon)
+
+    def test_children(self):
+        node = self.lexicon.find('wal')
+        self.assertEqual(sorted(self.lexicon.children(node)), ['k', 'l'])
+        self.assertEqual(self.lexicon.children(node)['k'],
+                self.lexicon.child(node, 'k'))
+        self.assertEqual(self.lexicon.child(node, 'z'), TrieLexicon.NO_NODE)
+
+    def test_is_word(self):
+        self.assertTrue(self.lexicon.is_word(self.lexicon.find('walk')))
+        self.assertFalse(self.lexicon.is_word(self.lexicon.find('wal')))
+
+    def test_words(self):
+        self.assertEqual(list(self.lexicon.words()), sorted(self.words))
+
+    def test_save_load(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'words.lex')
+            self.lexicon.save(path)
+            loaded = TrieLexicon.load(path)
+            self.assertEqual(list(loaded.words()), sorted(self.words))
+            self.assertEqual(loaded.find("can'"), self.lexicon.find("can'"))
+            unpickled = pickle.loads(pickle.dumps(loaded))
+            self.assertEqual(unpickled.path, path)
+            self.assertEqual(list(unpickled.words()), sorted(self.words))
+
+if __name__ == '__main__':
+    unittest.main()
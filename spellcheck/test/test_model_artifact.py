@@ -0,0 +1,64 @@
+import os
+import pickle
+import tempfile
+import unittest
+from collections import defaultdict
+from spellcheck.model_artifact import ModelArtifact, count_ngrams
+
+class TestModelArtifact(unittest.TestCase):
+
+    def setUp(self):
+        sents = [['i', 'like', 'python'], ['i', 'like', 'cats'], ['cats']]
+        unigrams, bigrams = count_ngrams(sents)
+        edit_pdist = defaultdict(int, {'u|o': 0.5, 'k|ke': 0.2, 'ai|a': 0.3})
+        self.artifact = ModelArtifact.build(unigrams, bigrams, edit_pdist,
+            0.01)
+
+    def test_unigram_model(self):
+        model = self.artifact.ngram_model(1)
+        self.assertEqual(model.order(), 1)
+        self.assertEqual(model.prob('like', ()), 2 / 7)
+        self.assertEqual(model.prob('dogs', ()), 0)
+
+    def test_bigram_model(self):
+        model = self.artifact.ngram_model()
+        self.assertEqual(model.order(), 2)
+        self.assertEqual(model.prob('python', ['like']), 1 / 2)
+        self.assertEqual(model.prob('cats', ['']), 1 / 3)
+        self.assertEqual(model.prob('i', ['cats']), 0)
+        interpolated = self.artifact.interpolation_model([0.75, 0.25])
+        self.assertEqual(interpolated.prob('python', ['like']),
+            0.75 * 1 / 2 + 0.25 * 1 / 7)
+
+    def test_word_id_caches_only_vocabulary(self):
+        like_id = self.artifact.word_id('like')
+        self.assertEqual(self.artifact.vocab[like_id], 'like')
+        for i in range(100):
+            self.assertIsNone(self.artifact.word_id('dogs%d' % i))
+        self.assertEqual(self.artifact.ids, {'like': like_id})
+
+    def test_words(self):
+        self.assertEqual(list(self.artifact.words()),
+            ['cats', 'i', 'like', 'python'])
+
+    def test_error_model(self):
+        error_model = self.artifact.error_model()
+        self.assertEqual(error_model.prob('u|o'), 0.01 * 0.5)
+        self.assertEqual(error_model.prob('u|o+k|ke'), 0.01 * 0.5 * 0.2)
+        self.assertEqual(error_model.compile().prob('u|o+k|ke'),
+            error_model.prob('u|o+k|ke'))
+
+    def test_save_load(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'model.lm')
+            self.artifact.save(path)
+            loaded = ModelArtifact.load(path)
+            self.assertEqual(loaded.to_bytes(), self.artifact.to_bytes())
+            self.assertEqual(loaded.ngram_model().prob('python', ['like']),
+                1 / 2)
+            unpickled = pickle.loads(pickle.dumps(loaded.ngram_model(1)))
+            self.assertEqual(unpickled.artifact.path, path)
+            self.assertEqual(unpickled.prob('like', ()), 2 / 7)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,34 @@
+import unittest
+from spellcheck.parallel import spellcheck_concurrently
+from spellcheck.spellchecker import SpellChecker, SpellingCorrection
+
+class UpperCaseSpellChecker(SpellChecker):
+    """Marks every lowercase word as a misspelling of its uppercase form."""
+
+    def __init__(self):
+        pass
+
+    def spellcheck_text(self, text):
+        return [SpellingCorrection(i, w, [w.upper()])
+            for i, w in enumerate(text.split()) if w.islower()]
+
+class TestParallelSpellcheck(unittest.TestCase):
+
+    def test_parallel_matches_serial(self):
+        spellchecker = UpperCaseSpellChecker()
+        dataset = ['essay %d has Some words' % i for i in range(23)]
+        self.assertEqual(
+            spellchecker.parallel_spellcheck(dataset, processes=3,
+                shard_size=2),
+            spellchecker.spellcheck(dataset))
+
+    def test_concurrent_matches_serial(self):
+        spellcheckers = [UpperCaseSpellChecker(), UpperCaseSpellChecker()]
+        dataset = ['essay %d has Some words' % i for i in range(5)] + ['']
+        self.assertEqual(
+            spellcheck_concurrently(spellcheckers, dataset, processes=2),
+            [spellchecker.spellcheck(dataset)
+                for spellchecker in spellcheckers])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,9 @@
+import os
+import tempfile
 import unittest
 from nltk import sent_tokenize
-from spellcheck.parse_util import word_tokenize
+from spellcheck.parse_util import DigitizationParser, word_tokenize
+from spellcheck.spellchecker import SpellingCorrection
 
 class TestWordTokenize(unittest.TestCase):
 
@@ -13,6 +16,31 @@ class TestWordTokenize(unittest.TestCase):
             ['I', 'like', 'cats', 'My', 'favorite', 'color', 'is', 'orange',
              'I', 'always', 'wear', 'a', 'sweater'])
 
+class TestDigitizationParser(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.file_name = os.path.join(self.tmp_dir.name, 'digitization.txt')
+        with open(self.file_name, 'w') as f:
+            f.write('1\nI <lik> cats.\n1,lik,like\n# # # # # # #\n'
+                '2\nNo errors here.\n# # # # # # #\n')
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_iter_digitization(self):
+        essays = list(DigitizationParser().iter_digitization(self.file_name))
+        self.assertEqual(essays, [
+            ('I lik cats.', [SpellingCorrection(1, 'lik', ['like'])]),
+            ('No errors here.', [])])
+
+    def test_parse_digitization(self):
+        essays, corrections = DigitizationParser().parse_digitization(
+            self.file_name)
+        self.assertEqual(essays, ['I lik cats.', 'No errors here.'])
+        self.assertEqual(corrections,
+            [[SpellingCorrection(1, 'lik', ['like'])], []])
+
 if __name__ == '__main__':
     unittest.main()
 
@@ -0,0 +1,44 @@
+import os
+import tempfile
+import unittest
+from spellcheck.correction_batch import CorrectionBatch
+from spellcheck.parse_util import word_tokenize
+from spellcheck.rule_table import RuleTable, InvalidRuleTableException
+
+class TestRuleTable(unittest.TestCase):
+
+    def setUp(self):
+        self.table = RuleTable({'beeich': 'beach', 'butiful': 'beautiful'})
+        self.texts = ['The beeich was butiful.', 'A beeich, a beach!  Butiful?',
+            'butiful. beeich.. .']
+
+    def test_apply(self):
+        for text in self.texts:
+            words = word_tokenize(text)
+            expected = [(i, w, self.table.rules[w]) for i, w in
+                enumerate(words) if w in self.table.rules]
+            self.assertEqual([(c.index, c.word, c.best_correction)
+                for c in self.table.apply(text)], expected)
+
+    def test_apply_batch(self):
+        batch = self.table.apply_batch(self.texts)
+        expected = CorrectionBatch.from_lists(
+            [self.table.apply(text) for text in self.texts])
+        self.assertEqual(list(batch), list(expected))
+
+    def test_rules_are_shared(self):
+        rules = {}
+        table = RuleTable(rules)
+        rules['teh'] = 'the'
+        self.assertEqual(table.apply('teh cat')[0].best_correction, 'the')
+
+    def test_save_load(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'rules.json')
+            self.table.save(path)
+            self.assertEqual(RuleTable.load(path).rules, self.table.rules)
+        with self.assertRaises(InvalidRuleTableException):
+            RuleTable.from_json('{"beeich": "beach"}')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+import math
+import unittest
+from collections import defaultdict
+from spellcheck.edit_error_model import EditErrorModel
+from spellcheck.scoring import CandidateScorer
+
+class UnigramModel:
+
+    def __init__(self, probs):
+        self.probs = probs
+
+    def order(self):
+        return 1
+
+    def prob(self, word, context):
+        return self.probs.get(word, 0)
+
+class TestCandidateScorer(unittest.TestCase):
+
+    def setUp(self):
+        edit_pdist = defaultdict(int, {'k|ke': 0.5, 'i|a': 0.3, 'k|ck': 0.2})
+        self.error_model = EditErrorModel(edit_pdist, prob_spelling_error=0.01)
+        self.lang_model = UnigramModel({'like': 0.3, 'lake': 0.5, 'lick': 0.2})
+        self.scorer = CandidateScorer(self.lang_model, self.error_model)
+        self.candidates = {'lik': '', 'like': 'k|ke', 'lake': 'i|a+k|ke',
+            'lick': 'k|ck'}
+
+    def test_scores(self):
+        scores = self.scorer.scores(list(self.candidates.items()), ())
+        for (correction, edit), score in zip(self.candidates.items(), scores):
+            expected = (self.lang_model.prob(correction, ()) *
+                self.error_model.prob(edit))
+            if expected:
+                self.assertAlmostEqual(score, math.log(expected))
+            else:
+                self.assertEqual(score, -math.inf)
+
+    def test_composite_edit_does_not_underflow(self):
+        edit_pdist = defaultdict(int, {'a|e': 1e-200, 'i|a': 1e-200})
+        error_model = EditErrorModel(edit_pdist, prob_spelling_error=0.01)
+        self.assertEqual(error_model.prob('a|e+i|a'), 0)
+        for model in [error_model, error_model.compile()]:
+            scorer = CandidateScorer(self.lang_model, model)
+            scores = scorer.scores([('like', 'a|e+i|a'), ('lake', 'k|ck')], ())
+            self.assertAlmostEqual(scores[0], math.log(0.3) + math.log(0.01)
+                + 2 * math.log(1e-200))
+            self.assertEqual(scores[1], -math.inf)
+            self.assertEqual(scorer.rank({'lake': 'k|ck', 'like': 'a|e+i|a'},
+                ()), [('like', 'a|e+i|a')])
+
+    def test_rank(self):
+        self.assertEqual(self.scorer.rank(self.candidates, ()),
+            [('like', 'k|ke')])
+        self.assertEqual(
+            [c for c, e in self.scorer.rank(self.candidates, (), 3)],
+            ['like', 'lake', 'lick'])
+
+    def test_tables_are_bounded(self):
+        scorer = CandidateScorer(self.lang_model, self.error_model,
+            cache_size=3)
+        for i in range(20):
+            candidates = {'word%d' % i: 'k|ke', 'lake': 'i|a+k|ke'}
+            self.assertEqual(list(scorer.scores(list(candidates.items()), ())),
+                list(self.scorer.scores(list(candidates.items()), ())))
+            self.assertLessEqual(len(scorer.word_table.ids), 4)
+            self.assertLessEqual(len(scorer.edit_table.ids), 4)
+
+    def test_rank_ties_keep_order(self):
+        candidates = {'lik': '', 'lok': ''}
+        self.assertEqual(self.scorer.rank(candidates, ()), [('lik', '')])
+
+if __name__ == '__main__':
+    unittest.main()
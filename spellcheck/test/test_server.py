@@ -0,0 +1,166 @@
+import asyncio
+import json
+import socket
+import struct
+import unittest
+from spellcheck.server import SpellcheckServer
+from spellcheck.spellchecker import SpellChecker, SpellingCorrection
+
+class CountingSpellChecker(SpellChecker):
+    """Marks every lowercase word as a misspelling of its uppercase form."""
+
+    def __init__(self):
+        self.batch_sizes = []
+
+    def spellcheck(self, dataset):
+        self.batch_sizes.append(len(dataset))
+        return super().spellcheck(dataset)
+
+    def spellcheck_text(self, text):
+        if text == 'fail':
+            raise ValueError('bad text')
+        return [SpellingCorrection(i, w, [w.upper()])
+            for i, w in enumerate(text.split()) if w.islower()]
+
+class TestSpellcheckServer(unittest.TestCase):
+
+    def setUp(self):
+        self.spellchecker = CountingSpellChecker()
+
+    def request(self, requests, max_delay=0.05):
+        async def run():
+            server = SpellcheckServer(self.spellchecker, max_batch_size=4,
+                max_delay=max_delay)
+            listener = await server.start(port=0)
+            port = listener.sockets[0].getsockname()[1]
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+            for request in requests:
+                writer.write(json.dumps(request).encode('utf-8') + b'\n')
+            await writer.drain()
+            responses = [json.loads((await reader.readline()).decode('utf-8'))
+                for _ in requests]
+            writer.close()
+            listener.close()
+            await listener.wait_closed()
+            await server.close()
+            return dict((response['id'], response) for response in responses)
+        return asyncio.run(run())
+
+    def test_corrections(self):
+        responses = self.request([{'id': 1, 'text': 'Some words'},
+            {'id': 2, 'text': 'No Words'}])
+        self.assertEqual(responses[1]['corrections'],
+            [{'index': 1, 'word': 'words', 'corrections': ['WORDS']}])
+        self.assertEqual(responses[2]['corrections'], [])
+        self.assertGreaterEqual(responses[1]['latency_ms'], 0)
+
+    def test_micro_batching(self):
+        responses = self.request([{'id': i, 'text': 'essay %d' % i}
+            for i in range(10)])
+        self.assertEqual(len(responses), 10)
+        self.assertEqual(sum(self.spellchecker.batch_sizes), 10)
+        self.assertLess(len(self.spellchecker.batch_sizes), 10)
+        self.assertLessEqual(max(self.spellchecker.batch_sizes), 4)
+
+    def test_errors_and_stats(self):
+        responses = self.request([{'id': 1, 'text': 'fail'},
+            {'id': 2, 'wrong': 'key'}, {'id': 3, 'text': 'ok'}])
+        self.assertIn('ValueError', responses[1]['error'])
+        self.assertIn('KeyError', responses[2]['error'])
+        self.assertEqual(len(responses[3]['corrections']), 1)
+        responses = self.request([{'id': 1, 'text': 'a b'},
+            {'id': 2, 'stats': True}], max_delay=0)
+        self.assertEqual(responses[2]['stats']['requests'], 1)
+        self.assertIn('p99_ms', responses[2]['stats']['latency'])
+
+    def test_retries_are_not_counted_as_batches(self):
+        async def run():
+            server = SpellcheckServer(self.spellchecker, max_batch_size=4,
+                max_delay=0.05)
+            listener = await server.start(port=0)
+            results = await asyncio.gather(server.spellcheck_text('fail'),
+                server.spellcheck_text('ok'), return_exceptions=True)
+            listener.close()
+            await listener.wait_closed()
+            await server.close()
+            return server.stats(), results
+        stats, results = asyncio.run(run())
+        self.assertIsInstance(results[0], ValueError)
+        self.assertEqual(len(results[1]), 1)
+        self.assertEqual(stats['batches'], 1)
+        self.assertEqual(stats['queue_latency']['count'], 2)
+
+    def test_malformed_requests_are_not_counted(self):
+        responses = self.request([{'id': 1, 'wrong': 'key'},
+            {'id': 2, 'text': 5}, {'id': 3, 'stats': True}])
+        self.assertIn('TypeError', responses[2]['error'])
+        self.assertEqual(responses[3]['stats']['requests'], 0)
+        self.assertEqual(responses[3]['stats']['errors'], 2)
+
+    def test_oversized_line(self):
+        async def run():
+            server = SpellcheckServer(self.spellchecker, max_delay=0,
+                max_line_bytes=100)
+            listener = await server.start(port=0)
+            port = listener.sockets[0].getsockname()[1]
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+            long_request = {'id': 1, 'text': 'word ' * 200}
+            for request in [long_request, {'id': 2, 'text': 'a B'}]:
+                writer.write(json.dumps(request).encode('utf-8') + b'\n')
+            await writer.drain()
+            responses = [json.loads((await reader.readline()).decode('utf-8'))
+                for _ in range(2)]
+            writer.close()
+            listener.close()
+            await listener.wait_closed()
+            await server.close()
+            return responses
+        responses = asyncio.run(run())
+        self.assertIn('longer than 100 bytes', responses[0]['error'])
+        self.assertIsNone(responses[0]['id'])
+        self.assertEqual(responses[1]['id'], 2)
+        self.assertEqual(len(responses[1]['corrections']), 1)
+
+    def test_reset_while_reading(self):
+        async def run():
+            errors = []
+            loop = asyncio.get_running_loop()
+            loop.set_exception_handler(lambda loop, context:
+                errors.append(context))
+            server = SpellcheckServer(self.spellchecker, max_delay=0)
+            listener = await server.start(port=0)
+            port = listener.sockets[0].getsockname()[1]
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+            sock = writer.get_extra_info('socket')
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER,
+                struct.pack('ii', 1, 0))
+            writer.write(b'{"id": 1, "text": "a b"}\n{"id": 2, "te')
+            await writer.drain()
+            await asyncio.sleep(0.05)
+            writer.transport.abort()
+            await asyncio.sleep(0.1)
+            listener.close()
+            await listener.wait_closed()
+            await server.close()
+            return errors, server.stats()
+        errors, stats = asyncio.run(run())
+        self.assertEqual(errors, [])
+        self.assertEqual(stats['requests'], 1)
+
+    def test_disconnected_client(self):
+        class DisconnectedWriter:
+            closed = False
+            def write(self, data):
+                pass
+            async def drain(self):
+                raise ConnectionResetError()
+            def close(self):
+                self.closed = True
+        writer = DisconnectedWriter()
+        server = SpellcheckServer(self.spellchecker)
+        asyncio.run(server.respond(b'{"id": 1, "stats": true}', writer))
+        server.executor.shutdown()
+        self.assertTrue(writer.closed)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,43 @@
+import os
+import pickle
+import tempfile
+import unittest
+from spellcheck.suggestion_cache import SuggestionCache
+
+class TestSuggestionCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, 'suggestions.db')
+        self.cache = SuggestionCache(self.path)
+
+    def tearDown(self):
+        self.cache.close()
+        self.tmp_dir.cleanup()
+
+    def test_get_many(self):
+        self.cache.put_many('en_US', {'beeich': ['beach', 'beech'],
+            'butiful': []})
+        self.assertEqual(self.cache.get_many('en_US', ['beeich', 'butiful',
+            'teh']), {'beeich': ['beach', 'beech'], 'butiful': []})
+        self.assertEqual(self.cache.get_many('en_GB', ['beeich']), {})
+        self.assertEqual(self.cache.stats(), {'size': 2, 'hits': 2,
+            'misses': 2})
+
+    def test_persistence(self):
+        self.cache.put_many('en_GB', {'colr': ['colour']})
+        self.cache.close()
+        self.cache = SuggestionCache(self.path)
+        self.assertEqual(self.cache.get_many('en_GB', ['colr']),
+            {'colr': ['colour']})
+        unpickled = pickle.loads(pickle.dumps(self.cache))
+        self.assertEqual(len(unpickled), 1)
+        unpickled.close()
+
+    def test_many_words(self):
+        words = dict(('w%d' % i, ['x']) for i in range(1200))
+        self.cache.put_many('en_US', words)
+        self.assertEqual(self.cache.get_many('en_US', words), words)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,43 @@
+import unittest
+from collections import defaultdict
+from spellcheck.edit_error_model import EditErrorModel
+from spellcheck.symspell import SymmetricDeleteIndex, align_edits
+
+class TestSymmetricDeleteIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.index = SymmetricDeleteIndex(
+            ['like', 'lick', 'python', 'pythons', 'bike'], max_edits=2)
+
+    def test_lookup(self):
+        self.assertTrue({'like', 'lick'} <= self.index.lookup('lik', 1))
+        self.assertNotIn('python', self.index.lookup('lik', 1))
+        self.assertIn('python', self.index.lookup('pyhton', 2))
+        self.assertIn('pythons', self.index.lookup('pythonz', 2))
+
+    def test_lookup_beyond_max_edits(self):
+        with self.assertRaises(ValueError):
+            self.index.lookup('lik', 3)
+
+
+class TestAlignEdits(unittest.TestCase):
+
+    def setUp(self):
+        edit_pdist = defaultdict(int, {'k|ke': 0.2, 'e|i': 0.3, 'ht|th': 0.1,
+            'i|e': 0.05})
+        self.error_model = EditErrorModel(edit_pdist)
+        self.alphabet = 'abcdefghijklmnopqrstuvwxyz'
+
+    def align(self, word, correction, max_edits=1):
+        return align_edits(word, correction, max_edits, self.error_model,
+            self.alphabet)
+
+    def test_align_edits(self):
+        self.assertEqual(self.align('lik', 'like'), 'k|ke')
+        self.assertEqual(self.align('pyhton', 'python'), 'ht|th')
+        self.assertEqual(self.align('like', 'like'), '')
+        self.assertEqual(self.align('lik', 'lake', 2), 'i|a+k|ke')
+        self.assertIsNone(self.align('lik', 'lake', 1))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,39 @@
+import unittest
+from nltk import sent_tokenize
+from spellcheck.parse_util import word_tokenize
+from spellcheck.tokenizer import (TokenSpan, span_words, split_sentences,
+    token_spans, words)
+
+class TestTokenizer(unittest.TestCase):
+
+    def setUp(self):
+        self.texts = ['I like cats.  My favorite color is orange.',
+            'A beeich, a beach!  Butiful? . ..', '  ', '',
+            'Tabs\tand\nnewlines.\n']
+
+    def test_token_spans(self):
+        text = 'I lik cats.  Ok!'
+        self.assertEqual(token_spans(text), [TokenSpan(0, 1, 0),
+            TokenSpan(2, 5, 1), TokenSpan(6, 10, 2), TokenSpan(13, 15, 3)])
+
+    def test_matches_word_tokenize(self):
+        for text in self.texts:
+            expected = [w for sent in sent_tokenize(text)
+                for w in word_tokenize(sent)]
+            self.assertEqual(words(text), expected)
+            spans = token_spans(text)
+            self.assertEqual(span_words(text, spans), expected)
+            self.assertEqual([span.index for span in spans],
+                list(range(len(expected))))
+
+    def test_split_sentences(self):
+        for text in self.texts:
+            sentences = sent_tokenize(text)
+            self.assertEqual(split_sentences(words(text), sentences),
+                [word_tokenize(sent) for sent in sentences])
+            self.assertEqual([span_words(text, spans) for spans in
+                split_sentences(token_spans(text), sentences)],
+                [word_tokenize(sent) for sent in sentences])
+
+if __name__ == '__main__':
+    unittest.main()
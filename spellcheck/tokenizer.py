@@ -0,0 +1,80 @@
+"""
+The tokenization every spellchecker shares.
+
+A token is a run of non-whitespace characters with one trailing character
+from TRAILING_PUNCTUATION stripped, unless the token is that character
+alone.  A token's index is its position among all the tokens of the text,
+which is the index SpellingCorrection refers to.  Sentence tokenizers only
+ever break sentences between tokens, so tokenizing the whole text at once
+gives the same tokens and indices as tokenizing each sentence.
+"""
+from collections import namedtuple
+import re
+
+# Characters stripped from the end of a token.
+TRAILING_PUNCTUATION = '.?!,'
+
+TOKEN_RE = re.compile(r'\S+')
+
+# The characters text[start:end] of the token at position index.  end
+# excludes stripped trailing punctuation.
+TokenSpan = namedtuple('TokenSpan', ['start', 'end', 'index'])
+
+
+def words(text):
+    """
+    Return the tokens of text.  Faster than token_spans() when offsets are
+    not needed.
+    """
+    return [word[:-1] if len(word) > 1 and word[-1] in TRAILING_PUNCTUATION
+        else word for word in text.split()]
+
+
+def token_spans(text, token_re=TOKEN_RE):
+    """
+    Find the tokens of text in one pass over it.
+
+    Params:
+        text: [string] The text.
+        token_re: [compiled regex] Pattern matching tokens before trailing
+            punctuation is stripped.
+
+    Returns:
+        [list of TokenSpans] The spans of the tokens in order.
+    """
+    spans = []
+    for index, match in enumerate(token_re.finditer(text)):
+        start, end = match.span()
+        if end - start > 1 and text[end - 1] in TRAILING_PUNCTUATION:
+            end -= 1
+        spans.append(TokenSpan(start, end, index))
+    return spans
+
+
+def span_words(text, spans):
+    """Return the tokens of text the spans refer to."""
+    return [text[start:end] for start, end, _ in spans]
+
+
+def split_sentences(tokens, sentences):
+    """
+    Group the tokens of a text into its sentences.
+
+    Params:
+        tokens: [list] The words or TokenSpans of the whole text.
+        sentences: [list of strings] The sentences of the text in order, as
+            returned by a sentence tokenizer.
+
+    Returns:
+        [list of lists] The tokens of each sentence.  Every token is in
+            exactly one sentence, so the tokens of all sentences are tokens.
+    """
+    grouped = []
+    start = 0
+    for sentence in sentences:
+        end = start + len(sentence.split())
+        grouped.append(tokens[start:end])
+        start = end
+    if grouped and start < len(tokens):
+        grouped[-1] = grouped[-1] + tokens[start:]
+    return grouped